@@ -0,0 +1,22 @@
+"""Debug router: download sampling profiles captured with X-Debug: profile."""
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import FileResponse
+from ..config import config
+from ..services.profiling import get_profile_path
+from ..middleware.auth import verify_api_key, verify_debug_token
+
+router = APIRouter(dependencies=[Depends(verify_api_key), Depends(verify_debug_token)])
+
+
+@router.get("/profiles/{profile_id}")
+async def download_profile(profile_id: str) -> FileResponse:
+    """
+    Download a saved profile in folded-stack format.
+
+    Open it with speedscope or render it with flamegraph.pl.
+    """
+    path = get_profile_path(profile_id, config.profile_dir)
+    if path is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    return FileResponse(path, media_type="text/plain", filename=f"{profile_id}.folded")
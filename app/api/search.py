@@ -1,28 +1,169 @@
 """Search API router."""
 
-from fastapi import APIRouter, Depends
-from ..models.schemas import SearchRequest, SearchResponse, SearchResult
-from ..services.search import search_hybrid
-from ..middleware.auth import verify_api_key
+import time
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from ..models.schemas import SearchRequest, SearchResponseModel
+from ..config import config
+from ..services.counters import counter_aggregator
+from ..services.pagination import InvalidCursor, asearch_page
+from ..services.profiling import SamplingProfiler, collect_timings, save_profile, server_timing, timed
+from ..services.query_log import query_logger
+from ..services.search import asearch_hybrid
+from ..services.serialization import FastJSONResponse, dumps, result_payload, search_payload
+from ..middleware.auth import debug_mode, verify_api_key
 
 router = APIRouter(dependencies=[Depends(verify_api_key)])
 
+STREAM_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream"
+}
+
+
+def _search_kwargs(request: SearchRequest) -> Dict[str, Any]:
+    """Map a SearchRequest onto search_hybrid arguments."""
+    return {
+        "query": request.query,
+        "top_k": request.top_k,
+        "threshold": request.threshold,
+        "fields": request.fields,
+        "snippet_chars": request.snippet_chars if request.snippet else 0
+    }
+
+
+async def _run_search(request: SearchRequest) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Run a plain or cursor-paginated search; returns (results, next_cursor)."""
+    kwargs = _search_kwargs(request)
+    start = time.perf_counter()
+
+    if not (request.paginate or request.cursor):
+        results, next_cursor = await asearch_hybrid(**kwargs), None
+    else:
+        try:
+            results, next_cursor = await asearch_page(cursor=request.cursor, **kwargs)
+        except InvalidCursor as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if config.query_log_enabled:
+        query_logger.record(
+            query=request.query,
+            results_count=len(results),
+            response_time_ms=round((time.perf_counter() - start) * 1000)
+        )
+    if config.counters_enabled:
+        counter_aggregator.record_views(r.get("document_id") for r in results)
+    return results, next_cursor
+
+
+async def _debug_search(request: SearchRequest, mode: str) -> FastJSONResponse:
+    """
+    Run a search with a per-stage timing breakdown (and a profile).
+
+    The breakdown is returned as a Server-Timing header and under
+    `debug` in the body; `serialize` covers building the response.
+    """
+    profiler = None
+    if mode == "profile":
+        # All threads: the Supabase RPC runs in the threadpool, not on the loop
+        profiler = SamplingProfiler(config.profile_interval_ms / 1000, all_threads=True)
+        profiler.start()
+
+    with collect_timings() as timings:
+        start = time.perf_counter()
+        try:
+            results, next_cursor = await _run_search(request)
+            with timed("serialize"):
+                content = search_payload(request.query, results, next_cursor, projected=request.fields is not None)
+        finally:
+            if profiler is not None:
+                profiler.stop()
+        timings["total"] = time.perf_counter() - start
+
+    content["debug"] = {"timings_ms": {stage: round(s * 1000, 3) for stage, s in timings.items()}}
+    if profiler is not None:
+        # File write and pruning stay off the event loop
+        profile_id = await run_in_threadpool(save_profile, profiler.folded(), config.profile_dir, config.profile_keep)
+        content["debug"]["profile_id"] = profile_id
+        content["debug"]["profile_url"] = f"/api/debug/profiles/{profile_id}"
+
+    return FastJSONResponse(content, headers={"Server-Timing": server_timing(timings)})
+
 
-@router.post("/search", response_model=SearchResponse)
-async def hybrid_search(request: SearchRequest):
+@router.post("/search", response_model=SearchResponseModel)
+async def hybrid_search(request: SearchRequest, debug: Optional[str] = Depends(debug_mode)):
     """
     Hybrid search (semantic + keyword with RRF fusion).
 
-    Combines vector similarity and BM25 keyword matching.
+    Combines vector similarity and BM25 keyword matching. `fields`
+    projects results down to the requested keys (plus chunk_id and
+    document_id; the response is then a ProjectedSearchResponse, whose
+    other result fields are all optional); `snippet` adds a
+    query-centred excerpt with highlight offsets. `paginate` returns a
+    `next_cursor`; pass it back as `cursor` to read the following page.
+    `X-Debug: timing|profile` (with X-Debug-Token) adds a per-stage
+    timing breakdown.
     """
-    results = search_hybrid(
-        query=request.query,
-        top_k=request.top_k,
-        threshold=request.threshold
-    )
+    if debug is not None:
+        return await _debug_search(request, debug)
+
+    results, next_cursor = await _run_search(request)
+
+    # Results are already SearchResult-shaped (format_results); encode them
+    # directly rather than validating through response_model, which is kept
+    # for the OpenAPI schema
+    return FastJSONResponse(search_payload(request.query, results, next_cursor, projected=request.fields is not None))
+
+
+def _frame(fmt: str, event: str, payload: str) -> str:
+    """Encode one stream frame as an NDJSON line or an SSE event."""
+    if fmt == "sse":
+        return f"event: {event}\ndata: {payload}\n\n"
+    return f'{{"type":"{event}","data":{payload}}}\n'
+
+
+async def _stream_frames(
+    fmt: str,
+    request: SearchRequest,
+    results: List[Dict[str, Any]],
+    next_cursor: Optional[str]
+) -> AsyncIterator[str]:
+    """
+    Yield one frame per ranked result, then a summary frame.
+
+    Async so StreamingResponse iterates it on the event loop; a plain
+    generator is stepped through the threadpool once per frame.
+    """
+    for r in results:
+        payload = dumps(result_payload(r, projected=request.fields is not None)).decode()
+        yield _frame(fmt, "result", payload)
+
+    summary = {"query": request.query, "count": len(results)}
+    if next_cursor:
+        summary["next_cursor"] = next_cursor
+    yield _frame(fmt, "summary", dumps(summary).decode())
+
+
+@router.post("/search/stream")
+async def hybrid_search_stream(
+    request: SearchRequest,
+    format: str = Query("ndjson", pattern="^(ndjson|sse)$")
+) -> StreamingResponse:
+    """
+    Hybrid search streamed as NDJSON lines or Server-Sent Events.
+
+    Each result is encoded and flushed in rank order so clients can
+    render the top hit before the rest is serialized. The last frame is
+    a summary with the query and result count.
+    """
+    results, next_cursor = await _run_search(request)
 
-    return SearchResponse(
-        query=request.query,
-        results=[SearchResult(**r) for r in results],
-        count=len(results)
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    return StreamingResponse(
+        _stream_frames(format, request, results, next_cursor),
+        media_type=STREAM_MEDIA_TYPES[format],
+        headers=headers
     )
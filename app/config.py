@@ -2,7 +2,7 @@
 
 import os
 from functools import lru_cache
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -19,7 +19,7 @@ class Settings(BaseSettings):
     # Server
     host: str = "0.0.0.0"
     port: int = 8000
-    workers: int = 4
+    workers: int = 4  # Pre-forked by `python -m app.server`
     log_level: str = "info"
 
     # Gemini API
@@ -29,6 +29,13 @@ class Settings(BaseSettings):
     supabase_url: Optional[str] = None
     supabase_service_role_key: Optional[str] = None
 
+    # Storage backend: supabase (PostgREST) | postgres (direct, pooled)
+    storage_backend: str = "supabase"
+    database_url: Optional[str] = None  # Session-mode DSN; prepared statements
+    db_pool_min_size: int = 1
+    db_pool_max_size: int = 10
+    warm_storage: bool = True  # Connect in the background at startup
+
     # Observability
     langfuse_public_key: Optional[str] = None
     langfuse_secret_key: Optional[str] = None
@@ -38,17 +45,69 @@ class Settings(BaseSettings):
     frappe_api_url: Optional[str] = None
     frappe_api_key: Optional[str] = None
     frappe_api_secret: Optional[str] = None
+    frappe_timeout: float = 5.0
+    frappe_session_ttl: int = 300  # Seconds a validated sid is trusted
+    frappe_session_negative_ttl: int = 30  # Seconds an invalid sid is remembered
+    frappe_session_cache_size: int = 10000
 
     # Authentication
     api_key: str = "default-api-key-change-me"
 
+    # Per-request debug mode (X-Debug: timing|profile + X-Debug-Token)
+    debug_token: Optional[str] = None  # Unset = debug mode disabled
+    profile_dir: str = "/tmp/kb-profiles"
+    profile_interval_ms: float = 5.0  # Sampling interval
+    profile_keep: int = 50  # Saved profiles kept on disk
+
     # Search settings
     default_top_k: int = 5
     similarity_threshold: float = 0.5
     rrf_k_constant: int = 60
+    embedding_quantization: Literal["none", "halfvec", "binary"] = "none"  # Migration 009
+    rescore_multiplier: int = 4  # Coarse candidates per semantic slot
+
+    # Semantic query cache
+    semantic_cache_enabled: bool = True
+    semantic_cache_threshold: float = 0.95  # Min cosine similarity to reuse results
+    semantic_cache_size: int = 512
+    semantic_cache_ttl: int = 300  # Seconds
+    search_generation_poll_interval: float = 5.0  # Seconds between kb_search_generation reads (migration 012)
+    embedding_cache_size: int = 2048  # Query text -> embedding
+    embedding_cache_ttl: int = 3600  # Seconds
+
+    # Cross-worker cache file (embeddings, vision results); put it on /dev/shm.
+    # Unset = per-process caches. `python -m app.server` sets it for workers > 1.
+    shared_cache_path: Optional[str] = None
+    # Budget for cached values in that file, all caches together. Keep it
+    # well below the /dev/shm size (Docker's default is 64 MB)
+    shared_cache_max_bytes: int = 32 * 1024 * 1024
+
+    # Startup cache warm-up from kb_query_log (migration 011)
+    warmup_enabled: bool = True
+    warmup_queries: int = 100  # Most frequent queries to pre-compute
+    warmup_days: int = 7  # Look-back window
+    warmup_concurrency: int = 4
+    warmup_timeout: float = 30.0  # Seconds before /health reports ready anyway
+
+    # Cursor pagination
+    pagination_depth: int = 200  # Fused candidates materialized per search
+    cursor_cache_size: int = 256
+    cursor_ttl: int = 600  # Seconds
+
+    # Query logging (write-behind to kb_query_log)
+    query_log_enabled: bool = True
+    query_log_capacity: int = 10000  # Buffered rows before dropping
+    query_log_batch_size: int = 200
+    query_log_flush_interval: float = 5.0  # Seconds
+
+    # Document view counters (write-behind via kb_apply_counter_deltas)
+    counters_enabled: bool = True
+    counters_flush_interval: float = 10.0  # Seconds
 
     # Vision settings
     quality_threshold: float = 0.5
+    vision_cache_size: int = 4096  # Results by image hash
+    vision_cache_ttl: int = 86400  # Seconds
 
     model_config = SettingsConfigDict(
         env_file=".env",
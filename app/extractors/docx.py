@@ -1,30 +1,50 @@
 """DOCX text and image extraction with vision processing."""
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from docx import Document
+from docx.enum.shape import WD_INLINE_SHAPE
+from lxml import etree
+from . import ooxml
+from ..services.metrics import timed_extractor
 
 
-def extract_docx(filepath: str, process_images: bool = True) -> Dict[str, Any]:
+def _inline_image_bytes(doc, inline_shape) -> bytes:
+    """Image bytes behind an inline picture (its blip relationship)."""
+    rid = inline_shape._inline.graphic.graphicData.pic.blipFill.blip.embed
+    return doc.part.related_parts[rid].blob
+
+
+@timed_extractor("docx")
+def extract_docx(filepath: str, process_images: bool = True, fast: bool = False) -> Dict[str, Any]:
     """
     Extract content from Word document.
 
     Args:
         filepath: Path to .docx file
         process_images: If True, process images with vision
+        fast: If True, stream word/document.xml from the zip instead of
+            loading the python-docx object model (same output)
 
     Returns:
         Dict with content, images, metadata
     """
     if process_images:
         from ..services.vision import process_image
+    else:
+        process_image = None
+
+    if fast:
+        return _extract_docx_streaming(filepath, process_image)
 
     doc = Document(filepath)
 
-    # Extract text from paragraphs
+    # Extract text from paragraphs (doc.paragraphs builds a new list per access)
+    all_paragraphs = doc.paragraphs
     paragraphs = []
-    for para in doc.paragraphs:
-        if para.text.strip():
-            paragraphs.append(para.text)
+    for para in all_paragraphs:
+        text = para.text
+        if text.strip():
+            paragraphs.append(text)
 
     content = "\n\n".join(paragraphs)
 
@@ -34,8 +54,8 @@ def extract_docx(filepath: str, process_images: bool = True) -> Dict[str, Any]:
     if process_images and hasattr(doc, 'inline_shapes'):
         for img_index, inline_shape in enumerate(doc.inline_shapes):
             try:
-                if inline_shape.type == 3:  # PICTURE type
-                    image_bytes = inline_shape.image.blob
+                if inline_shape.type == WD_INLINE_SHAPE.PICTURE:
+                    image_bytes = _inline_image_bytes(doc, inline_shape)
                     vision_result = process_image(image_bytes)
 
                     images.append({
@@ -52,7 +72,87 @@ def extract_docx(filepath: str, process_images: bool = True) -> Dict[str, Any]:
         "content": content,
         "images": images,
         "metadata": {
-            "total_paragraphs": len(doc.paragraphs),
+            "total_paragraphs": len(all_paragraphs),
+            "images_processed": len(images)
+        }
+    }
+
+
+def _inline_picture_rid(inline) -> Optional[str]:
+    """rId of an embedded picture in <wp:inline> (None for charts, SmartArt, links)."""
+    graphic_data = inline.find("a:graphic/a:graphicData", ooxml.NS)
+    if graphic_data is None or graphic_data.get("uri") != ooxml.NS["pic"]:
+        return None
+    return ooxml.picture_rid(graphic_data.find("pic:pic/pic:blipFill", ooxml.NS))
+
+
+def _is_run_inline(inline) -> bool:
+    """Matches python-docx's inline_shapes (//w:p/w:r/w:drawing/wp:inline)."""
+    drawing = inline.getparent()
+    run = drawing.getparent() if drawing is not None else None
+    paragraph = run.getparent() if run is not None else None
+    return (
+        drawing is not None and drawing.tag == ooxml.qn("w:drawing")
+        and run is not None and run.tag == ooxml.qn("w:r")
+        and paragraph is not None and paragraph.tag == ooxml.qn("w:p")
+    )
+
+
+def _extract_docx_streaming(filepath: str, process_image) -> Dict[str, Any]:
+    """extract_docx over the raw document part (images read only if processed)."""
+    paragraphs = []
+    images = []
+    total_paragraphs = 0
+    img_index = 0
+    body_tag = ooxml.qn("w:body")
+    inline_tag = ooxml.qn("wp:inline")
+
+    with ooxml.open_package(filepath) as package:
+        document, rels = ooxml.main_part(package)
+
+        with package.open(document) as stream:
+            events = etree.iterparse(stream, events=("end",), tag=[ooxml.qn("w:p"), ooxml.qn("w:tbl"), ooxml.qn("w:sdt"), inline_tag], huge_tree=True)
+            for _, elem in events:
+                if elem.tag == inline_tag:
+                    if not _is_run_inline(elem):
+                        continue
+                    index, img_index = img_index, img_index + 1
+                    rid = _inline_picture_rid(elem) if process_image else None
+                    if rid is None:
+                        continue
+                    try:
+                        vision_result = process_image(package.read(rels[rid].target))
+
+                        images.append({
+                            "image_index": index,
+                            "type": vision_result["type"],
+                            "quality_score": vision_result["quality_score"],
+                            "extracted_text": vision_result["extracted_text"],
+                            "should_index": vision_result["should_index"]
+                        })
+                    except Exception as e:
+                        print(f"Warning: Failed to process inline shape {index}: {e}")
+                    continue
+
+                # Only body-level blocks are complete; nested ones are
+                # handled (and cleared) with their table or content control
+                parent = elem.getparent()
+                if parent is None or parent.tag != body_tag:
+                    continue
+                if elem.tag == ooxml.qn("w:p"):
+                    total_paragraphs += 1
+                    text = ooxml.wordml_text(elem)
+                    if text.strip():
+                        paragraphs.append(text)
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del parent[0]
+
+    return {
+        "content": "\n\n".join(paragraphs),
+        "images": images,
+        "metadata": {
+            "total_paragraphs": total_paragraphs,
             "images_processed": len(images)
         }
     }
@@ -0,0 +1,166 @@
+"""Streaming readers for OOXML packages (PPTX/DOCX parts straight from the zip).
+
+Used by the fast extraction mode: XML parts are parsed incrementally with
+lxml's iterparse and each top-level shape/paragraph is cleared once read,
+so memory stays bounded by the largest single shape rather than the
+document. Images are only listed by relationship id; their bytes are read
+from the zip when (and if) the caller asks for them.
+"""
+
+import posixpath
+import zipfile
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from lxml import etree
+
+NS = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main",
+    "wp": "http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing",
+    "pic": "http://schemas.openxmlformats.org/drawingml/2006/picture",
+    "rel": "http://schemas.openxmlformats.org/package/2006/relationships"
+}
+
+R_EMBED = f"{{{NS['r']}}}embed"
+R_LINK = f"{{{NS['r']}}}link"
+R_ID = f"{{{NS['r']}}}id"
+
+
+def qn(tag: str) -> str:
+    """Clark name for a prefixed tag, e.g. qn("p:sp")."""
+    prefix, local = tag.split(":")
+    return f"{{{NS[prefix]}}}{local}"
+
+
+class Relationship:
+    """One package relationship (target resolved to a part name)."""
+
+    __slots__ = ("type", "target")
+
+    def __init__(self, rel_type: str, target: str):
+        self.type = rel_type
+        self.target = target
+
+    @property
+    def kind(self) -> str:
+        """Last segment of the relationship type, e.g. "notesSlide" or "image"."""
+        return self.type.rsplit("/", 1)[-1]
+
+
+def rels_path(part: str) -> str:
+    """Name of the .rels part for a part, e.g. ppt/slides/_rels/slide1.xml.rels."""
+    directory, name = posixpath.split(part)
+    return posixpath.join(directory, "_rels", f"{name}.rels")
+
+
+def read_rels(package: zipfile.ZipFile, part: str) -> Dict[str, Relationship]:
+    """Internal relationships of a part by rId (empty if it has none)."""
+    try:
+        data = package.read(rels_path(part))
+    except KeyError:
+        return {}
+
+    rels = {}
+    base = posixpath.dirname(part)
+    for rel in etree.fromstring(data).iterfind("rel:Relationship", NS):
+        if rel.get("TargetMode") == "External":
+            continue
+        target = rel.get("Target")
+        if target.startswith("/"):
+            target = target.lstrip("/")
+        else:
+            target = posixpath.normpath(posixpath.join(base, target))
+        rels[rel.get("Id")] = Relationship(rel.get("Type"), target)
+    return rels
+
+
+def iter_top_level(package: zipfile.ZipFile, part: str, container: str, tags: Iterable[str]) -> Iterator[etree._Element]:
+    """
+    Yield the direct children of `container` with one of `tags`, streaming.
+
+    Each yielded element is complete (all descendants parsed). It is
+    cleared, with any earlier siblings, as soon as the caller moves on,
+    so do not keep references to it.
+    """
+    container = qn(container)
+    with package.open(part) as stream:
+        for _, elem in etree.iterparse(stream, events=("end",), tag=[qn(t) for t in tags], huge_tree=True):
+            parent = elem.getparent()
+            if parent is None or parent.tag != container:
+                continue
+            yield elem
+            elem.clear()
+            while elem.getprevious() is not None:
+                del parent[0]
+
+
+def drawingml_text(paragraphs: Iterable[etree._Element]) -> str:
+    """Text of DrawingML <a:p> paragraphs, as python-pptx's TextFrame.text."""
+    lines = []
+    for para in paragraphs:
+        parts = []
+        for child in para:
+            if child.tag == qn("a:r") or child.tag == qn("a:fld"):
+                parts.append(child.findtext("a:t", default="", namespaces=NS))
+            elif child.tag == qn("a:br"):
+                parts.append("\v")
+        lines.append("".join(parts))
+    return "\n".join(lines)
+
+
+_RUN_TEXT = {
+    qn("w:tab"): "\t",
+    qn("w:ptab"): "\t",
+    qn("w:cr"): "\n",
+    qn("w:noBreakHyphen"): "-"
+}
+
+
+def _run_text(run: etree._Element) -> str:
+    parts = []
+    for child in run:
+        if child.tag == qn("w:t"):
+            parts.append(child.text or "")
+        elif child.tag == qn("w:br"):
+            # Page and column breaks carry no text
+            if child.get(qn("w:type"), "textWrapping") == "textWrapping":
+                parts.append("\n")
+        else:
+            parts.append(_RUN_TEXT.get(child.tag, ""))
+    return "".join(parts)
+
+
+def wordml_text(paragraph: etree._Element) -> str:
+    """Text of a WordprocessingML <w:p>, as python-docx's Paragraph.text."""
+    parts = []
+    for child in paragraph:
+        if child.tag == qn("w:r"):
+            parts.append(_run_text(child))
+        elif child.tag == qn("w:hyperlink"):
+            parts.extend(_run_text(run) for run in child.iterfind("w:r", NS))
+    return "".join(parts)
+
+
+def picture_rid(blip_fill: Optional[etree._Element]) -> Optional[str]:
+    """rId of an embedded (not linked) picture from its blipFill, else None."""
+    if blip_fill is None:
+        return None
+    blip = blip_fill.find("a:blip", NS)
+    if blip is None or blip.get(R_LINK) is not None:
+        return None
+    return blip.get(R_EMBED)
+
+
+def open_package(filepath: str) -> zipfile.ZipFile:
+    """Open an OOXML file as a zip (raises zipfile.BadZipFile if it is not one)."""
+    return zipfile.ZipFile(filepath)
+
+
+def main_part(package: zipfile.ZipFile, rel_kind: str = "officeDocument") -> Tuple[str, Dict[str, Relationship]]:
+    """Main document part of the package and its relationships."""
+    for rel in read_rels(package, "").values():
+        if rel.kind == rel_kind:
+            return rel.target, read_rels(package, rel.target)
+    raise ValueError(f"No {rel_kind} part in package")
@@ -2,8 +2,10 @@
 
 from typing import Dict, Any
 from pypdf import PdfReader
+from ..services.metrics import timed_extractor
 
 
+@timed_extractor("pdf")
 def extract_pdf(filepath: str, process_images: bool = True) -> Dict[str, Any]:
     """
     Extract content from PDF file.
@@ -1,17 +1,25 @@
 """PowerPoint (PPTX) extraction with vision processing."""
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from pptx import Presentation
 from pptx.enum.shapes import MSO_SHAPE_TYPE
+from . import ooxml
+from ..services.metrics import timed_extractor
 
+# <p:pic> media elements that python-pptx reports as MEDIA, not PICTURE
+_MEDIA_TAGS = {ooxml.qn("a:videoFile"), ooxml.qn("a:audioFile"), ooxml.qn("a:quickTimeFile")}
 
-def extract_pptx(filepath: str, process_images: bool = True) -> Dict[str, Any]:
+
+@timed_extractor("pptx")
+def extract_pptx(filepath: str, process_images: bool = True, fast: bool = False) -> Dict[str, Any]:
     """
     Extract content from PowerPoint file.
 
     Args:
         filepath: Path to .pptx file
         process_images: If True, process images with vision (default: True)
+        fast: If True, stream the slide XML from the zip instead of
+            loading the python-pptx object model (same output)
 
     Returns:
         Dict with slides, speaker_notes, images, metadata
@@ -19,6 +27,11 @@ def extract_pptx(filepath: str, process_images: bool = True) -> Dict[str, Any]:
     # Import vision module conditionally
     if process_images:
         from ..services.vision import process_image
+    else:
+        process_image = None
+
+    if fast:
+        return _extract_pptx_streaming(filepath, process_image)
 
     prs = Presentation(filepath)
 
@@ -74,3 +87,86 @@ def extract_pptx(filepath: str, process_images: bool = True) -> Dict[str, Any]:
             "images_processed": len(images)
         }
     }
+
+
+def _picture_rid(pic) -> Optional[str]:
+    """rId of a plain picture shape (not a placeholder or media clip)."""
+    nv_pr = pic.find("p:nvPicPr/p:nvPr", ooxml.NS)
+    if nv_pr is not None and any(child.tag == ooxml.qn("p:ph") or child.tag in _MEDIA_TAGS for child in nv_pr):
+        return None
+    return ooxml.picture_rid(pic.find("p:blipFill", ooxml.NS))
+
+
+def _notes_text(package, part: str) -> str:
+    """Text of the body placeholder of a notes slide."""
+    for shape in ooxml.iter_top_level(package, part, "p:spTree", ["p:sp"]):
+        placeholder = shape.find("p:nvSpPr/p:nvPr/p:ph", ooxml.NS)
+        if placeholder is not None and placeholder.get("type") == "body":
+            return ooxml.drawingml_text(shape.iterfind("p:txBody/a:p", ooxml.NS))
+    return ""
+
+
+def _extract_pptx_streaming(filepath: str, process_image) -> Dict[str, Any]:
+    """extract_pptx over the raw slide/notes parts (images read only if processed)."""
+    slides = []
+    speaker_notes = []
+    images = []
+
+    with ooxml.open_package(filepath) as package:
+        presentation, presentation_rels = ooxml.main_part(package)
+        slide_ids = ooxml.iter_top_level(package, presentation, "p:sldIdLst", ["p:sldId"])
+        slide_parts = [presentation_rels[sld_id.get(ooxml.R_ID)].target for sld_id in slide_ids]
+
+        for slide_num, part in enumerate(slide_parts, 1):
+            rels = ooxml.read_rels(package, part)
+            slide_content = []
+
+            for shape in ooxml.iter_top_level(package, part, "p:spTree", ["p:sp", "p:pic", "p:grpSp", "p:graphicFrame", "p:cxnSp"]):
+                # Extract text
+                if shape.tag == ooxml.qn("p:sp"):
+                    text = ooxml.drawingml_text(shape.iterfind("p:txBody/a:p", ooxml.NS))
+                    if text.strip():
+                        slide_content.append(text)
+
+                # Process images
+                elif process_image and shape.tag == ooxml.qn("p:pic"):
+                    rid = _picture_rid(shape)
+                    if rid is None:
+                        continue
+                    try:
+                        vision_result = process_image(package.read(rels[rid].target))
+
+                        images.append({
+                            "slide_number": slide_num,
+                            "type": vision_result["type"],
+                            "quality_score": vision_result["quality_score"],
+                            "extracted_text": vision_result["extracted_text"],
+                            "should_index": vision_result["should_index"]
+                        })
+                    except Exception as e:
+                        print(f"Warning: Failed to process image on slide {slide_num}: {e}")
+
+            slides.append({
+                "slide_number": slide_num,
+                "content": "\n".join(slide_content)
+            })
+
+            # Speaker notes
+            notes = next((rel.target for rel in rels.values() if rel.kind == "notesSlide"), None)
+            if notes:
+                text = _notes_text(package, notes)
+                if text.strip():
+                    speaker_notes.append({
+                        "slide_number": slide_num,
+                        "notes": text
+                    })
+
+    return {
+        "slides": slides,
+        "speaker_notes": speaker_notes,
+        "images": images,
+        "metadata": {
+            "total_slides": len(slides),
+            "images_processed": len(images)
+        }
+    }
@@ -1,18 +1,36 @@
 """FastAPI application entry point."""
 
+import asyncio
+import time
 from contextlib import asynccontextmanager
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
-from fastapi import FastAPI
+from fastapi import APIRouter, FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from starlette.routing import BaseRoute
 
 from .config import config
+from .services.counters import counter_aggregator
+from .services.metrics import REQUEST_LATENCY, render_metrics
+from .services.query_log import query_logger
+from .services.search_generation import search_generation
+from .services.storage import get_storage_backend
+from .services.warmup import cache_warmer
 
 # Import routers
+from .api import debug as debug_router
 from .api import search as search_router
 
 
+async def warm_storage() -> None:
+    """Create the storage client / pool so the first search does not pay for it."""
+    try:
+        await get_storage_backend().awarm()
+    except Exception as e:
+        print(f"Warning: Storage warm-up failed: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
@@ -23,11 +41,45 @@ async def lifespan(app: FastAPI):
     # Initialize observability (OpenTelemetry, Langfuse)
     # TODO: Task 14
 
+    if config.query_log_enabled:
+        await query_logger.start()
+    if config.counters_enabled:
+        await counter_aggregator.start()
+    if config.semantic_cache_enabled:
+        await search_generation.start()
+
+    # Heavy SDKs are imported lazily; warm up in the background so
+    # /health is served immediately
+    warmup = asyncio.create_task(warm_storage()) if config.warm_storage else None
+
+    # Pre-compute popular queries; /health reports "warming" until done
+    cache_warmup = None
+    if config.warmup_enabled:
+        cache_warmup = asyncio.create_task(cache_warmer.warm(
+            limit=config.warmup_queries,
+            days=config.warmup_days,
+            concurrency=config.warmup_concurrency,
+            timeout=config.warmup_timeout
+        ))
+
     yield
 
     # Shutdown
     print(f"🛑 Shutting down {config.app_name}")
 
+    for task in (warmup, cache_warmup):
+        if task is not None and not task.done():
+            task.cancel()
+
+    # Drain buffered query log rows and counter deltas
+    await query_logger.stop()
+    await counter_aggregator.stop()
+    await search_generation.stop()
+
+    # Release database connection pools
+    if get_storage_backend.cache_info().currsize:
+        await get_storage_backend().aclose()
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -48,8 +100,47 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    """Observe request latency per route template (not raw path)."""
+    start = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        REQUEST_LATENCY.labels(
+            request.method,
+            route_template(request.scope.get("route")),
+            str(status_code)
+        ).observe(time.perf_counter() - start)
+
+
+# Full path templates of router routes by id(route). Depending on the
+# FastAPI version, scope["route"] is either a copy with the prefixed
+# path or the router's own route, whose path omits the prefix
+_route_templates: Dict[int, str] = {}
+
+
+def route_template(route: Optional[BaseRoute]) -> str:
+    """Metrics label for a matched route, e.g. "/api/search"."""
+    if route is None:
+        return "unmatched"
+    return _route_templates.get(id(route), getattr(route, "path", "unmatched"))
+
+
+def include_router(router: APIRouter, prefix: str, tags: List[str]) -> None:
+    """app.include_router, remembering each route's full template."""
+    app.include_router(router, prefix=prefix, tags=tags)
+    for route in router.routes:
+        _route_templates[id(route)] = prefix + route.path
+
+
 # Include routers
-app.include_router(search_router.router, prefix="/api", tags=["search"])
+include_router(search_router.router, prefix="/api", tags=["search"])
+include_router(debug_router.router, prefix="/api/debug", tags=["debug"])
 
 
 @app.get("/")
@@ -64,29 +155,43 @@ async def root() -> Dict[str, Any]:
 
 
 @app.get("/health")
-async def health() -> Dict[str, str]:
-    """Health check endpoint."""
+async def health():
+    """
+    Health check endpoint.
+
+    Returns 503 while the startup cache warm-up is running so new
+    replicas only take traffic once warm (or once warm-up times out).
+    """
     # TODO: Add database connectivity check
-    return {"status": "healthy"}
+    if cache_warmer.status == "idle":
+        return {"status": "healthy"}
+    if not cache_warmer.ready:
+        return JSONResponse({"status": "warming", "warmup": cache_warmer.report()}, status_code=503)
+    return {"status": "healthy", "warmup": cache_warmer.report()}
 
 
 @app.get("/metrics")
-async def metrics() -> JSONResponse:
+async def metrics() -> Response:
     """Prometheus metrics endpoint."""
-    # TODO: Task 14 - Add OpenTelemetry metrics
-    return JSONResponse(
-        content={"message": "Metrics endpoint - to be implemented"},
-        status_code=501
-    )
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
 
 
 if __name__ == "__main__":
-    import uvicorn
-
-    uvicorn.run(
-        "app.main:app",
-        host=config.host,
-        port=config.port,
-        reload=config.debug,
-        log_level=config.log_level
-    )
+    if config.debug:
+        import uvicorn
+
+        uvicorn.run(
+            "app.main:app",
+            host=config.host,
+            port=config.port,
+            reload=True,
+            log_level=config.log_level
+        )
+    else:
+        # The launcher must set up shared caches/metrics before the app
+        # is imported, which this module already did: start it fresh
+        import os
+        import sys
+
+        os.execv(sys.executable, [sys.executable, "-m", "app.server"])
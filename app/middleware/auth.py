@@ -1,8 +1,12 @@
 """Authentication middleware - API key + Frappe session support."""
 
+import hmac
+from typing import Optional
+
 from fastapi import Request, HTTPException, status
 from fastapi.security import APIKeyHeader
 from ..config import config
+from .sessions import session_validator
 
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
@@ -20,11 +24,9 @@ async def verify_api_key(request: Request):
     if api_key and api_key == config.api_key:
         return True
 
-    # Check Frappe session cookie
+    # Check Frappe session cookie (cached upstream validation)
     sid = request.cookies.get("sid")
-    if sid:
-        # TODO: Validate sid with Frappe API
-        # For now, accept any sid
+    if sid and await session_validator.validate(sid):
         return True
 
     # No valid auth found
@@ -32,3 +34,38 @@ async def verify_api_key(request: Request):
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Authentication required: Provide X-API-Key header or valid Frappe session"
     )
+
+
+DEBUG_MODES = ("timing", "profile")
+
+
+def verify_debug_token(request: Request) -> None:
+    """Require an X-Debug-Token matching DEBUG_TOKEN (debug off if unset)."""
+    token = request.headers.get("X-Debug-Token")
+    if not (config.debug_token and token and hmac.compare_digest(token, config.debug_token)):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Debug mode requires a valid X-Debug-Token"
+        )
+
+
+async def debug_mode(request: Request) -> Optional[str]:
+    """
+    Opt-in debug mode for a request.
+
+    Requested with the X-Debug header or ?debug= query flag and only
+    honoured together with a valid X-Debug-Token.
+
+    Returns:
+        "timing", "profile", or None when not requested
+    """
+    mode = request.headers.get("X-Debug") or request.query_params.get("debug")
+    if not mode:
+        return None
+    if mode not in DEBUG_MODES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown debug mode: {mode} (expected {' or '.join(DEBUG_MODES)})"
+        )
+    verify_debug_token(request)
+    return mode
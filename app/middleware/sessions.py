@@ -0,0 +1,116 @@
+"""Frappe session validation with caching and single-flight lookups."""
+
+import asyncio
+import hashlib
+import time
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, Optional
+
+from ..config import config
+from ..services.cache import TTLCache
+
+if TYPE_CHECKING:
+    import httpx
+
+SessionFetcher = Callable[[str], Awaitable[bool]]
+
+_http_client: Optional["httpx.AsyncClient"] = None
+
+
+async def fetch_frappe_session(sid: str) -> bool:
+    """
+    Ask Frappe whether a session id belongs to a logged-in user.
+
+    Args:
+        sid: Frappe session cookie
+
+    Returns:
+        True for a valid non-Guest session
+    """
+    global _http_client
+
+    if not config.frappe_api_url:
+        # No Frappe instance to check against: fail closed
+        return False
+
+    if _http_client is None:
+        import httpx
+
+        _http_client = httpx.AsyncClient(base_url=config.frappe_api_url, timeout=config.frappe_timeout)
+
+    response = await _http_client.get(
+        "/api/method/frappe.auth.get_logged_user",
+        cookies={"sid": sid}
+    )
+    if response.status_code != 200:
+        return False
+
+    user = response.json().get("message")
+    return bool(user) and user != "Guest"
+
+
+class SessionValidator:
+    """
+    Validates Frappe sids against an upstream check.
+
+    Valid sids are cached for `ttl` seconds and invalid ones for
+    `negative_ttl` (TTL+LRU, keyed by a hash of the sid). Concurrent
+    checks for the same sid share one upstream call. Upstream errors are
+    treated as invalid but not cached.
+    """
+
+    def __init__(
+        self,
+        fetch: SessionFetcher,
+        ttl: float,
+        negative_ttl: float,
+        maxsize: int,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.fetch = fetch
+        self.negative_ttl = negative_ttl
+        self.upstream_calls = 0
+        self._cache = TTLCache(maxsize, ttl, clock, name="frappe_session")
+        self._inflight: Dict[str, "asyncio.Task[bool]"] = {}
+
+    @property
+    def cache(self) -> TTLCache:
+        return self._cache
+
+    async def _check(self, key: str, sid: str) -> bool:
+        """One upstream check; caches the answer (errors count as invalid, uncached)."""
+        self.upstream_calls += 1
+        try:
+            valid = await self.fetch(sid)
+        except Exception as e:
+            print(f"Warning: Frappe session check failed: {e}")
+            return False
+
+        self._cache.set(key, valid, ttl=None if valid else self.negative_ttl)
+        return valid
+
+    async def validate(self, sid: str) -> bool:
+        """Return whether sid is a valid session, using the cache when possible."""
+        key = hashlib.sha256(sid.encode()).hexdigest()
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        # The check runs as its own task and every caller awaits it
+        # shielded, so a cancelled (disconnected) request does not cancel
+        # it for the others waiting on the same sid
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._check(key, sid))
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            self._inflight[key] = task
+        return await asyncio.shield(task)
+
+
+# Shared validator for the auth dependency
+session_validator = SessionValidator(
+    fetch=fetch_frappe_session,
+    ttl=config.frappe_session_ttl,
+    negative_ttl=config.frappe_session_negative_ttl,
+    maxsize=config.frappe_session_cache_size
+)
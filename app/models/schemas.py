@@ -1,7 +1,7 @@
 """Pydantic schemas for API requests and responses."""
 
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from typing import List, Optional, Union
+from pydantic import BaseModel, Field, field_validator
 
 
 # Search schemas
@@ -9,10 +9,32 @@ class SearchRequest(BaseModel):
     query: str = Field(..., min_length=1)
     top_k: int = Field(5, ge=1, le=20)
     threshold: float = Field(0.5, ge=0.0, le=1.0)
+    fields: Optional[List[str]] = None  # Result fields to return (chunk_id always included)
+    snippet: bool = False
+    snippet_chars: int = Field(200, ge=40, le=1000)
+    paginate: bool = False  # Return next_cursor for deep pagination
+    cursor: Optional[str] = None  # next_cursor from the previous page
+
+    @field_validator("fields")
+    @classmethod
+    def check_fields(cls, value: Optional[List[str]]) -> Optional[List[str]]:
+        if value is None:
+            return value
+        unknown = set(value) - set(SearchResult.model_fields)
+        if unknown:
+            raise ValueError(f"Unknown result fields: {', '.join(sorted(unknown))}")
+        return value
+
+
+class Snippet(BaseModel):
+    text: str
+    offset: int  # Start of text within the chunk content
+    highlights: List[List[int]]  # [start, end) offsets into text
 
 
 class SearchResult(BaseModel):
     chunk_id: str
+    document_id: Optional[str] = None
     title: str
     content: str
     source: str
@@ -21,12 +43,40 @@ class SearchResult(BaseModel):
     hybrid_score: Optional[float] = None
     score: float
     image_type: Optional[str] = None
+    snippet: Optional[Snippet] = None
 
 
 class SearchResponse(BaseModel):
     query: str
     results: List[SearchResult]
     count: int
+    next_cursor: Optional[str] = None
+
+
+# SearchResult projected with `fields`: only the requested keys are present
+class ProjectedSearchResult(BaseModel):
+    chunk_id: str
+    document_id: Optional[str] = None
+    title: Optional[str] = None
+    content: Optional[str] = None
+    source: Optional[str] = None
+    semantic_score: Optional[float] = None
+    bm25_score: Optional[float] = None
+    hybrid_score: Optional[float] = None
+    score: Optional[float] = None
+    image_type: Optional[str] = None
+    snippet: Optional[Snippet] = None
+
+
+class ProjectedSearchResponse(BaseModel):
+    query: str
+    results: List[ProjectedSearchResult]
+    count: int
+    next_cursor: Optional[str] = None
+
+
+# /api/search returns ProjectedSearchResponse when the request sets `fields`
+SearchResponseModel = Union[SearchResponse, ProjectedSearchResponse]
 
 
 # Document schemas
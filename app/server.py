@@ -0,0 +1,175 @@
+"""Production launcher: pre-forked uvicorn workers on one shared socket.
+
+    python -m app.server
+
+Settings are read and the app is imported once in the parent, then
+WORKERS processes are forked and inherit them copy-on-write. Each
+worker runs its own event loop and lifespan and accepts on the
+inherited socket. The parent restarts workers that die and forwards
+SIGTERM/SIGINT for a graceful shutdown.
+
+With more than one worker, cross-worker state is set up before the app
+is imported:
+- SHARED_CACHE_PATH defaults to a file on /dev/shm (embedding, vision
+  and cursor result-set caches are then stored once per replica, not
+  once per worker, and any worker can serve the next page of a cursor;
+  SHARED_CACHE_MAX_BYTES bounds its size)
+- PROMETHEUS_MULTIPROC_DIR defaults to a fresh temporary directory
+"""
+
+import gc
+import os
+import signal
+import socket
+import sys
+import tempfile
+import time
+import traceback
+from pathlib import Path
+from typing import Dict
+
+from .config import config
+
+SHM_DIR = "/dev/shm"
+
+# Restart a crashing worker at most this often
+RESTART_BACKOFF_SECONDS = 1.0
+
+
+def prepare_shared_state(workers: int) -> None:
+    """Point caches and metrics at cross-process storage (before importing the app)."""
+    if workers <= 1:
+        return
+
+    if not config.shared_cache_path:
+        directory = SHM_DIR if os.path.isdir(SHM_DIR) else tempfile.gettempdir()
+        config.shared_cache_path = os.path.join(directory, f"kb-cache-{config.port}.sqlite")
+    for suffix in ("", "-wal", "-shm"):
+        Path(config.shared_cache_path + suffix).unlink(missing_ok=True)
+
+    metrics_dir = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if not metrics_dir:
+        if "prometheus_client" in sys.modules:
+            print("Warning: prometheus_client already imported; /metrics will only show one worker")
+            return
+        metrics_dir = tempfile.mkdtemp(prefix="kb-prometheus-")
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = metrics_dir
+    # Samples left by a previous run would be aggregated too
+    for stale in Path(metrics_dir).glob("*.db"):
+        stale.unlink(missing_ok=True)
+
+
+def preload_modules() -> None:
+    """Import the SDKs the API will use so forked workers share their pages."""
+    if config.storage_backend == "postgres":
+        import pgvector.psycopg  # noqa: F401
+        import psycopg_pool  # noqa: F401
+    else:
+        import supabase  # noqa: F401
+    if config.frappe_api_url:
+        import httpx  # noqa: F401
+
+
+def bind_socket(host: str, port: int) -> socket.socket:
+    """Listening socket inherited by every worker."""
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def serve(app, sock: socket.socket) -> None:
+    """Run one uvicorn server on an already bound socket."""
+    import uvicorn
+
+    server = uvicorn.Server(uvicorn.Config(app, log_level=config.log_level, proxy_headers=True))
+    server.run(sockets=[sock])
+
+
+def _fork_worker(app, sock: socket.socket) -> int:
+    pid = os.fork()
+    if pid:
+        return pid
+
+    # Worker: default signal handling until uvicorn installs its own
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    code = 0
+    try:
+        serve(app, sock)
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    finally:
+        os._exit(code)
+
+
+def _mark_dead(pid: int) -> None:
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(pid)
+
+
+def run_workers(app, sock: socket.socket, workers: int) -> None:
+    """Fork `workers` servers and supervise them until SIGTERM/SIGINT."""
+    children: Dict[int, float] = {}
+    stopping = False
+
+    def stop(signum, frame) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    for _ in range(workers):
+        children[_fork_worker(app, sock)] = time.monotonic()
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        started = children.pop(pid, None)
+        if started is None:
+            continue
+        _mark_dead(pid)
+
+        if not stopping:
+            print(f"Warning: Worker {pid} exited with status {status}; restarting")
+            time.sleep(max(0.0, RESTART_BACKOFF_SECONDS - (time.monotonic() - started)))
+            children[_fork_worker(app, sock)] = time.monotonic()
+
+
+def main() -> None:
+    workers = max(1, config.workers)
+    prepare_shared_state(workers)
+
+    # Preload once in the parent; workers inherit it copy-on-write
+    from .main import app
+    preload_modules()
+
+    sock = bind_socket(config.host, config.port)
+    print(f"Serving on {config.host}:{config.port} with {workers} worker(s)")
+
+    if workers == 1:
+        serve(app, sock)
+        return
+
+    # Move preloaded objects out of GC tracking so collections in the
+    # workers do not touch (and un-share) their pages
+    gc.collect()
+    gc.freeze()
+    run_workers(app, sock, workers)
+
+
+if __name__ == "__main__":
+    main()
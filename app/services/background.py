@@ -0,0 +1,52 @@
+"""Base class for in-process buffers flushed by a background task."""
+
+import asyncio
+from typing import Optional
+
+
+class BackgroundFlusher:
+    """
+    Runs flush() every flush_interval seconds, or sooner when wake() is
+    called, until stop() is awaited. Subclasses implement flush().
+    """
+
+    def __init__(self, flush_interval: float):
+        self.flush_interval = flush_interval
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    async def flush(self) -> int:
+        raise NotImplementedError
+
+    def wake(self) -> None:
+        """Request an early flush (no-op until start())."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def start(self) -> None:
+        """Start the background flush task (lifespan startup)."""
+        if self._task is None:
+            self._stopping = False
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush task and drain what is left (lifespan shutdown)."""
+        if self._task is not None:
+            # Let an in-flight batch finish rather than cancelling it
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+            self._wakeup = None
+        await self.flush()
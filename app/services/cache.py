@@ -0,0 +1,209 @@
+"""In-process caches: TTL+LRU store and semantic query cache."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Optional, Sequence, Tuple
+
+from ..config import config
+from .metrics import record_cache
+from .quantization import binary_signature, hamming_distance, norm
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Bounded LRU cache whose entries expire after a fixed TTL.
+
+    Thread-safe; sync endpoints run in FastAPI's threadpool. Named
+    caches also report hits and misses to Prometheus.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+        name: Optional[str] = None
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a live entry (marking it recently used) or default."""
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is not _MISSING:
+                expires_at, value = item
+                if expires_at > self.clock():
+                    self._data.move_to_end(key)
+                    self.record(hit=True)
+                    return value
+                del self._data[key]
+            self.record(hit=False)
+            return default
+
+    def record(self, hit: bool) -> None:
+        """Count a lookup result."""
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        if self.name:
+            record_cache(self.name, hit)
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        expires_at = self.clock() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove an entry and return its value."""
+        with self._lock:
+            item = self._data.pop(key, _MISSING)
+        return default if item is _MISSING else item[1]
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """Snapshot of live (key, value) pairs, oldest first."""
+        now = self.clock()
+        with self._lock:
+            return [(k, v) for k, (expires_at, v) in self._data.items() if expires_at > now]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SemanticCache:
+    """
+    Near-duplicate query cache keyed by query embedding.
+
+    Lookups prefilter entries by sign-bit Hamming distance, then confirm
+    the closest few with exact cosine similarity against the threshold.
+    Entries only match when the search parameters are identical.
+    """
+
+    # Exact cosine checks per lookup after the Hamming prefilter
+    CANDIDATES = 4
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        threshold: float,
+        clock: Callable[[], float] = time.monotonic,
+        name: Optional[str] = None
+    ):
+        self.threshold = threshold
+        self._entries = TTLCache(maxsize, ttl, clock, name)
+        self._next_id = 0
+        self._id_lock = threading.Lock()
+
+    @property
+    def hits(self) -> int:
+        return self._entries.hits
+
+    @property
+    def misses(self) -> int:
+        return self._entries.misses
+
+    def lookup(self, embedding: Sequence[float], params: Hashable) -> Optional[List[Any]]:
+        """
+        Find cached results for a semantically equivalent query.
+
+        Args:
+            embedding: Query embedding
+            params: Search parameters that must match exactly
+
+        Returns:
+            Cached results, or None on a miss
+        """
+        length = norm(embedding)
+        if not length:
+            self._entries.record(hit=False)
+            return None
+
+        signature = binary_signature(embedding)
+        candidates = [
+            (hamming_distance(signature, entry[1]), key, entry)
+            for key, entry in self._entries.items()
+            if entry[2] == params
+        ]
+        candidates.sort(key=lambda candidate: candidate[0])
+
+        for _, key, (unit, _, _, results) in candidates[:self.CANDIDATES]:
+            similarity = sum(x * y for x, y in zip(embedding, unit)) / length
+            if similarity >= self.threshold:
+                # Refresh recency and count the hit
+                self._entries.get(key)
+                return list(results)
+
+        self._entries.record(hit=False)
+        return None
+
+    def store(self, embedding: Sequence[float], params: Hashable, results: List[Any]) -> None:
+        """Remember results for a query embedding (zero vectors are skipped)."""
+        length = norm(embedding)
+        if not length:
+            return
+
+        unit = [x / length for x in embedding]
+        with self._id_lock:
+            self._next_id += 1
+            key = self._next_id
+        self._entries.set(key, (unit, binary_signature(embedding), params, list(results)))
+
+    def invalidate(self) -> None:
+        """Forget everything, e.g. after a new document version."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def make_cache(name: str, maxsize: int, ttl: float):
+    """
+    Exact-key cache for `name`: shared across workers when
+    SHARED_CACHE_PATH is set, otherwise a per-process TTLCache.
+    """
+    if config.shared_cache_path:
+        from .shared_cache import SharedCache
+
+        return SharedCache(
+            config.shared_cache_path,
+            namespace=name,
+            maxsize=maxsize,
+            ttl=ttl,
+            name=name,
+            max_bytes=config.shared_cache_max_bytes
+        )
+    return TTLCache(maxsize, ttl, name=name)
+
+
+# Shared caches for search_hybrid
+embedding_cache = make_cache("query_embedding", config.embedding_cache_size, config.embedding_cache_ttl)
+
+# Vision results by image hash (re-ingested decks repeat most images)
+vision_cache = make_cache("vision_result", config.vision_cache_size, config.vision_cache_ttl)
+
+query_cache = SemanticCache(
+    maxsize=config.semantic_cache_size,
+    ttl=config.semantic_cache_ttl,
+    threshold=config.semantic_cache_threshold,
+    name="semantic_query"
+)
@@ -0,0 +1,89 @@
+"""Write-behind view counters for kb_documents."""
+
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from ..config import config
+from .background import BackgroundFlusher
+from .metrics import COUNTER_FLUSHES
+from .storage import get_storage_backend
+
+DeltaWriter = Callable[[List[Dict[str, Any]]], Awaitable[None]]
+
+
+async def apply_counter_deltas(document_views: List[Dict[str, Any]]) -> None:
+    """Apply one batch of view deltas with kb_apply_counter_deltas (migration 010)."""
+    await get_storage_backend().acall_rpc("kb_apply_counter_deltas", {
+        "document_views": document_views
+    })
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class CounterAggregator(BackgroundFlusher):
+    """
+    Coalesces document view increments per id in memory.
+
+    A search hit only bumps a dict entry; the background task sends the
+    accumulated deltas in a single RPC every flush_interval seconds, so
+    each hot row is updated once per interval instead of once per hit.
+    Failed flushes are merged back and retried.
+
+    Only deltas are kept: the totals live in kb_documents.view_count.
+    """
+
+    def __init__(self, writer: DeltaWriter, flush_interval: float = 10.0, clock: Callable[[], str] = _utc_now):
+        super().__init__(flush_interval)
+        self.writer = writer
+        self.clock = clock
+        self._views: Counter = Counter()
+        self._last_accessed: Dict[str, str] = {}
+
+    def record_views(self, document_ids: Iterable[Optional[str]]) -> None:
+        """Count one view per distinct document among served results."""
+        now = self.clock()
+        for document_id in {d for d in document_ids if d}:
+            self._views[document_id] += 1
+            self._last_accessed[document_id] = now
+
+    def __len__(self) -> int:
+        """Number of documents with unflushed deltas."""
+        return len(self._views)
+
+    async def flush(self) -> int:
+        """Send pending deltas in one call; returns the number of ids written."""
+        if not self._views:
+            return 0
+
+        # Swap the pending state out so increments during the write start a new batch
+        views, last_accessed = self._views, self._last_accessed
+        self._views, self._last_accessed = Counter(), {}
+
+        # Sorted by id for stable batches; the RPC takes the row locks in id order
+        document_views = [
+            {"id": d, "views": views[d], "last_accessed": last_accessed[d]}
+            for d in sorted(views)
+        ]
+
+        try:
+            await self.writer(document_views)
+        except Exception as e:
+            print(f"Warning: Failed to flush view counters ({len(document_views)} ids): {e}")
+            COUNTER_FLUSHES.labels("failed").inc()
+            self._views.update(views)
+            for d, ts in last_accessed.items():
+                self._last_accessed[d] = max(ts, self._last_accessed.get(d, ts))
+            return 0
+
+        COUNTER_FLUSHES.labels("ok").inc()
+        return len(document_views)
+
+
+# Shared aggregator for the search API
+counter_aggregator = CounterAggregator(
+    writer=apply_counter_deltas,
+    flush_interval=config.counters_flush_interval
+)
@@ -0,0 +1,121 @@
+"""Prometheus metrics.
+
+Works with a single process out of the box. With several uvicorn
+workers, set PROMETHEUS_MULTIPROC_DIR to an empty, writable directory
+before the workers start; each worker then writes its samples there and
+/metrics aggregates all of them.
+"""
+
+import functools
+import os
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Tuple
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest
+from prometheus_client import multiprocess
+
+from .profiling import record_timing
+
+# Sub-millisecond to multi-second buckets: stages span cache hits to RPCs
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+REQUEST_LATENCY = Histogram(
+    "kb_http_request_duration_seconds",
+    "HTTP request latency by route",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS
+)
+
+SEARCH_STAGE_LATENCY = Histogram(
+    "kb_search_stage_duration_seconds",
+    "Time spent in each search_hybrid stage",
+    ["stage"],
+    buckets=LATENCY_BUCKETS
+)
+
+VISION_CALLS = Counter(
+    "kb_vision_images_total",
+    "Images processed by the vision pipeline, by classified type",
+    ["image_type"]
+)
+
+VISION_UPLOAD_BYTES = Counter(
+    "kb_vision_upload_bytes_total",
+    "Image bytes sent to Gemini"
+)
+
+CACHE_REQUESTS = Counter(
+    "kb_cache_requests_total",
+    "Cache lookups by cache and result (hit/miss)",
+    ["cache", "result"]
+)
+
+QUERY_LOG_WRITTEN = Counter(
+    "kb_query_log_written_total",
+    "Search log rows written to kb_query_log"
+)
+
+QUERY_LOG_DROPPED = Counter(
+    "kb_query_log_dropped_total",
+    "Search log rows dropped (buffer full or write failed)"
+)
+
+COUNTER_FLUSHES = Counter(
+    "kb_counter_flushes_total",
+    "View counter delta flushes by result (ok/failed)",
+    ["result"]
+)
+
+EXTRACTOR_LATENCY = Histogram(
+    "kb_extractor_duration_seconds",
+    "Document extraction time by file type",
+    ["file_type"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+)
+
+
+@contextmanager
+def stage_timer(stage: str) -> Iterator[None]:
+    """Observe the duration of a search stage (and add it to a debug breakdown)."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        SEARCH_STAGE_LATENCY.labels(stage).observe(elapsed)
+        record_timing(stage, elapsed)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """Count a cache hit or miss."""
+    CACHE_REQUESTS.labels(cache, "hit" if hit else "miss").inc()
+
+
+def timed_extractor(file_type: str) -> Callable:
+    """Decorator recording extractor duration for a file type."""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                EXTRACTOR_LATENCY.labels(file_type).observe(time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """
+    Render all metrics in Prometheus text format.
+
+    Returns:
+        (body, content type)
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
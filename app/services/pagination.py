@@ -0,0 +1,153 @@
+"""Cursor pagination over a materialized, fused result list."""
+
+import base64
+import hashlib
+import json
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..config import config
+from .cache import make_cache
+from .search import asearch_hybrid, search_hybrid, shape_results
+
+
+class InvalidCursor(ValueError):
+    """Cursor is malformed or was issued for a different search."""
+
+
+# set_id -> fused candidate list (formatted, unshaped rows); shared by
+# all workers under the pre-fork launcher so any worker can serve a page
+result_sets = make_cache("cursor_result_sets", config.cursor_cache_size, config.cursor_ttl)
+
+
+def _fingerprint(query: str, threshold: float, k_constant: int) -> str:
+    """Bind a cursor to the search that produced it."""
+    raw = f"{query}\x00{threshold}\x00{k_constant}".encode()
+    return hashlib.sha256(raw).hexdigest()[:16]
+
+
+def encode_cursor(set_id: str, offset: int, fingerprint: str) -> str:
+    """Opaque, URL-safe cursor for the page starting at offset."""
+    raw = json.dumps([set_id, offset, fingerprint], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int, str]:
+    """
+    Parse a cursor produced by encode_cursor.
+
+    Raises:
+        InvalidCursor: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        set_id, offset, fingerprint = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor("Invalid cursor") from e
+
+    if not isinstance(set_id, str) or not isinstance(offset, int) or offset < 0:
+        raise InvalidCursor("Invalid cursor")
+    return set_id, offset, str(fingerprint)
+
+
+def _open_cursor(query: str, threshold: float, k_constant: int, cursor: Optional[str]) -> Tuple[str, int, str]:
+    """Resolve (set_id, offset, fingerprint) for a first page or a cursor."""
+    fingerprint = _fingerprint(query, threshold, k_constant)
+
+    if not cursor:
+        return uuid.uuid4().hex, 0, fingerprint
+
+    set_id, offset, cursor_fingerprint = decode_cursor(cursor)
+    if cursor_fingerprint != fingerprint:
+        raise InvalidCursor("Cursor does not match this search")
+    return set_id, offset, fingerprint
+
+
+def _slice_page(
+    candidates: List[Dict[str, Any]],
+    set_id: str,
+    offset: int,
+    fingerprint: str,
+    query: str,
+    top_k: int,
+    fields: Optional[List[str]],
+    snippet_chars: int
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Cut one page from the fused list and build the next cursor."""
+    page = candidates[offset:offset + top_k]
+    next_offset = offset + top_k
+    next_cursor = encode_cursor(set_id, next_offset, fingerprint) if next_offset < len(candidates) else None
+
+    return shape_results(page, query, fields, snippet_chars), next_cursor
+
+
+def search_page(
+    query: str,
+    top_k: int = 5,
+    threshold: float = 0.5,
+    k_constant: int = 60,
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    snippet_chars: int = 0
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Return one page of hybrid search results plus the next cursor.
+
+    The first call runs the hybrid search once at pagination_depth and
+    caches the fused list; later pages are sliced from it without
+    re-embedding or re-fusing. If the list has expired it is recomputed
+    once and cached again.
+
+    Args:
+        query: Search query (must match the query that issued the cursor)
+        top_k: Page size
+        threshold: Min semantic similarity
+        k_constant: RRF constant
+        cursor: Cursor from a previous page, or None for the first page
+        fields: Result field projection (see search_hybrid)
+        snippet_chars: Snippet length, 0 to disable
+
+    Returns:
+        (page results, next cursor or None on the last page)
+
+    Raises:
+        InvalidCursor: If the cursor is malformed or belongs to another search
+    """
+    set_id, offset, fingerprint = _open_cursor(query, threshold, k_constant, cursor)
+
+    candidates = result_sets.get(set_id)
+    if candidates is None:
+        candidates = search_hybrid(
+            query=query,
+            top_k=config.pagination_depth,
+            threshold=threshold,
+            k_constant=k_constant
+        )
+        result_sets.set(set_id, candidates)
+
+    return _slice_page(candidates, set_id, offset, fingerprint, query, top_k, fields, snippet_chars)
+
+
+async def asearch_page(
+    query: str,
+    top_k: int = 5,
+    threshold: float = 0.5,
+    k_constant: int = 60,
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    snippet_chars: int = 0
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Async variant of search_page for the API."""
+    set_id, offset, fingerprint = _open_cursor(query, threshold, k_constant, cursor)
+
+    candidates = result_sets.get(set_id)
+    if candidates is None:
+        candidates = await asearch_hybrid(
+            query=query,
+            top_k=config.pagination_depth,
+            threshold=threshold,
+            k_constant=k_constant
+        )
+        result_sets.set(set_id, candidates)
+
+    return _slice_page(candidates, set_id, offset, fingerprint, query, top_k, fields, snippet_chars)
@@ -0,0 +1,278 @@
+"""Direct Postgres storage backend.
+
+Talks to Postgres through psycopg connection pools instead of PostgREST:
+an async pool for the API and a sync pool for ingestion. Embeddings are
+sent in pgvector's binary format and the hybrid search RPC runs as a
+server-side prepared statement.
+
+Prepared statements need a session-mode connection (direct Postgres or
+the Supabase pooler in session mode), not a transaction-mode pooler.
+"""
+
+import asyncio
+import threading
+import uuid
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from pgvector import Vector
+from pgvector.psycopg import register_vector, register_vector_async
+from psycopg import sql
+from psycopg.rows import dict_row
+from psycopg.types.json import Jsonb
+from psycopg_pool import AsyncConnectionPool, ConnectionPool
+
+# Output columns of match_chunks_hybrid_rrf / match_chunks_hybrid_rrf_quantized
+RPC_OUTPUT_COLUMNS = (
+    "chunk_id",
+    "document_id",
+    "document_title",
+    "section_title",
+    "content",
+    "source_path",
+    "image_type",
+    "semantic_score",
+    "bm25_score",
+    "hybrid_score",
+    "document_date"
+)
+
+SEARCH_RPCS = ("match_chunks_hybrid_rrf", "match_chunks_hybrid_rrf_quantized")
+
+# Columns written as pgvector values
+VECTOR_COLUMNS = {"embedding"}
+
+
+def build_rpc_query(rpc_name: str, params: Dict[str, Any], columns: Optional[Sequence[str]] = None) -> sql.Composed:
+    """
+    SELECT from a search RPC using named arguments.
+
+    The embedding is bound with a binary placeholder; everything else
+    uses automatic adaptation.
+
+    Raises:
+        ValueError: On an unknown RPC or output column
+    """
+    if rpc_name not in SEARCH_RPCS:
+        raise ValueError(f"Unknown search RPC: {rpc_name}")
+
+    columns = list(columns or RPC_OUTPUT_COLUMNS)
+    unknown = set(columns) - set(RPC_OUTPUT_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown RPC columns: {', '.join(sorted(unknown))}")
+
+    arguments = sql.SQL(", ").join(
+        sql.SQL("{} => {}").format(
+            sql.Identifier(name),
+            sql.Placeholder(name, "b") if name == "query_embedding" else sql.Placeholder(name)
+        )
+        for name in sorted(params)
+    )
+    return sql.SQL("SELECT {} FROM {}({})").format(
+        sql.SQL(", ").join(sql.Identifier(c) for c in columns),
+        sql.Identifier(rpc_name),
+        arguments
+    )
+
+
+def build_call_query(name: str, params: Dict[str, Any]) -> sql.Composed:
+    """SELECT a database function with named arguments (JSON values as jsonb)."""
+    return sql.SQL("SELECT * FROM {}({})").format(
+        sql.Identifier(name),
+        sql.SQL(", ").join(
+            sql.SQL("{} => {}").format(sql.Identifier(key), sql.Placeholder(key))
+            for key in sorted(params)
+        )
+    )
+
+
+def _bind_json(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Wrap dict/list arguments so they are sent as jsonb."""
+    return {k: Jsonb(v) if isinstance(v, (dict, list)) else v for k, v in params.items()}
+
+
+def build_insert_query(table: str, columns: Sequence[str]) -> sql.Composed:
+    """INSERT statement for a batch of rows with the same columns."""
+    return sql.SQL("INSERT INTO {} ({}) VALUES ({})").format(
+        sql.Identifier(table),
+        sql.SQL(", ").join(sql.Identifier(c) for c in columns),
+        sql.SQL(", ").join(
+            sql.Placeholder(c, "b") if c in VECTOR_COLUMNS else sql.Placeholder(c)
+            for c in columns
+        )
+    )
+
+
+def _conditions(filters: Dict[str, Any], prefix: str) -> sql.Composed:
+    """`col = value AND ...` with placeholders named prefix + column."""
+    return sql.SQL(" AND ").join(
+        sql.SQL("{} = {}").format(sql.Identifier(c), sql.Placeholder(prefix + c))
+        for c in filters
+    )
+
+
+def build_select_query(table: str, filters: Dict[str, Any]) -> sql.Composed:
+    """SELECT every column of the rows matching equality filters."""
+    return sql.SQL("SELECT * FROM {} WHERE {}").format(sql.Identifier(table), _conditions(filters, "w_"))
+
+
+def build_update_query(table: str, values: Dict[str, Any], filters: Dict[str, Any]) -> sql.Composed:
+    """UPDATE the rows matching equality filters."""
+    return sql.SQL("UPDATE {} SET {} WHERE {}").format(
+        sql.Identifier(table),
+        sql.SQL(", ").join(
+            sql.SQL("{} = {}").format(sql.Identifier(c), sql.Placeholder("v_" + c))
+            for c in values
+        ),
+        _conditions(filters, "w_")
+    )
+
+
+def _prefixed(params: Dict[str, Any], prefix: str) -> Dict[str, Any]:
+    return {prefix + k: v for k, v in params.items()}
+
+
+def _bind(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Wrap embedding lists so pgvector's binary dumper is used."""
+    bound = dict(params)
+    for name in ("query_embedding", *VECTOR_COLUMNS):
+        if isinstance(bound.get(name), list):
+            bound[name] = Vector(bound[name])
+    return bound
+
+
+def _to_json_types(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Match PostgREST's JSON output (UUIDs and timestamps as strings)."""
+    for key, value in row.items():
+        if isinstance(value, uuid.UUID):
+            row[key] = str(value)
+        elif isinstance(value, (datetime, date)):
+            row[key] = value.isoformat()
+    return row
+
+
+class PostgresBackend:
+    """Pooled psycopg backend with the same surface as SupabaseBackend."""
+
+    def __init__(self, dsn: str, min_size: int = 1, max_size: int = 10):
+        self.dsn = dsn
+        self.min_size = min_size
+        self.max_size = max_size
+        self._pool: Optional[ConnectionPool] = None
+        self._async_pool: Optional[AsyncConnectionPool] = None
+        self._lock = threading.Lock()
+        self._async_lock = asyncio.Lock()
+
+    @property
+    def pool(self) -> ConnectionPool:
+        """Sync pool (ingestion, scripts), opened on first use."""
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ConnectionPool(
+                        self.dsn,
+                        min_size=self.min_size,
+                        max_size=self.max_size,
+                        kwargs={"row_factory": dict_row},
+                        configure=register_vector,
+                        open=True
+                    )
+        return self._pool
+
+    async def get_async_pool(self) -> AsyncConnectionPool:
+        """Async pool (API), opened on first use inside the running loop."""
+        if self._async_pool is None:
+            async with self._async_lock:
+                if self._async_pool is None:
+                    pool = AsyncConnectionPool(
+                        self.dsn,
+                        min_size=self.min_size,
+                        max_size=self.max_size,
+                        kwargs={"row_factory": dict_row},
+                        configure=register_vector_async,
+                        open=False
+                    )
+                    await pool.open()
+                    self._async_pool = pool
+        return self._async_pool
+
+    def match_chunks(self, rpc_name: str, params: Dict[str, Any], columns: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """Run a hybrid search RPC on the sync pool."""
+        query = build_rpc_query(rpc_name, params, columns)
+        with self.pool.connection() as conn:
+            rows = conn.execute(query, _bind(params), prepare=True, binary=True).fetchall()
+        return [_to_json_types(row) for row in rows]
+
+    async def amatch_chunks(self, rpc_name: str, params: Dict[str, Any], columns: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """Run a hybrid search RPC on the async pool."""
+        query = build_rpc_query(rpc_name, params, columns)
+        pool = await self.get_async_pool()
+        async with pool.connection() as conn:
+            cursor = await conn.execute(query, _bind(params), prepare=True, binary=True)
+            rows = await cursor.fetchall()
+        return [_to_json_types(row) for row in rows]
+
+    def call_rpc(self, name: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Call a database function on the sync pool."""
+        with self.pool.connection() as conn:
+            rows = conn.execute(build_call_query(name, params), _bind_json(params), prepare=True).fetchall()
+        return [_to_json_types(row) for row in rows]
+
+    async def acall_rpc(self, name: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Call a database function on the async pool."""
+        pool = await self.get_async_pool()
+        async with pool.connection() as conn:
+            cursor = await conn.execute(build_call_query(name, params), _bind_json(params), prepare=True)
+            rows = await cursor.fetchall()
+        return [_to_json_types(row) for row in rows]
+
+    def insert_rows(self, table: str, rows: List[Dict[str, Any]]) -> None:
+        """Batch insert rows that share the same keys."""
+        if not rows:
+            return
+        query = build_insert_query(table, list(rows[0]))
+        with self.pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.executemany(query, [_bind(row) for row in rows])
+
+    def insert_row(self, table: str, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Insert one row and return it as stored (with generated columns)."""
+        query = sql.SQL("{} RETURNING *").format(build_insert_query(table, list(row)))
+        with self.pool.connection() as conn:
+            stored = conn.execute(query, _bind_json(_bind(row))).fetchone()
+        return _to_json_types(stored)
+
+    def select_rows(self, table: str, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Rows of a table matching equality filters."""
+        with self.pool.connection() as conn:
+            rows = conn.execute(build_select_query(table, filters), _prefixed(filters, "w_")).fetchall()
+        return [_to_json_types(row) for row in rows]
+
+    def update_rows(self, table: str, values: Dict[str, Any], filters: Dict[str, Any]) -> None:
+        """Set `values` on the rows matching equality filters."""
+        params = {**_prefixed(_bind_json(_bind(values)), "v_"), **_prefixed(filters, "w_")}
+        with self.pool.connection() as conn:
+            conn.execute(build_update_query(table, values, filters), params)
+
+    async def ainsert_rows(self, table: str, rows: List[Dict[str, Any]]) -> None:
+        """Batch insert rows on the async pool."""
+        if not rows:
+            return
+        query = build_insert_query(table, list(rows[0]))
+        pool = await self.get_async_pool()
+        async with pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.executemany(query, [_bind(row) for row in rows])
+
+    async def awarm(self) -> None:
+        """Open the async pool ahead of the first search."""
+        await self.get_async_pool()
+
+    async def aclose(self) -> None:
+        """Close both pools (lifespan shutdown)."""
+        if self._async_pool is not None:
+            await self._async_pool.close()
+            self._async_pool = None
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
@@ -0,0 +1,152 @@
+"""Opt-in per-request timing breakdown and sampling profiler.
+
+stage_timer() reports every stage here as well as to Prometheus. The
+durations are only kept while a request runs inside collect_timings(),
+so requests without debug mode pay one ContextVar lookup per stage.
+"""
+
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar("kb_request_timings", default=None)
+
+PROFILE_ID = re.compile(r"^[0-9a-f]{32}$")
+
+
+def record_timing(stage: str, seconds: float) -> None:
+    """Add a stage duration to the current request's breakdown, if any."""
+    timings = _timings.get()
+    if timings is not None:
+        timings[stage] = timings.get(stage, 0.0) + seconds
+
+
+@contextmanager
+def collect_timings() -> Iterator[Dict[str, float]]:
+    """Collect stage durations (seconds, summed per stage) for this context."""
+    timings: Dict[str, float] = {}
+    token = _timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _timings.reset(token)
+
+
+@contextmanager
+def timed(stage: str) -> Iterator[None]:
+    """Time a block into the breakdown only (no Prometheus observation)."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_timing(stage, time.perf_counter() - start)
+
+
+def server_timing(timings: Dict[str, float]) -> str:
+    """Format a breakdown as a Server-Timing header value (milliseconds)."""
+    return ", ".join(f"{stage};dur={seconds * 1000:.2f}" for stage, seconds in timings.items())
+
+
+# Innermost frames of threads parked waiting for work (idle pool workers)
+_IDLE_FILES = ("threading.py", "queue.py")
+_IDLE_FRAMES = {("thread.py", "_worker")}  # concurrent.futures, blocked in SimpleQueue.get
+
+
+def _is_idle(frame) -> bool:
+    filename = os.path.basename(frame.f_code.co_filename)
+    return filename in _IDLE_FILES or (filename, frame.f_code.co_name) in _IDLE_FRAMES
+
+
+class SamplingProfiler:
+    """
+    Samples Python stacks at a fixed interval.
+
+    Stacks are aggregated in the folded format ("outer;inner count")
+    read by flamegraph.pl and speedscope. Profiling the event loop
+    thread also captures other requests running concurrently.
+
+    With all_threads, every other busy thread is sampled too, under its
+    thread name as the root frame. Sync storage calls run in the
+    threadpool (run_in_threadpool), so that is where a slow RPC shows
+    up; threads parked waiting for work are skipped.
+    """
+
+    def __init__(self, interval: float = 0.005, thread_id: Optional[int] = None, all_threads: bool = False):
+        self.interval = interval
+        self.thread_id = thread_id or threading.get_ident()
+        self.all_threads = all_threads
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            frames = sys._current_frames()
+            if not self.all_threads:
+                self._add(frames.get(self.thread_id), None)
+                continue
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in frames.items():
+                if ident == own:
+                    continue
+                if ident != self.thread_id and _is_idle(frame):
+                    continue
+                self._add(frame, names.get(ident, f"thread-{ident}"))
+
+    def _add(self, frame, root: Optional[str]) -> None:
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            frame = frame.f_back
+        if root is not None:
+            stack.append(root)
+        if stack:
+            self.samples[";".join(reversed(stack))] += 1
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._sample, name="kb-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def folded(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+
+def save_profile(folded: str, directory: str, keep: int = 50) -> str:
+    """
+    Write a folded profile and prune the oldest beyond `keep`.
+
+    Returns:
+        Profile id for get_profile_path()
+    """
+    root = Path(directory)
+    root.mkdir(parents=True, exist_ok=True)
+    profile_id = uuid.uuid4().hex
+    (root / f"{profile_id}.folded").write_text(folded, encoding="utf-8")
+
+    saved = sorted(root.glob("*.folded"), key=lambda p: p.stat().st_mtime)
+    for old in saved[:max(0, len(saved) - keep)]:
+        old.unlink(missing_ok=True)
+    return profile_id
+
+
+def get_profile_path(profile_id: str, directory: str) -> Optional[Path]:
+    """Path of a saved profile, or None for unknown / malformed ids."""
+    if not PROFILE_ID.match(profile_id):
+        return None
+    path = Path(directory) / f"{profile_id}.folded"
+    return path if path.is_file() else None
@@ -0,0 +1,85 @@
+"""Compact embedding codes for coarse search and exact rescoring.
+
+Mirrors the representations stored by migration 009 (halfvec + sign bits)
+so local vector stores can hold small codes instead of 768 floats and
+rescore a short candidate list at full precision.
+"""
+
+import math
+from typing import List, Sequence, Tuple
+
+# Symmetric int8 range (-127..127 keeps zero exactly representable)
+INT8_MAX = 127
+
+
+def quantize_int8(vector: Sequence[float]) -> Tuple[bytes, float]:
+    """
+    Scalar-quantize a vector to signed 8-bit codes.
+
+    Args:
+        vector: Full-precision embedding
+
+    Returns:
+        (codes, scale) where value ~= code * scale
+    """
+    peak = max((abs(x) for x in vector), default=0.0)
+    scale = peak / INT8_MAX if peak else 1.0
+    codes = bytes((round(x / scale) & 0xFF) for x in vector)
+    return codes, scale
+
+
+def dequantize_int8(codes: bytes, scale: float) -> List[float]:
+    """Expand int8 codes back to approximate floats."""
+    return [(c - 256 if c > INT8_MAX else c) * scale for c in codes]
+
+
+def binary_signature(vector: Sequence[float]) -> int:
+    """
+    Pack the sign bit of every dimension into one integer.
+
+    Matches pgvector's binary_quantize(): bit i is set when vector[i] > 0.
+    """
+    signature = 0
+    for i, x in enumerate(vector):
+        if x > 0:
+            signature |= 1 << i
+    return signature
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing sign bits between two signatures."""
+    return (a ^ b).bit_count()
+
+
+def norm(vector: Sequence[float]) -> float:
+    """Euclidean length of a vector."""
+    return math.sqrt(sum(x * x for x in vector))
+
+
+def cosine_similarity(a: Sequence[float], b: Sequence[float]) -> float:
+    """Cosine similarity; 0.0 when either vector has zero length."""
+    denom = norm(a) * norm(b)
+    if not denom:
+        return 0.0
+    return sum(x * y for x, y in zip(a, b)) / denom
+
+
+def rescore(
+    query: Sequence[float],
+    candidates: Sequence[Tuple[str, Sequence[float]]],
+    top_k: int
+) -> List[Tuple[str, float]]:
+    """
+    Exact second stage: rank coarse candidates by full-precision cosine.
+
+    Args:
+        query: Full-precision query embedding
+        candidates: (id, full-precision vector) pairs from the coarse scan
+        top_k: Number of results to keep
+
+    Returns:
+        (id, similarity) pairs, best first
+    """
+    scored = [(item_id, cosine_similarity(query, vector)) for item_id, vector in candidates]
+    scored.sort(key=lambda pair: pair[1], reverse=True)
+    return scored[:top_k]
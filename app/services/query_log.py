@@ -0,0 +1,94 @@
+"""Write-behind search logging to kb_query_log."""
+
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+from ..config import config
+from .background import BackgroundFlusher
+from .metrics import QUERY_LOG_DROPPED, QUERY_LOG_WRITTEN
+from .storage import get_storage_backend
+
+BatchWriter = Callable[[List[Dict[str, Any]]], Awaitable[None]]
+
+
+async def insert_query_log(rows: List[Dict[str, Any]]) -> None:
+    """Batch insert rows into kb_query_log via the storage backend."""
+    await get_storage_backend().ainsert_rows("kb_query_log", rows)
+
+
+class QueryLogger(BackgroundFlusher):
+    """
+    Buffers query log rows in memory and inserts them in batches.
+
+    record() never blocks: when the buffer is full the entry is dropped
+    and counted. A background task flushes when batch_size rows are
+    waiting or every flush_interval seconds, and stop() drains the
+    buffer on shutdown.
+    """
+
+    def __init__(
+        self,
+        writer: BatchWriter,
+        capacity: int = 10000,
+        batch_size: int = 200,
+        flush_interval: float = 5.0
+    ):
+        super().__init__(flush_interval)
+        self.writer = writer
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.dropped = 0
+        self._buffer: Deque[Dict[str, Any]] = deque()
+
+    def record(
+        self,
+        query: str,
+        results_count: int,
+        response_time_ms: int,
+        search_type: str = "hybrid",
+        user_id: Optional[str] = None
+    ) -> None:
+        """Queue one search for logging (drops it if the buffer is full)."""
+        if len(self._buffer) >= self.capacity:
+            self.dropped += 1
+            QUERY_LOG_DROPPED.inc()
+            return
+
+        self._buffer.append({
+            "query": query,
+            "user_id": user_id,
+            "results_count": results_count,
+            "response_time_ms": response_time_ms,
+            "search_type": search_type
+        })
+        if len(self._buffer) >= self.batch_size:
+            self.wake()
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    async def flush(self) -> int:
+        """Write everything currently buffered; returns rows written."""
+        written = 0
+        while self._buffer:
+            batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+            try:
+                await self.writer(batch)
+            except Exception as e:
+                # Analytics must never take the API down: count and move on
+                print(f"Warning: Failed to write {len(batch)} query log rows: {e}")
+                self.dropped += len(batch)
+                QUERY_LOG_DROPPED.inc(len(batch))
+                continue
+            written += len(batch)
+            QUERY_LOG_WRITTEN.inc(len(batch))
+        return written
+
+
+# Shared logger for the search API
+query_logger = QueryLogger(
+    writer=insert_query_log,
+    capacity=config.query_log_capacity,
+    batch_size=config.query_log_batch_size,
+    flush_interval=config.query_log_flush_interval
+)
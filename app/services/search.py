@@ -1,15 +1,200 @@
 """Hybrid search with RRF fusion."""
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+from ..config import config
+from .cache import embedding_cache, query_cache
 from .embeddings import generate_embedding
-from .storage import get_supabase_client
+from .metrics import stage_timer
+from .search_generation import search_generation
+from .snippets import extract_snippet
+from .storage import get_storage_backend
+
+# SearchResult field -> match_chunks_hybrid_rrf output column
+RESULT_COLUMNS = {
+    "chunk_id": "chunk_id",
+    "document_id": "document_id",
+    "title": "document_title",
+    "content": "content",
+    "source": "source_path",
+    "image_type": "image_type",
+    "semantic_score": "semantic_score",
+    "bm25_score": "bm25_score",
+    "hybrid_score": "hybrid_score",
+    "score": "hybrid_score"
+}
+
+
+# Always returned, even with a field projection
+IDENTITY_FIELDS = ("chunk_id", "document_id")
+
+# match_chunks_coarse cannot return more candidates than pgvector's
+# hnsw.ef_search maximum (migration 009)
+MAX_COARSE_CANDIDATES = 1000
+
+# top_k values already warned about (once per process)
+_clamped_top_k = set()
+
+
+def rescore_multiplier_for(top_k: int) -> int:
+    """
+    config.rescore_multiplier, lowered so the match_count * 2 * multiplier
+    coarse candidates stay within MAX_COARSE_CANDIDATES.
+
+    Asking for more would silently get at most 1000 rows from the HNSW
+    scan, so deep pages (top_k=pagination_depth) lose recall; lowering
+    the multiplier makes the trade-off explicit and logged.
+    """
+    multiplier = config.rescore_multiplier
+    if top_k * 2 * multiplier <= MAX_COARSE_CANDIDATES:
+        return multiplier
+
+    clamped = max(1, MAX_COARSE_CANDIDATES // (top_k * 2))
+    if top_k not in _clamped_top_k:
+        _clamped_top_k.add(top_k)
+        print(
+            f"Warning: top_k={top_k} x rescore_multiplier={multiplier} needs {top_k * 2 * multiplier} coarse "
+            f"candidates (max {MAX_COARSE_CANDIDATES}); using rescore_multiplier={clamped}"
+        )
+    return clamped
+
+
+def rpc_columns(fields: Optional[List[str]], snippet: bool = False) -> Optional[List[str]]:
+    """
+    RPC output columns needed for a field projection.
+
+    Returns:
+        Sorted column names, or None to select every column
+    """
+    if fields is None:
+        return None
+
+    wanted = {*IDENTITY_FIELDS, *fields}
+    if snippet:
+        wanted.add("content")
+    return sorted({RESULT_COLUMNS[f] for f in wanted if f in RESULT_COLUMNS})
+
+
+def build_rpc_call(
+    query_embedding: List[float],
+    query: str,
+    top_k: int,
+    threshold: float,
+    k_constant: int
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Pick the hybrid search RPC and its parameters.
+
+    With embedding_quantization enabled, the two-stage function from
+    migration 009 scans compact codes first and rescores the candidates
+    with full-precision vectors.
+
+    Returns:
+        (function name, params)
+    """
+    params = {
+        "query_embedding": query_embedding,
+        "query_text": query,
+        "match_threshold": threshold,
+        "match_count": top_k,
+        "k_constant": k_constant
+    }
+
+    if config.embedding_quantization == "none":
+        return "match_chunks_hybrid_rrf", params
+
+    params["quantization"] = config.embedding_quantization
+    params["rescore_multiplier"] = rescore_multiplier_for(top_k)
+    return "match_chunks_hybrid_rrf_quantized", params
+
+
+def embed_query(query: str) -> List[float]:
+    """Query embedding, reused for repeated query text."""
+    embedding = embedding_cache.get(query)
+    if embedding is None:
+        embedding = generate_embedding(query, task_type="RETRIEVAL_QUERY")
+        embedding_cache.set(query, embedding)
+    return embedding
+
+
+def _prepare_search(
+    query: str,
+    top_k: int,
+    threshold: float,
+    k_constant: int,
+    fields: Optional[List[str]],
+    snippet_chars: int
+) -> Tuple[Dict[str, Any], Optional[List[Dict[str, Any]]]]:
+    """
+    Embed the query, resolve the RPC call and consult the semantic cache.
+
+    Returns:
+        (plan, cached results or None)
+    """
+    # Generate query embedding
+    with stage_timer("embedding"):
+        query_embedding = embed_query(query)
+
+    rpc_name, params = build_rpc_call(query_embedding, query, top_k, threshold, k_constant)
+    columns = rpc_columns(fields, snippet=snippet_chars > 0)
+    plan = {
+        "embedding": query_embedding,
+        "rpc_name": rpc_name,
+        "params": params,
+        "columns": columns,
+        # Results cached before searchable content changed stop matching
+        "cache_params": (rpc_name, top_k, threshold, k_constant, tuple(columns or ()), search_generation.value)
+    }
+
+    # Reuse results of a recently answered near-duplicate query
+    cached = None
+    if config.semantic_cache_enabled:
+        with stage_timer("cache_lookup"):
+            cached = query_cache.lookup(query_embedding, plan["cache_params"])
+    return plan, cached
+
+
+def format_results(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Map RPC rows onto result dicts.
+
+    Responses are encoded without SearchResult validation
+    (serialization.py), so NULL columns of required fields are
+    coalesced here rather than sent to clients as null.
+    """
+    results = []
+    for chunk in rows:
+        results.append({
+            "chunk_id": chunk.get("chunk_id"),
+            "document_id": chunk.get("document_id"),
+            "title": chunk.get("document_title") or "Unknown",
+            "section": chunk.get("section_title"),
+            "content": chunk.get("content") or "",
+            "source": chunk.get("source_path") or "",
+            "image_type": chunk.get("image_type"),
+            "semantic_score": chunk.get("semantic_score") or 0.0,
+            "bm25_score": chunk.get("bm25_score", 0.0),
+            "hybrid_score": chunk.get("hybrid_score", 0.0),
+            "score": chunk.get("hybrid_score") or 0.0,
+            "date": chunk.get("document_date")
+        })
+    return results
+
+
+def _finish_search(plan: Dict[str, Any], rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Format RPC rows and remember them in the semantic cache."""
+    results = format_results(rows)
+    if config.semantic_cache_enabled:
+        query_cache.store(plan["embedding"], plan["cache_params"], results)
+    return results
 
 
 def search_hybrid(
     query: str,
     top_k: int = 5,
     threshold: float = 0.5,
-    k_constant: int = 60
+    k_constant: int = 60,
+    fields: Optional[List[str]] = None,
+    snippet_chars: int = 0
 ) -> List[Dict[str, Any]]:
     """
     Hybrid search with Reciprocal Rank Fusion (RRF).
@@ -21,42 +206,76 @@ def search_hybrid(
         top_k: Max results
         threshold: Min semantic similarity
         k_constant: RRF constant (60 = balanced)
+        fields: Only return these result fields (plus chunk_id and
+            document_id); other columns are left out of the RPC select
+        snippet_chars: If > 0, add a query-centred snippet of this length
 
     Returns:
         Results with semantic_score, bm25_score, hybrid_score
     """
-    supabase = get_supabase_client()
+    plan, results = _prepare_search(query, top_k, threshold, k_constant, fields, snippet_chars)
 
-    # Generate query embedding
-    query_embedding = generate_embedding(query, task_type="RETRIEVAL_QUERY")
-
-    # Call hybrid search RPC
-    response = supabase.rpc(
-        "match_chunks_hybrid_rrf",
-        {
-            "query_embedding": query_embedding,
-            "query_text": query,
-            "match_threshold": threshold,
-            "match_count": top_k,
-            "k_constant": k_constant
-        }
-    ).execute()
-
-    # Format results
-    results = []
-    for chunk in response.data:
-        results.append({
-            "chunk_id": chunk.get("chunk_id"),
-            "title": chunk.get("document_title", "Unknown"),
-            "section": chunk.get("section_title"),
-            "content": chunk.get("content", ""),
-            "source": chunk.get("source_path", ""),
-            "image_type": chunk.get("image_type"),
-            "semantic_score": chunk.get("semantic_score", 0.0),
-            "bm25_score": chunk.get("bm25_score", 0.0),
-            "hybrid_score": chunk.get("hybrid_score", 0.0),
-            "score": chunk.get("hybrid_score", 0.0),
-            "date": chunk.get("document_date")
-        })
+    rows = None
+    if results is None:
+        # Call hybrid search RPC
+        with stage_timer("rpc"):
+            rows = get_storage_backend().match_chunks(plan["rpc_name"], plan["params"], plan["columns"])
 
-    return results
+    with stage_timer("format"):
+        if rows is not None:
+            results = _finish_search(plan, rows)
+        return shape_results(results, query, fields, snippet_chars)
+
+
+async def asearch_hybrid(
+    query: str,
+    top_k: int = 5,
+    threshold: float = 0.5,
+    k_constant: int = 60,
+    fields: Optional[List[str]] = None,
+    snippet_chars: int = 0
+) -> List[Dict[str, Any]]:
+    """
+    Async variant of search_hybrid for the API.
+
+    Uses the backend's async path (the Postgres backend's async pool)
+    so the event loop is not blocked on the RPC.
+    """
+    plan, results = _prepare_search(query, top_k, threshold, k_constant, fields, snippet_chars)
+
+    rows = None
+    if results is None:
+        with stage_timer("rpc"):
+            rows = await get_storage_backend().amatch_chunks(plan["rpc_name"], plan["params"], plan["columns"])
+
+    with stage_timer("format"):
+        if rows is not None:
+            results = _finish_search(plan, rows)
+        return shape_results(results, query, fields, snippet_chars)
+
+
+def shape_results(
+    results: List[Dict[str, Any]],
+    query: str,
+    fields: Optional[List[str]] = None,
+    snippet_chars: int = 0
+) -> List[Dict[str, Any]]:
+    """
+    Apply snippet extraction and field projection to formatted results.
+
+    Runs after caching because snippets depend on the exact query text.
+    """
+    if fields is None and not snippet_chars:
+        return results
+
+    shaped = []
+    for result in results:
+        if fields is None:
+            item = dict(result)
+        else:
+            item = {f: result.get(f) for f in IDENTITY_FIELDS}
+            item.update((f, result[f]) for f in fields if f in result)
+        if snippet_chars:
+            item["snippet"] = extract_snippet(result["content"], query, snippet_chars)
+        shaped.append(item)
+    return shaped
@@ -0,0 +1,68 @@
+"""Cross-process invalidation stamp for cached search results."""
+
+import asyncio
+from typing import Awaitable, Callable, Optional
+
+from ..config import config
+from .background import BackgroundFlusher
+from .cache import query_cache
+from .storage import get_storage_backend
+
+GenerationFetcher = Callable[[], Awaitable[Optional[int]]]
+
+
+async def fetch_search_generation() -> Optional[int]:
+    """Current stamp from kb_search_generation (migration 012)."""
+    rows = await get_storage_backend().acall_rpc("kb_search_generation", {})
+    return rows[0]["generation"] if rows else None
+
+
+class SearchGeneration(BackgroundFlusher):
+    """
+    Polls the searchable-content generation every flush_interval seconds.
+
+    The database bumps the stamp whenever a document enters or leaves the
+    searchable set (a version completes, is superseded or is deleted), no
+    matter which process made the change. search_hybrid keys the semantic
+    cache by `value`, so entries cached before the change stop matching
+    on every worker within one poll interval.
+    """
+
+    def __init__(self, fetch: GenerationFetcher, flush_interval: float = 5.0):
+        super().__init__(flush_interval)
+        self.fetch = fetch
+        self.value: Optional[int] = None
+
+    async def flush(self) -> int:
+        """Refresh `value`; returns 1 if it changed."""
+        try:
+            value = await self.fetch()
+        except Exception as e:
+            print(f"Warning: Search generation poll failed: {e}")
+            return 0
+
+        if value == self.value:
+            return 0
+        if self.value is not None:
+            # Old entries can no longer match; free them now
+            query_cache.invalidate()
+        self.value = value
+        return 1
+
+    async def start(self) -> None:
+        """
+        Read the stamp, then poll in the background (lifespan startup).
+
+        The first read happens before startup cache warm-up so warmed
+        entries carry the current stamp; it is bounded by flush_interval
+        so an unreachable database does not hold startup.
+        """
+        try:
+            await asyncio.wait_for(self.flush(), timeout=self.flush_interval)
+        except asyncio.TimeoutError:
+            print("Warning: Search generation read timed out; polling in the background")
+        await super().start()
+
+
+# Shared stamp for search_hybrid
+search_generation = SearchGeneration(fetch_search_generation, config.search_generation_poll_interval)
@@ -0,0 +1,79 @@
+"""Search response encoding without per-row model validation.
+
+Results from format_results() already have SearchResult's types, so the
+API maps them onto the schema's keys and encodes once with orjson instead
+of building a SearchResult per row, a SearchResponse around them and
+re-serializing through FastAPI's response_model.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import orjson
+from fastapi.responses import Response
+
+from ..models.schemas import SearchResult
+
+# Response keys, in schema order
+RESULT_FIELDS = tuple(SearchResult.model_fields)
+
+# Scores may come back from the RPC as ints (e.g. a 0 bm25_score); the
+# models dump them as floats
+FLOAT_FIELDS = ("semantic_score", "bm25_score", "hybrid_score", "score")
+
+
+def result_payload(result: Dict[str, Any], projected: bool = False) -> Dict[str, Any]:
+    """
+    One formatted result as the SearchResult JSON object.
+
+    Args:
+        result: Formatted (and shaped) result
+        projected: The result is already projected to the requested
+            fields; keep its keys and only normalize the scores
+    """
+    if projected:
+        payload = dict(result)
+    else:
+        payload = {field: result.get(field) for field in RESULT_FIELDS}
+    for field in FLOAT_FIELDS:
+        value = payload.get(field)
+        if value is not None and not isinstance(value, float):
+            payload[field] = float(value)
+    return payload
+
+
+def search_payload(
+    query: str,
+    results: List[Dict[str, Any]],
+    next_cursor: Optional[str] = None,
+    projected: bool = False
+) -> Dict[str, Any]:
+    """
+    SearchResponse as plain JSON types.
+
+    Args:
+        query: Query text echoed back
+        results: Formatted (and shaped) results
+        next_cursor: Cursor for the next page, if any
+        projected: Results are already projected to the requested
+            fields; keep their keys
+    """
+    return {
+        "query": query,
+        "results": [result_payload(r, projected) for r in results],
+        "count": len(results),
+        "next_cursor": next_cursor
+    }
+
+
+def dumps(content: Any) -> bytes:
+    """Compact UTF-8 JSON."""
+    return orjson.dumps(content)
+
+
+class FastJSONResponse(Response):
+    """JSONResponse encoded with orjson."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
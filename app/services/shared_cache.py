@@ -0,0 +1,191 @@
+"""TTL cache shared by all worker processes through a SQLite file.
+
+With the file on a tmpfs (/dev/shm), the database pages live in shared
+memory and are mmap'd by every worker, so a cached embedding or vision
+result is stored once per replica instead of once per worker.
+"""
+
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Hashable, Optional
+
+from .metrics import record_cache
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS kb_cache (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID
+"""
+
+# Trim expired / overflowing entries every N writes rather than on each set
+TRIM_EVERY = 64
+
+# ... or sooner once this fraction of max_bytes was written since the last trim
+TRIM_BYTES_FRACTION = 16
+
+# Lookups run on the event loop: wait at most this long for another
+# worker's write lock, then treat the lookup as a miss (or skip the write)
+BUSY_TIMEOUT_SECONDS = 0.05
+
+
+class SharedCache:
+    """
+    Bounded TTL cache stored in a SQLite file (one namespace per cache).
+
+    Same get/set/pop/clear surface as TTLCache. Keys are stored as
+    str(key) and values are pickled. Eviction is approximate: expired
+    entries and the entries closest to expiry are trimmed in batches.
+    max_bytes bounds the pickled values of the whole file (all
+    namespaces), so the cache stays inside a fixed-size /dev/shm.
+    An operation that cannot get the database within
+    BUSY_TIMEOUT_SECONDS counts as a miss (or is dropped) instead of
+    blocking the caller.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        namespace: str,
+        maxsize: int,
+        ttl: float,
+        clock: Callable[[], float] = time.time,
+        name: Optional[str] = None,
+        max_bytes: Optional[int] = None
+    ):
+        self.path = path
+        self.namespace = namespace
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.name = name
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._bytes_since_trim = 0
+        self._warned_full = False
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Per-process connection (reopened after fork)."""
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_SECONDS, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")  # Cache contents are disposable
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute(_SCHEMA)
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    def record(self, hit: bool) -> None:
+        """Count a lookup result."""
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        if self.name:
+            record_cache(self.name, hit)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a live entry or default."""
+        try:
+            with self._lock:
+                row = self._connection().execute(
+                    "SELECT value, expires_at FROM kb_cache WHERE namespace = ? AND key = ?",
+                    (self.namespace, str(key))
+                ).fetchone()
+        except sqlite3.OperationalError:
+            row = None  # Locked by another worker
+        if row is None or row[1] <= self.clock():
+            self.record(hit=False)
+            return default
+        self.record(hit=True)
+        return pickle.loads(row[0])
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value for all workers."""
+        expires_at = self.clock() + (self.ttl if ttl is None else ttl)
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO kb_cache (namespace, key, value, size, expires_at) VALUES (?, ?, ?, ?, ?)",
+                    (self.namespace, str(key), blob, len(blob), expires_at)
+                )
+                self._writes += 1
+                self._bytes_since_trim += len(blob)
+                if self._writes % TRIM_EVERY == 0 or (
+                    self.max_bytes and self._bytes_since_trim * TRIM_BYTES_FRACTION >= self.max_bytes
+                ):
+                    self._trim(conn)
+        except sqlite3.OperationalError as e:
+            # Locked by another worker: the value is recomputed later. A
+            # full tmpfs is worth a warning (the budget does not fit it)
+            if "full" in str(e) and not self._warned_full:
+                self._warned_full = True
+                print(f"Warning: Shared cache {self.path} is full; lower SHARED_CACHE_MAX_BYTES or enlarge /dev/shm")
+
+    def _trim(self, conn: sqlite3.Connection) -> None:
+        conn.execute(
+            "DELETE FROM kb_cache WHERE namespace = ? AND expires_at <= ?",
+            (self.namespace, self.clock())
+        )
+        (count,) = conn.execute("SELECT COUNT(*) FROM kb_cache WHERE namespace = ?", (self.namespace,)).fetchone()
+        if count > self.maxsize:
+            conn.execute(
+                "DELETE FROM kb_cache WHERE namespace = ? AND key IN ("
+                "SELECT key FROM kb_cache WHERE namespace = ? ORDER BY expires_at LIMIT ?)",
+                (self.namespace, self.namespace, count - self.maxsize)
+            )
+        if self.max_bytes:
+            # Keep the entries furthest from expiry that fit in the budget
+            conn.execute(
+                "DELETE FROM kb_cache WHERE (namespace, key) IN ("
+                "SELECT namespace, key FROM ("
+                "SELECT namespace, key, SUM(size) OVER (ORDER BY expires_at DESC, namespace, key) AS total "
+                "FROM kb_cache) WHERE total > ?)",
+                (self.max_bytes,)
+            )
+        self._bytes_since_trim = 0
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove an entry and return its value (default if it is locked)."""
+        params = (self.namespace, str(key))
+        try:
+            with self._lock:
+                conn = self._connection()
+                row = conn.execute("SELECT value FROM kb_cache WHERE namespace = ? AND key = ?", params).fetchone()
+                conn.execute("DELETE FROM kb_cache WHERE namespace = ? AND key = ?", params)
+        except sqlite3.OperationalError:
+            return default
+        return default if row is None else pickle.loads(row[0])
+
+    def clear(self) -> None:
+        """Drop every entry in this namespace (for all workers); skipped if locked."""
+        try:
+            with self._lock:
+                self._connection().execute("DELETE FROM kb_cache WHERE namespace = ?", (self.namespace,))
+        except sqlite3.OperationalError as e:
+            print(f"Warning: Could not clear shared cache {self.namespace}: {e}")
+
+    def __len__(self) -> int:
+        try:
+            with self._lock:
+                (count,) = self._connection().execute(
+                    "SELECT COUNT(*) FROM kb_cache WHERE namespace = ? AND expires_at > ?",
+                    (self.namespace, self.clock())
+                ).fetchone()
+        except sqlite3.OperationalError:
+            return 0
+        return count
@@ -0,0 +1,80 @@
+"""Query-centred snippet extraction with highlight offsets."""
+
+import re
+from typing import Any, Dict, List, Tuple
+
+# Query terms shorter than this are too noisy to highlight
+MIN_TERM_LENGTH = 2
+
+
+def query_terms(query: str) -> List[str]:
+    """Lowercased, de-duplicated query words."""
+    terms = []
+    for word in re.findall(r"\w+", query.lower()):
+        if len(word) >= MIN_TERM_LENGTH and word not in terms:
+            terms.append(word)
+    return terms
+
+
+def _find_hits(content: str, terms: List[str]) -> List[Tuple[int, int]]:
+    """Non-overlapping (start, end) spans of term matches, in order."""
+    if not terms:
+        return []
+    # Longest terms first so "checklists" wins over "checklist"
+    pattern = "|".join(re.escape(t) for t in sorted(terms, key=len, reverse=True))
+    return [m.span() for m in re.finditer(pattern, content, flags=re.IGNORECASE)]
+
+
+def _best_window(hits: List[Tuple[int, int]], max_chars: int) -> Tuple[int, int]:
+    """Index range of hits that fits in max_chars and covers the most hits."""
+    best = (0, 0)
+    j = 0
+    for i in range(len(hits)):
+        j = max(j, i)
+        while j + 1 < len(hits) and hits[j + 1][1] - hits[i][0] <= max_chars:
+            j += 1
+        if j - i > best[1] - best[0]:
+            best = (i, j)
+    return best
+
+
+def extract_snippet(content: str, query: str, max_chars: int = 200) -> Dict[str, Any]:
+    """
+    Cut a bounded excerpt around the densest cluster of query terms.
+
+    Args:
+        content: Full chunk content
+        query: Search query
+        max_chars: Maximum excerpt length
+
+    Returns:
+        Dict with text, offset (start of text within content) and
+        highlights ([start, end) pairs relative to text)
+    """
+    if len(content) <= max_chars:
+        start, end = 0, len(content)
+    else:
+        hits = _find_hits(content, query_terms(query))
+        if hits:
+            first, last = _best_window(hits, max_chars)
+            span_start, span_end = hits[first][0], hits[last][1]
+            # Centre the covered hits inside the window
+            start = span_start - (max_chars - (span_end - span_start)) // 2
+            start = max(0, min(start, len(content) - max_chars))
+        else:
+            start = span_start = span_end = 0
+        end = start + max_chars
+
+        # Snap to word boundaries without cutting into the covered hits
+        if start > 0:
+            space = content.find(" ", start, min(start + max_chars // 4, span_start))
+            if space != -1:
+                start = space + 1
+        if end < len(content):
+            space = content.rfind(" ", max(end - max_chars // 4, span_end), end)
+            if space != -1:
+                end = space
+
+    text = content[start:end]
+    highlights = [[s, e] for s, e in _find_hits(text, query_terms(query))]
+    return {"text": text, "offset": start, "highlights": highlights}
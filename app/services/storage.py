@@ -1,17 +1,107 @@
-"""Supabase storage helper."""
+"""Storage backends: Supabase (PostgREST) or direct Postgres."""
 
 from functools import lru_cache
-from supabase import create_client, Client
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+
+from fastapi.concurrency import run_in_threadpool
 from ..config import config
 
+if TYPE_CHECKING:
+    from supabase import Client
+
 
 @lru_cache()
-def get_supabase_client() -> Client:
-    """Get cached Supabase client instance."""
+def get_supabase_client() -> "Client":
+    """Get cached Supabase client instance (imports the SDK on first call)."""
     if not config.supabase_url or not config.supabase_service_role_key:
         raise ValueError("Supabase credentials not configured")
 
+    from supabase import create_client
+
     return create_client(
         config.supabase_url,
         config.supabase_service_role_key
     )
+
+
+class SupabaseBackend:
+    """Search RPCs and writes over PostgREST HTTP."""
+
+    def match_chunks(self, rpc_name: str, params: Dict[str, Any], columns: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """Call a hybrid search RPC, selecting only `columns` if given."""
+        rpc = get_supabase_client().rpc(rpc_name, params)
+        if columns:
+            rpc = rpc.select(*columns)
+        return rpc.execute().data
+
+    async def amatch_chunks(self, rpc_name: str, params: Dict[str, Any], columns: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """Async wrapper; the Supabase client is sync, so run it in the threadpool."""
+        return await run_in_threadpool(self.match_chunks, rpc_name, params, columns)
+
+    def call_rpc(self, name: str, params: Dict[str, Any]) -> Any:
+        """Call a database function and return its result."""
+        return get_supabase_client().rpc(name, params).execute().data
+
+    async def acall_rpc(self, name: str, params: Dict[str, Any]) -> Any:
+        """Async wrapper around call_rpc."""
+        return await run_in_threadpool(self.call_rpc, name, params)
+
+    def insert_rows(self, table: str, rows: List[Dict[str, Any]]) -> None:
+        """Batch insert rows into a table."""
+        if rows:
+            get_supabase_client().table(table).insert(rows).execute()
+
+    def insert_row(self, table: str, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Insert one row and return it as stored (with generated columns)."""
+        return get_supabase_client().table(table).insert(row).execute().data[0]
+
+    def select_rows(self, table: str, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Rows of a table matching equality filters."""
+        query = get_supabase_client().table(table).select("*")
+        for column, value in filters.items():
+            query = query.eq(column, value)
+        return query.execute().data
+
+    def update_rows(self, table: str, values: Dict[str, Any], filters: Dict[str, Any]) -> None:
+        """Set `values` on the rows matching equality filters."""
+        query = get_supabase_client().table(table).update(values)
+        for column, value in filters.items():
+            query = query.eq(column, value)
+        query.execute()
+
+    async def ainsert_rows(self, table: str, rows: List[Dict[str, Any]]) -> None:
+        """Async wrapper around insert_rows."""
+        await run_in_threadpool(self.insert_rows, table, rows)
+
+    async def awarm(self) -> None:
+        """Import the SDK and build the client off the event loop."""
+        await run_in_threadpool(get_supabase_client)
+
+    async def aclose(self) -> None:
+        """Nothing to release; the HTTP client is shared."""
+
+
+@lru_cache()
+def get_storage_backend():
+    """
+    Get the configured storage backend.
+
+    STORAGE_BACKEND=supabase (default) uses PostgREST; postgres connects
+    to DATABASE_URL through connection pools.
+    """
+    if config.storage_backend == "postgres":
+        if not config.database_url:
+            raise ValueError("DATABASE_URL not configured for postgres storage backend")
+
+        from .postgres import PostgresBackend
+
+        return PostgresBackend(
+            config.database_url,
+            min_size=config.db_pool_min_size,
+            max_size=config.db_pool_max_size
+        )
+
+    if config.storage_backend != "supabase":
+        raise ValueError(f"Unknown storage backend: {config.storage_backend}")
+
+    return SupabaseBackend()
@@ -2,7 +2,7 @@
 
 import hashlib
 from typing import Dict, Any, List
-from .storage import get_supabase_client
+from .storage import get_storage_backend
 
 
 def detect_changes(old_content: str, new_content: str) -> bool:
@@ -14,20 +14,13 @@ def detect_changes(old_content: str, new_content: str) -> bool:
 
 def create_version(document_id: str, new_content: str, metadata: Dict[str, Any] = None) -> str:
     """Create new document version."""
-    supabase = get_supabase_client()
+    storage = get_storage_backend()
 
     # Get current document
-    current_doc = supabase.table("kb_documents")\
-        .select("*")\
-        .eq("id", document_id)\
-        .execute()\
-        .data[0]
+    current_doc = storage.select_rows("kb_documents", {"id": document_id})[0]
 
     # Mark old version as not latest
-    supabase.table("kb_documents")\
-        .update({"is_latest": False})\
-        .eq("id", document_id)\
-        .execute()
+    storage.update_rows("kb_documents", {"is_latest": False}, {"id": document_id})
 
     # Create new version
     new_version = {
@@ -45,8 +38,8 @@ def create_version(document_id: str, new_content: str, metadata: Dict[str, Any]
     if metadata:
         new_version.update(metadata)
 
-    response = supabase.table("kb_documents")\
-        .insert(new_version)\
-        .execute()
+    stored = storage.insert_row("kb_documents", new_version)
 
-    return response.data[0]["id"]
+    # Cached search results are invalidated on every API worker once the
+    # version is marked completed (kb_search_generation, migration 012)
+    return stored["id"]
@@ -5,13 +5,26 @@ auto-scores by type for quality filtering.
 """
 
 import base64
+import hashlib
 from typing import Dict, Any
-from google import genai
 
 from ..config import config
+from .cache import vision_cache
+from .metrics import VISION_CALLS, VISION_UPLOAD_BYTES
+
+# Gemini client, created on first use (google-genai is slow to import)
+client = None
+
+
+def get_client():
+    """Get the shared Gemini client, importing the SDK on first call."""
+    global client
+    if client is None:
+        from google import genai
+
+        client = genai.Client(api_key=config.gemini_api_key)
+    return client
 
-# Initialize Gemini client
-client = genai.Client(api_key=config.gemini_api_key)
 
 # Quality scoring by image type
 QUALITY_SCORES = {
@@ -38,6 +51,7 @@ def classify_image(image_bytes: bytes) -> str:
     """
     # Encode image to base64
     image_b64 = base64.b64encode(image_bytes).decode('utf-8')
+    VISION_UPLOAD_BYTES.inc(len(image_bytes))
 
     prompt = """Classify this image into ONE of these categories:
 - chart: Bar chart, line graph, pie chart, any data visualization
@@ -49,7 +63,7 @@ def classify_image(image_bytes: bytes) -> str:
 
 Return ONLY the category name, no explanation."""
 
-    response = client.models.generate_content(
+    response = get_client().models.generate_content(
         model="gemini-2.0-flash-exp",
         contents=[
             {
@@ -90,6 +104,7 @@ def extract_image_content(image_bytes: bytes, image_type: str) -> str:
         Extracted text content
     """
     image_b64 = base64.b64encode(image_bytes).decode('utf-8')
+    VISION_UPLOAD_BYTES.inc(len(image_bytes))
 
     # Type-specific extraction prompts
     prompts = {
@@ -102,7 +117,7 @@ def extract_image_content(image_bytes: bytes, image_type: str) -> str:
 
     prompt = prompts.get(image_type, "Extract all text and relevant information from this image.")
 
-    response = client.models.generate_content(
+    response = get_client().models.generate_content(
         model="gemini-2.0-flash-exp",
         contents=[
             {
@@ -140,14 +155,23 @@ def process_image(image_bytes: bytes) -> Dict[str, Any]:
     """
     Full pipeline: classify, extract, score.
 
+    Results are cached by image hash, so an image seen before (by any
+    worker when the shared cache is on) skips the Gemini calls.
+
     Args:
         image_bytes: Raw image bytes
 
     Returns:
         Dict with type, quality_score, extracted_text, should_index
     """
+    image_hash = hashlib.sha256(image_bytes).hexdigest()
+    cached = vision_cache.get(image_hash)
+    if cached is not None:
+        return dict(cached)
+
     # Step 1: Classify
     image_type = classify_image(image_bytes)
+    VISION_CALLS.labels(image_type).inc()
 
     # Step 2: Get quality score
     quality_score = get_quality_score_for_type(image_type)
@@ -159,9 +183,11 @@ def process_image(image_bytes: bytes) -> Dict[str, Any]:
     if should_index:
         extracted_text = extract_image_content(image_bytes, image_type)
 
-    return {
+    result = {
         "type": image_type,
         "quality_score": quality_score,
         "extracted_text": extracted_text,
         "should_index": should_index
     }
+    vision_cache.set(image_hash, result)
+    return dict(result)
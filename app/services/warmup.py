@@ -0,0 +1,114 @@
+"""Startup cache warm-up from the most frequent logged queries."""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from ..models.schemas import SearchRequest
+from .search import asearch_hybrid
+from .storage import get_storage_backend
+
+QueryFetcher = Callable[[int, int], Awaitable[List[str]]]
+QueryRunner = Callable[[str], Awaitable[Any]]
+
+
+async def fetch_top_queries(limit: int, days: int) -> List[str]:
+    """Most frequent recent queries from kb_query_log (migration 011)."""
+    rows = await get_storage_backend().acall_rpc("kb_top_queries", {
+        "since_days": days,
+        "query_limit": limit
+    })
+    return [row["query"] for row in rows or [] if row.get("query")]
+
+
+async def warm_query(query: str) -> None:
+    """Search with the API's request defaults so the cache entry matches real requests."""
+    request = SearchRequest(query=query)
+    await asearch_hybrid(request.query, top_k=request.top_k, threshold=request.threshold)
+
+
+class CacheWarmer:
+    """
+    Pre-computes embeddings and results for popular queries.
+
+    status moves from "idle" to "warming", then to "ready", "timed_out"
+    or "failed". Only "warming" holds back readiness: a slow or broken
+    warm-up must not keep a replica out of rotation.
+    """
+
+    def __init__(self, fetch: QueryFetcher = fetch_top_queries, run: QueryRunner = warm_query):
+        self.fetch = fetch
+        self.run = run
+        self.status = "idle"
+        self.total = 0
+        self.warmed = 0
+        self.failed = 0
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.status != "warming"
+
+    async def _warm_all(self, queries: List[str], concurrency: int) -> None:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def warm(query: str) -> None:
+            async with semaphore:
+                try:
+                    await self.run(query)
+                    self.warmed += 1
+                except Exception as e:
+                    self.failed += 1
+                    print(f"Warning: Warm-up failed for query {query!r}: {e}")
+
+        await asyncio.gather(*(warm(q) for q in queries))
+
+    async def warm(
+        self,
+        limit: int = 100,
+        days: int = 7,
+        concurrency: int = 4,
+        timeout: float = 30.0
+    ) -> str:
+        """
+        Warm caches with the top `limit` queries of the last `days` days.
+
+        Returns:
+            Final status
+        """
+        self.status = "warming"
+        self.total = self.warmed = self.failed = 0
+        self.started_at = time.monotonic()
+
+        async def warm_top_queries() -> None:
+            queries = await self.fetch(limit, days)
+            self.total = len(queries)
+            await self._warm_all(queries, concurrency)
+
+        try:
+            await asyncio.wait_for(warm_top_queries(), timeout=timeout)
+            self.status = "ready"
+        except asyncio.TimeoutError:
+            self.status = "timed_out"
+        except Exception as e:
+            print(f"Warning: Cache warm-up failed: {e}")
+            self.status = "failed"
+        finally:
+            self.finished_at = time.monotonic()
+            if self.status == "warming":
+                # Cancelled (shutdown)
+                self.status = "failed"
+        return self.status
+
+    def report(self) -> Dict[str, Any]:
+        """Progress for /health."""
+        report = {"status": self.status, "queries": self.total, "warmed": self.warmed, "failed": self.failed}
+        if self.started_at is not None:
+            end = self.finished_at if self.finished_at is not None else time.monotonic()
+            report["seconds"] = round(end - self.started_at, 2)
+        return report
+
+
+# Shared warmer started from the app lifespan
+cache_warmer = CacheWarmer()
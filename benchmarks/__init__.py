@@ -0,0 +1 @@
+"""Offline performance benchmarks (not collected by pytest)."""
@@ -0,0 +1,77 @@
+"""Diff two benchmark baselines written by benchmarks.suite.
+
+    python -m benchmarks.compare baseline.json current.json --tolerance 0.10
+
+Exits with status 1 if any metric regressed by more than the tolerance
+(latency or RSS up, throughput down), so it can gate CI.
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, List
+
+# Metric -> True if higher is better
+METRICS = {
+    "docs_per_s": True,
+    "requests_per_s": True,
+    "imports_per_s": True,
+    "responses_per_s": True,
+    "p50_ms": False,
+    "p99_ms": False,
+    "peak_rss_mb": False
+}
+
+
+def compare(base: Dict[str, Any], current: Dict[str, Any], tolerance: float) -> List[Dict[str, Any]]:
+    """
+    Per-metric changes for benchmarks present in both baselines.
+
+    Returns:
+        Rows with benchmark, metric, base, current, change (fraction)
+        and regressed
+    """
+    rows = []
+    for name in sorted(set(base["results"]) & set(current["results"])):
+        before, after = base["results"][name], current["results"][name]
+        for metric, higher_is_better in METRICS.items():
+            if metric not in before or metric not in after or not before[metric]:
+                continue
+            change = (after[metric] - before[metric]) / before[metric]
+            worse = -change if higher_is_better else change
+            rows.append({
+                "benchmark": name,
+                "metric": metric,
+                "base": before[metric],
+                "current": after[metric],
+                "change": round(change, 4),
+                "regressed": worse > tolerance
+            })
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("base", help="Baseline JSON")
+    parser.add_argument("current", help="JSON to check against the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Allowed relative regression")
+    args = parser.parse_args()
+
+    with open(args.base, encoding="utf-8") as f:
+        base = json.load(f)
+    with open(args.current, encoding="utf-8") as f:
+        current = json.load(f)
+
+    rows = compare(base, current, args.tolerance)
+    print(f"base {base['meta'].get('commit')} -> current {current['meta'].get('commit')}")
+    print(f"{'benchmark':<16}{'metric':<16}{'base':>12}{'current':>12}{'change':>10}")
+    for row in rows:
+        flag = "  REGRESSED" if row["regressed"] else ""
+        print(f"{row['benchmark']:<16}{row['metric']:<16}{row['base']:>12}{row['current']:>12}{row['change']:>+10.1%}{flag}")
+
+    if any(row["regressed"] for row in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
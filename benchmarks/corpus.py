@@ -0,0 +1,175 @@
+"""Synthetic PPTX / PDF / DOCX documents for extraction benchmarks.
+
+Every document has `units` slides/pages/sections of filler text and
+`image_density` pictures per unit on average (0.5 = every other unit).
+Pictures are small noise PNGs/JPEGs so each one is distinct, as they
+are in real decks; identical images would be de-duplicated by the
+OOXML writers.
+"""
+
+import io
+import random
+import zlib
+from pathlib import Path
+from typing import List
+
+from PIL import Image
+
+WORDS = (
+    "store opening checklist payroll schedule inventory audit supplier "
+    "delivery temperature log cashier shift training onboarding policy "
+    "quarterly review franchise compliance safety incident report menu "
+    "pricing promotion marketing budget forecast"
+).split()
+
+
+def _sentence(rng: random.Random, words: int = 12) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _paragraph(rng: random.Random, sentences: int = 4) -> str:
+    return " ".join(_sentence(rng) for _ in range(sentences))
+
+
+def _images_for_unit(index: int, density: float) -> int:
+    """Spread density * units pictures evenly over the units."""
+    return int((index + 1) * density) - int(index * density)
+
+
+def _noise_image(rng: random.Random, size: int, fmt: str) -> bytes:
+    image = Image.frombytes("RGB", (size, size), rng.randbytes(size * size * 3))
+    buffer = io.BytesIO()
+    options = {"quality": 80} if fmt == "JPEG" else {}
+    image.save(buffer, format=fmt, **options)
+    return buffer.getvalue()
+
+
+def make_pptx(path: Path, units: int, image_density: float, seed: int = 0, image_size: int = 64) -> Path:
+    """Deck with a title, body text, speaker notes and pictures per slide."""
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    rng = random.Random(seed)
+    prs = Presentation()
+    layout = prs.slide_layouts[1]  # Title and Content
+
+    for index in range(units):
+        slide = prs.slides.add_slide(layout)
+        slide.shapes.title.text = _sentence(rng, 5)
+        slide.placeholders[1].text = _paragraph(rng)
+        slide.notes_slide.notes_text_frame.text = _sentence(rng)
+        for n in range(_images_for_unit(index, image_density)):
+            picture = io.BytesIO(_noise_image(rng, image_size, "PNG"))
+            slide.shapes.add_picture(picture, Inches(1 + n), Inches(5), width=Inches(1))
+
+    prs.save(str(path))
+    return path
+
+
+def make_docx(path: Path, units: int, image_density: float, seed: int = 0, image_size: int = 64) -> Path:
+    """Document with a heading, paragraphs and inline pictures per section."""
+    from docx import Document
+    from docx.shared import Inches
+
+    rng = random.Random(seed)
+    doc = Document()
+
+    for index in range(units):
+        doc.add_heading(_sentence(rng, 5), level=2)
+        for _ in range(3):
+            doc.add_paragraph(_paragraph(rng))
+        for _ in range(_images_for_unit(index, image_density)):
+            doc.add_picture(io.BytesIO(_noise_image(rng, image_size, "PNG")), width=Inches(1))
+
+    doc.save(str(path))
+    return path
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(path: Path, units: int, image_density: float, seed: int = 0, image_size: int = 64) -> Path:
+    """
+    PDF with text lines and JPEG XObjects per page.
+
+    Written directly (Helvetica text, DCTDecode images) so no PDF
+    authoring library is needed.
+    """
+    rng = random.Random(seed)
+    objects: List[bytes] = []
+
+    def add(body: bytes) -> int:
+        objects.append(body)
+        return len(objects)
+
+    def stream(header: str, data: bytes) -> bytes:
+        return f"<< {header} /Length {len(data)} >>\nstream\n".encode() + data + b"\nendstream"
+
+    catalog = add(b"")  # Filled in once the page tree exists
+    pages = add(b"")
+    font = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    page_ids = []
+
+    for index in range(units):
+        lines = [_sentence(rng) for _ in range(20)]
+        content = ["BT /F1 10 Tf 50 780 Td 14 TL"]
+        content += [f"({_pdf_escape(line)}) '" for line in lines]
+        content.append("ET")
+
+        xobjects = []
+        for n in range(_images_for_unit(index, image_density)):
+            jpeg = _noise_image(rng, image_size, "JPEG")
+            image = add(stream(
+                f"/Type /XObject /Subtype /Image /Width {image_size} /Height {image_size} "
+                "/ColorSpace /DeviceRGB /BitsPerComponent 8 /Filter /DCTDecode",
+                jpeg
+            ))
+            xobjects.append(f"/Im{n} {image} 0 R")
+            content.append(f"q 72 0 0 72 {50 + n * 80} 100 cm /Im{n} Do Q")
+
+        data = zlib.compress("\n".join(content).encode("latin-1"))
+        contents = add(stream("/Filter /FlateDecode", data))
+        resources = f"/Font << /F1 {font} 0 R >>"
+        if xobjects:
+            resources += f" /XObject << {' '.join(xobjects)} >>"
+        page_ids.append(add(
+            f"<< /Type /Page /Parent {pages} 0 R /MediaBox [0 0 612 842] "
+            f"/Resources << {resources} >> /Contents {contents} 0 R >>".encode()
+        ))
+
+    objects[catalog - 1] = f"<< /Type /Catalog /Pages {pages} 0 R >>".encode()
+    kids = " ".join(f"{p} 0 R" for p in page_ids)
+    objects[pages - 1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode()
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(out.tell())
+        out.write(f"{number} 0 obj\n".encode() + body + b"\nendobj\n")
+    xref = out.tell()
+    out.write(f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode())
+    for offset in offsets:
+        out.write(f"{offset:010d} 00000 n \n".encode())
+    out.write(f"trailer\n<< /Size {len(objects) + 1} /Root {catalog} 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode())
+
+    path.write_bytes(out.getvalue())
+    return path
+
+
+GENERATORS = {
+    "pptx": make_pptx,
+    "pdf": make_pdf,
+    "docx": make_docx
+}
+
+
+def make_corpus(directory: Path, file_type: str, documents: int, units: int, image_density: float, seed: int = 0) -> List[Path]:
+    """Write `documents` synthetic files of one type; returns their paths."""
+    directory.mkdir(parents=True, exist_ok=True)
+    generate = GENERATORS[file_type]
+    return [
+        generate(directory / f"doc_{i:03d}.{file_type}", units, image_density, seed=seed + i)
+        for i in range(documents)
+    ]
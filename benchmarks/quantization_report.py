@@ -0,0 +1,204 @@
+"""Recall-vs-latency report: quantized two-stage search vs full precision.
+
+Offline (default) - synthetic clustered 768-d vectors, pure Python:
+    python -m benchmarks.quantization_report --corpus 2000 --queries 50
+
+Offline, int8 is reported for recall only: scoring int8 codes in pure
+Python is no cheaper than scoring floats, so its latency would say
+nothing about quantization (and migration 009 stores halfvec and sign
+bits, not int8). The sign-bit prefilter's latency is meaningful, since
+popcount on packed ints is much cheaper than a float scan.
+
+Live - compare the RPCs from migrations 008 and 009 on the configured
+Supabase project, using queries from a text file (one per line):
+    python -m benchmarks.quantization_report --live --queries-file queries.txt
+
+--live needs real query embeddings; it refuses to run while
+generate_embedding is still the zero-vector placeholder.
+"""
+
+import argparse
+import json
+import random
+import statistics
+import time
+from typing import Dict, List, Optional, Sequence
+
+from app.services.quantization import (
+    binary_signature,
+    hamming_distance,
+    norm,
+    quantize_int8,
+    rescore,
+)
+
+DIMENSIONS = 768
+
+
+def _synthetic_corpus(size: int, clusters: int, seed: int) -> List[List[float]]:
+    """Gaussian clusters so nearest neighbours are meaningful."""
+    rng = random.Random(seed)
+    centres = [[rng.gauss(0, 1) for _ in range(DIMENSIONS)] for _ in range(clusters)]
+    corpus = []
+    for _ in range(size):
+        centre = rng.choice(centres)
+        corpus.append([c + rng.gauss(0, 0.6) for c in centre])
+    return corpus
+
+
+def _recall(expected: Sequence[str], actual: Sequence[str]) -> float:
+    if not expected:
+        return 1.0
+    return len(set(expected) & set(actual)) / len(expected)
+
+
+def _summarize(name: str, recalls: List[float], latencies: Optional[List[float]], bytes_per_vector: int) -> Dict:
+    """Report row; latencies=None leaves p50/p99 out (recall-only methods)."""
+    row = {
+        "method": name,
+        "recall_at_k": round(statistics.mean(recalls), 4),
+        "p50_ms": None,
+        "p99_ms": None,
+        "bytes_per_vector": bytes_per_vector,
+    }
+    if latencies is not None:
+        latencies = sorted(latencies)
+        row["p50_ms"] = round(latencies[len(latencies) // 2], 3)
+        row["p99_ms"] = round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))], 3)
+    return row
+
+
+def _signed_codes(codes: bytes) -> List[int]:
+    """int8 codes as signed ints (what an int8 index stores)."""
+    return [c - 256 if c > 127 else c for c in codes]
+
+
+def run_offline(corpus_size: int, num_queries: int, top_k: int, multiplier: int, seed: int) -> List[Dict]:
+    """Exact scan vs int8 scan vs sign-bit prefilter, each followed by exact rescoring."""
+    corpus = _synthetic_corpus(corpus_size, clusters=max(1, corpus_size // 50), seed=seed)
+    ids = [str(i) for i in range(corpus_size)]
+    # Codes and their norms are computed once, at "index" time; the scale
+    # cancels out of cosine similarity, so the scan scores codes directly
+    int8_codes = [_signed_codes(quantize_int8(v)[0]) for v in corpus]
+    int8_norms = [norm(codes) or 1.0 for codes in int8_codes]
+    signatures = [binary_signature(v) for v in corpus]
+    queries = _synthetic_corpus(num_queries, clusters=max(1, corpus_size // 50), seed=seed + 1)
+    candidate_count = top_k * multiplier
+
+    results = {"exact": ([], []), "int8+rescore": ([], []), "binary+rescore": ([], [])}
+
+    for query in queries:
+        start = time.perf_counter()
+        exact = rescore(query, list(zip(ids, corpus)), top_k)
+        results["exact"][1].append((time.perf_counter() - start) * 1000)
+        expected = [item_id for item_id, _ in exact]
+        results["exact"][0].append(1.0)
+
+        # Recall only (see module docstring)
+        coarse = sorted(
+            range(corpus_size),
+            key=lambda i: sum(q * c for q, c in zip(query, int8_codes[i])) / int8_norms[i],
+            reverse=True
+        )[:candidate_count]
+        found = rescore(query, [(ids[i], corpus[i]) for i in coarse], top_k)
+        results["int8+rescore"][0].append(_recall(expected, [item_id for item_id, _ in found]))
+
+        start = time.perf_counter()
+        query_signature = binary_signature(query)
+        coarse = sorted(range(corpus_size), key=lambda i: hamming_distance(query_signature, signatures[i]))[:candidate_count]
+        found = rescore(query, [(ids[i], corpus[i]) for i in coarse], top_k)
+        results["binary+rescore"][1].append((time.perf_counter() - start) * 1000)
+        results["binary+rescore"][0].append(_recall(expected, [item_id for item_id, _ in found]))
+
+    bytes_per_vector = {"exact": DIMENSIONS * 4, "int8+rescore": DIMENSIONS + 4, "binary+rescore": DIMENSIONS // 8}
+    return [
+        _summarize(name, r, lat if name != "int8+rescore" else None, bytes_per_vector[name])
+        for name, (r, lat) in results.items()
+    ]
+
+
+def run_live(queries: List[str], top_k: int, multiplier: int) -> List[Dict]:
+    """
+    Call match_chunks_hybrid_rrf and the quantized variants for each query.
+
+    Raises:
+        ValueError: If query embeddings are all zeros (placeholder
+            generate_embedding); every ranking would then be arbitrary
+    """
+    from app.services.embeddings import generate_embedding
+    from app.services.storage import get_supabase_client
+
+    embeddings = [generate_embedding(query, task_type="RETRIEVAL_QUERY") for query in queries]
+    if not any(any(embedding) for embedding in embeddings):
+        raise ValueError(
+            "generate_embedding returned zero vectors (placeholder model); "
+            "live recall would be meaningless until a real embedding model is wired in"
+        )
+
+    supabase = get_supabase_client()
+    runs = {"match_chunks_hybrid_rrf": ([], []), "halfvec": ([], []), "binary": ([], [])}
+
+    for query, embedding in zip(queries, embeddings):
+        params = {
+            "query_embedding": embedding,
+            "query_text": query,
+            "match_threshold": 0.0,
+            "match_count": top_k,
+            "k_constant": 60
+        }
+
+        start = time.perf_counter()
+        baseline = supabase.rpc("match_chunks_hybrid_rrf", params).execute().data
+        runs["match_chunks_hybrid_rrf"][1].append((time.perf_counter() - start) * 1000)
+        runs["match_chunks_hybrid_rrf"][0].append(1.0)
+        expected = [row["chunk_id"] for row in baseline]
+
+        for quantization in ("halfvec", "binary"):
+            start = time.perf_counter()
+            rows = supabase.rpc(
+                "match_chunks_hybrid_rrf_quantized",
+                {**params, "quantization": quantization, "rescore_multiplier": multiplier}
+            ).execute().data
+            runs[quantization][1].append((time.perf_counter() - start) * 1000)
+            runs[quantization][0].append(_recall(expected, [row["chunk_id"] for row in rows]))
+
+    bytes_per_vector = {"match_chunks_hybrid_rrf": DIMENSIONS * 4, "halfvec": DIMENSIONS * 2, "binary": DIMENSIONS // 8}
+    return [_summarize(name, r, lat, bytes_per_vector[name]) for name, (r, lat) in runs.items()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--live", action="store_true", help="Query the configured Supabase project")
+    parser.add_argument("--queries-file", help="Queries for --live, one per line")
+    parser.add_argument("--corpus", type=int, default=2000, help="Offline corpus size")
+    parser.add_argument("--queries", type=int, default=50, help="Offline query count")
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--multiplier", type=int, default=4, help="Rescore candidates per result")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", help="Write the report as JSON")
+    args = parser.parse_args()
+
+    if args.live:
+        if not args.queries_file:
+            parser.error("--live requires --queries-file")
+        with open(args.queries_file, encoding="utf-8") as f:
+            queries = [line.strip() for line in f if line.strip()]
+        try:
+            report = run_live(queries, args.top_k, args.multiplier)
+        except ValueError as e:
+            parser.error(str(e))
+    else:
+        report = run_offline(args.corpus, args.queries, args.top_k, args.multiplier, args.seed)
+
+    print(f"{'method':<26}{'recall@k':>10}{'p50 ms':>10}{'p99 ms':>10}{'bytes/vec':>11}")
+    for row in report:
+        p50, p99 = (row[k] if row[k] is not None else "-" for k in ("p50_ms", "p99_ms"))
+        print(f"{row['method']:<26}{row['recall_at_k']:>10}{p50:>10}{p99:>10}{row['bytes_per_vector']:>11}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,363 @@
+"""Offline performance suite: extraction, vision stub and the search API.
+
+Generates synthetic PPTX/PDF/DOCX corpora, times the extractors with a
+stubbed process_image, times a cold import of the API and the encoding
+of one search response, and load-tests POST /api/search in-process
+against a stub Supabase RPC with injected latency. No network or
+credentials are needed.
+
+    python -m benchmarks.suite --output baseline.json
+    python -m benchmarks.suite --only search --requests 2000 --concurrency 32
+    python -m benchmarks.compare baseline.json current.json
+
+Each benchmark runs in a fresh process, so `peak_rss_mb` is that
+benchmark's own high-water mark.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from unittest.mock import patch
+
+from benchmarks.corpus import WORDS, make_corpus
+
+FILE_TYPES = ("pptx", "pdf", "docx")
+OOXML_TYPES = ("pptx", "docx")
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile of unsorted values."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+def peak_rss_mb(who: int = resource.RUSAGE_SELF) -> float:
+    """Peak resident set size of this process or its children (ru_maxrss is KiB on Linux, bytes on macOS)."""
+    peak = resource.getrusage(who).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _latency_summary(latencies_ms: List[float]) -> Dict[str, float]:
+    return {
+        "p50_ms": round(percentile(latencies_ms, 0.50), 3),
+        "p99_ms": round(percentile(latencies_ms, 0.99), 3)
+    }
+
+
+@contextmanager
+def stub_vision(latency_ms: float = 0.0) -> Iterator[List[int]]:
+    """Replace process_image with a fixed result after `latency_ms`; yields received sizes."""
+    sizes: List[int] = []
+
+    def process_image(image_bytes: bytes) -> Dict[str, Any]:
+        sizes.append(len(image_bytes))
+        if latency_ms:
+            time.sleep(latency_ms / 1000)
+        return {"type": "chart", "quality_score": 1.0, "extracted_text": "Revenue by quarter", "should_index": True}
+
+    with patch("app.services.vision.process_image", process_image):
+        yield sizes
+
+
+def bench_extraction(
+    file_type: str,
+    paths: List[str],
+    vision_latency_ms: float = 0.0,
+    process_images: bool = True,
+    fast: bool = False
+) -> Dict[str, Any]:
+    """Time one extractor over a corpus (one call per document)."""
+    from app.extractors.docx import extract_docx
+    from app.extractors.pdf import extract_pdf
+    from app.extractors.pptx import extract_pptx
+
+    extract = {"pptx": extract_pptx, "pdf": extract_pdf, "docx": extract_docx}[file_type]
+    latencies = []
+    with stub_vision(vision_latency_ms) as images:
+        start = time.perf_counter()
+        for path in paths:
+            t0 = time.perf_counter()
+            extract(path, process_images=process_images, **({"fast": True} if fast else {}))
+            latencies.append((time.perf_counter() - t0) * 1000)
+        elapsed = time.perf_counter() - start
+
+    return {
+        "documents": len(paths),
+        "images": len(images),
+        "docs_per_s": round(len(paths) / elapsed, 2),
+        "images_per_s": round(len(images) / elapsed, 2),
+        **_latency_summary(latencies),
+        "peak_rss_mb": peak_rss_mb()
+    }
+
+
+class StubRpc:
+    """Stands in for a PostgREST RPC builder: sleeps, then returns rows."""
+
+    def __init__(self, rows: List[Dict[str, Any]], latency_ms: float):
+        self.rows = rows
+        self.latency_ms = latency_ms
+
+    def select(self, *columns: str) -> "StubRpc":
+        return StubRpc([{c: row.get(c) for c in columns} for row in self.rows], self.latency_ms)
+
+    def execute(self) -> "StubRpc":
+        time.sleep(self.latency_ms / 1000)  # Blocking, like the real sync client
+        return self
+
+    @property
+    def data(self) -> List[Dict[str, Any]]:
+        return self.rows
+
+
+class StubSupabase:
+    """Client whose rpc() answers every search with `match_count` synthetic rows."""
+
+    def __init__(self, latency_ms: float, seed: int = 0, content_chars: int = 800):
+        self.latency_ms = latency_ms
+        rng = random.Random(seed)
+        self.content = [
+            " ".join(rng.choice(WORDS) for _ in range(content_chars // 8))[:content_chars]
+            for _ in range(50)
+        ]
+
+    def rpc(self, name: str, params: Dict[str, Any]) -> StubRpc:
+        rows = [
+            {
+                "chunk_id": f"00000000-0000-0000-0000-{i:012d}",
+                "document_id": f"00000000-0000-0000-0001-{i % 7:012d}",
+                "document_title": f"Manual {i % 7}",
+                "section_title": None,
+                "content": self.content[i % len(self.content)],
+                "source_path": f"Manual_{i % 7}.pptx",
+                "image_type": None,
+                "semantic_score": 0.9 - i * 0.01,
+                "bm25_score": 0.5,
+                "hybrid_score": 0.03 - i * 0.0005,
+                "document_date": "2026-01-01"
+            }
+            for i in range(params["match_count"])
+        ]
+        return StubRpc(rows, self.latency_ms)
+
+
+async def _load(requests: int, concurrency: int, top_k: int) -> Dict[str, Any]:
+    import httpx
+
+    from app.config import config
+    from app.main import app
+
+    headers = {"X-API-Key": config.api_key}
+    latencies: List[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        async def call(i: int) -> httpx.Response:
+            query = f"{WORDS[i % len(WORDS)]} {WORDS[(i * 7) % len(WORDS)]}"
+            return await client.post("/api/search", json={"query": query, "top_k": top_k}, headers=headers)
+
+        for i in range(min(20, requests)):  # Warm-up
+            await call(i)
+
+        async def worker() -> None:
+            nonlocal errors
+            for i in remaining:
+                t0 = time.perf_counter()
+                response = await call(i)
+                latencies.append((time.perf_counter() - t0) * 1000)
+                if response.status_code != 200:
+                    errors += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": errors,
+        "requests_per_s": round(requests / elapsed, 2),
+        **_latency_summary(latencies)
+    }
+
+
+def bench_search(requests: int, concurrency: int, rpc_latency_ms: float, top_k: int = 10, semantic_cache: bool = False) -> Dict[str, Any]:
+    """Load-test POST /api/search through the real Supabase backend path."""
+    from app.config import config
+    from app.services.storage import get_storage_backend
+
+    get_storage_backend.cache_clear()
+    with patch.object(config, "storage_backend", "supabase"), \
+         patch.object(config, "semantic_cache_enabled", semantic_cache), \
+         patch("app.services.storage.get_supabase_client", return_value=StubSupabase(rpc_latency_ms)):
+        result = asyncio.run(_load(requests, concurrency, top_k))
+    get_storage_backend.cache_clear()
+
+    result["rpc_latency_ms"] = rpc_latency_ms
+    result["peak_rss_mb"] = peak_rss_mb()
+    return result
+
+
+def bench_startup(runs: int = 5) -> Dict[str, Any]:
+    """Cold import of app.main in fresh interpreters (API worker start-up)."""
+    code = "import time; t = time.perf_counter(); import app.main; print(time.perf_counter() - t)"
+    root = Path(__file__).resolve().parent.parent
+    latencies = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+        latencies.append(float(out.stdout.strip().splitlines()[-1]) * 1000)
+
+    return {
+        "runs": runs,
+        "imports_per_s": round(1000 / percentile(latencies, 0.50), 2),
+        **_latency_summary(latencies),
+        "peak_rss_mb": peak_rss_mb(resource.RUSAGE_CHILDREN)
+    }
+
+
+def _encode_with_models(query: str, results: List[Dict[str, Any]]) -> bytes:
+    """The previous response path: per-row models, response_model re-validation, json encoding."""
+    from fastapi.encoders import jsonable_encoder
+
+    from app.models.schemas import SearchResponse, SearchResult
+
+    response = SearchResponse(query=query, results=[SearchResult(**r) for r in results], count=len(results))
+    validated = SearchResponse.model_validate(response.model_dump())
+    return json.dumps(jsonable_encoder(validated), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def bench_serialization(top_k: int = 20, content_chars: int = 2000, runs: int = 2000) -> Dict[str, Any]:
+    """Encode one search response, model path vs the direct orjson path."""
+    from app.services.search import format_results
+    from app.services.serialization import dumps, search_payload
+
+    query = "store opening checklist"
+    rows = StubSupabase(0, content_chars=content_chars).rpc("match_chunks_hybrid_rrf", {"match_count": top_k}).data
+    results = format_results(rows)
+
+    def run(encode: Callable[[], bytes]) -> List[float]:
+        latencies = []
+        for _ in range(runs):
+            t0 = time.perf_counter()
+            encode()
+            latencies.append((time.perf_counter() - t0) * 1000)
+        return latencies
+
+    models = run(lambda: _encode_with_models(query, results))
+    fast = run(lambda: dumps(search_payload(query, results)))
+
+    return {
+        "top_k": top_k,
+        "content_chars": content_chars,
+        "responses_per_s": round(1000 / percentile(fast, 0.50), 2),
+        **_latency_summary(fast),
+        "models_p50_ms": round(percentile(models, 0.50), 3),
+        "speedup": round(percentile(models, 0.50) / percentile(fast, 0.50), 2),
+        "peak_rss_mb": peak_rss_mb()
+    }
+
+
+def _isolated(func: Callable, *args) -> Dict[str, Any]:
+    """Run a benchmark in a fresh process so RSS and caches start clean."""
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+        return pool.submit(func, *args).result()
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(args: argparse.Namespace) -> Dict[str, Any]:
+    """Run the selected benchmarks; returns the baseline document."""
+    results: Dict[str, Dict[str, Any]] = {}
+
+    if args.only in (None, "extract"):
+        with tempfile.TemporaryDirectory() as tmp:
+            for file_type in FILE_TYPES:
+                paths = make_corpus(Path(tmp) / file_type, file_type, args.documents, args.units, args.image_density, args.seed)
+                results[f"extract_{file_type}"] = _isolated(
+                    bench_extraction, file_type, [str(p) for p in paths], args.vision_latency_ms
+                )
+                # Text-only re-indexing: object model vs streamed XML
+                if file_type in OOXML_TYPES:
+                    for mode, fast in (("text", False), ("fast", True)):
+                        results[f"extract_{file_type}_{mode}"] = _isolated(
+                            bench_extraction, file_type, [str(p) for p in paths], 0.0, False, fast
+                        )
+
+    if args.only in (None, "startup"):
+        results["startup"] = _isolated(bench_startup, args.startup_runs)
+
+    if args.only in (None, "serialize"):
+        results["serialize"] = _isolated(bench_serialization, args.top_k_serialize, args.content_chars)
+
+    if args.only in (None, "search"):
+        results["search_api"] = _isolated(
+            bench_search, args.requests, args.concurrency, args.rpc_latency_ms, args.top_k, args.semantic_cache
+        )
+
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": {k: v for k, v in vars(args).items() if k != "output"}
+        },
+        "results": results
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", choices=["extract", "startup", "serialize", "search"], help="Run one group of benchmarks")
+    parser.add_argument("--documents", type=int, default=5, help="Documents per file type")
+    parser.add_argument("--units", type=int, default=20, help="Slides/pages/sections per document")
+    parser.add_argument("--image-density", type=float, default=0.5, help="Pictures per slide/page/section")
+    parser.add_argument("--vision-latency-ms", type=float, default=0.0, help="Delay of the stubbed process_image")
+    parser.add_argument("--startup-runs", type=int, default=5, help="Cold imports of app.main to time")
+    parser.add_argument("--top-k-serialize", type=int, default=20, help="Results per response in the serialization benchmark")
+    parser.add_argument("--content-chars", type=int, default=2000, help="Chunk content length in the serialization benchmark")
+    parser.add_argument("--requests", type=int, default=500, help="Search requests to send")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent search clients")
+    parser.add_argument("--rpc-latency-ms", type=float, default=20.0, help="Delay of the stubbed RPC")
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--semantic-cache", action="store_true", help="Leave the semantic query cache on")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", help="Write the baseline as JSON")
+    args = parser.parse_args()
+
+    baseline = run_suite(args)
+
+    print(f"{'benchmark':<20}{'throughput':>14}{'p50 ms':>10}{'p99 ms':>10}{'peak RSS MB':>13}")
+    for name, row in baseline["results"].items():
+        throughput = next(row[k] for k in ("requests_per_s", "docs_per_s", "imports_per_s", "responses_per_s") if k in row)
+        print(f"{name:<20}{throughput:>14}{row['p50_ms']:>10}{row['p99_ms']:>10}{row['peak_rss_mb']:>13}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
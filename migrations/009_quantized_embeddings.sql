@@ -0,0 +1,173 @@
+-- 009_quantized_embeddings.sql
+-- Compact embedding codes + two-stage (coarse scan, exact rescore) hybrid search
+-- Requires pgvector >= 0.7.0 (halfvec, bit, binary_quantize)
+
+-- Compact representations alongside the full-precision embedding
+ALTER TABLE kb_chunks ADD COLUMN IF NOT EXISTS embedding_half halfvec(768);
+ALTER TABLE kb_chunks ADD COLUMN IF NOT EXISTS embedding_bit bit(768);
+
+-- Keep the codes in sync with the source embedding
+CREATE OR REPLACE FUNCTION kb_chunks_sync_quantized()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF NEW.embedding IS NULL THEN
+        NEW.embedding_half := NULL;
+        NEW.embedding_bit := NULL;
+    ELSE
+        NEW.embedding_half := NEW.embedding::halfvec(768);
+        NEW.embedding_bit := binary_quantize(NEW.embedding)::bit(768);
+    END IF;
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_kb_chunks_sync_quantized ON kb_chunks;
+CREATE TRIGGER trg_kb_chunks_sync_quantized
+    BEFORE INSERT OR UPDATE OF embedding ON kb_chunks
+    FOR EACH ROW EXECUTE FUNCTION kb_chunks_sync_quantized();
+
+-- Backfill existing rows
+UPDATE kb_chunks
+SET embedding_half = embedding::halfvec(768),
+    embedding_bit = binary_quantize(embedding)::bit(768)
+WHERE embedding IS NOT NULL
+  AND (embedding_half IS NULL OR embedding_bit IS NULL);
+
+-- Coarse-scan indexes (half the memory of a vector HNSW index / 1 bit per dim)
+CREATE INDEX IF NOT EXISTS idx_kb_chunks_embedding_half
+    ON kb_chunks USING hnsw (embedding_half halfvec_cosine_ops);
+CREATE INDEX IF NOT EXISTS idx_kb_chunks_embedding_bit
+    ON kb_chunks USING hnsw (embedding_bit bit_hamming_ops);
+
+-- Stage 1: coarse candidate scan on compact codes
+-- An HNSW scan returns at most hnsw.ef_search rows (default 40), so it is
+-- raised (transaction-local) to candidate_count first; pgvector caps the
+-- setting at 1000, so callers keep candidate_count within it (the API
+-- lowers rescore_multiplier for deep pages, see search.py
+-- MAX_COARSE_CANDIDATES). VOLATILE because set_config changes session state.
+CREATE OR REPLACE FUNCTION match_chunks_coarse(
+    query_embedding vector(768),
+    quantization TEXT DEFAULT 'halfvec',  -- 'halfvec' or 'binary'
+    candidate_count INT DEFAULT 40
+)
+RETURNS TABLE (candidate_id UUID)
+LANGUAGE plpgsql
+VOLATILE
+AS $$
+BEGIN
+    PERFORM set_config(
+        'hnsw.ef_search',
+        LEAST(GREATEST(COALESCE(current_setting('hnsw.ef_search', true)::INT, 40), candidate_count), 1000)::TEXT,
+        true
+    );
+
+    IF quantization = 'binary' THEN
+        RETURN QUERY
+        SELECT c.id
+        FROM kb_chunks c
+        JOIN kb_documents d ON c.document_id = d.id
+        WHERE d.status = 'completed'
+          AND c.quality_score >= 0.5
+        ORDER BY c.embedding_bit <~> binary_quantize(query_embedding)::bit(768)
+        LIMIT candidate_count;
+    ELSIF quantization = 'halfvec' THEN
+        RETURN QUERY
+        SELECT c.id
+        FROM kb_chunks c
+        JOIN kb_documents d ON c.document_id = d.id
+        WHERE d.status = 'completed'
+          AND c.quality_score >= 0.5
+        ORDER BY c.embedding_half <=> query_embedding::halfvec(768)
+        LIMIT candidate_count;
+    ELSE
+        RAISE EXCEPTION 'Unknown quantization: % (expected halfvec or binary)', quantization;
+    END IF;
+END;
+$$;
+
+-- Stage 2: exact rescoring of candidates, then RRF with keyword results.
+-- Same output shape as match_chunks_hybrid_rrf (008).
+CREATE OR REPLACE FUNCTION match_chunks_hybrid_rrf_quantized(
+    query_embedding vector(768),
+    query_text TEXT,
+    match_threshold FLOAT DEFAULT 0.5,
+    match_count INT DEFAULT 5,
+    k_constant INT DEFAULT 60,
+    quantization TEXT DEFAULT 'halfvec',
+    rescore_multiplier INT DEFAULT 4  -- coarse candidates per semantic slot
+)
+RETURNS TABLE (
+    chunk_id UUID,
+    document_id UUID,
+    document_title TEXT,
+    section_title TEXT,
+    content TEXT,
+    source_path TEXT,
+    image_type TEXT,
+    semantic_score FLOAT,
+    bm25_score FLOAT,
+    hybrid_score FLOAT,
+    document_date TIMESTAMPTZ
+)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    RETURN QUERY
+    WITH coarse AS (
+        SELECT m.candidate_id
+        FROM match_chunks_coarse(
+            query_embedding,
+            quantization,
+            match_count * 2 * rescore_multiplier
+        ) m
+    ),
+    semantic_results AS (
+        -- Exact rescoring with full-precision vectors
+        SELECT
+            c.id,
+            ROW_NUMBER() OVER (ORDER BY c.embedding <=> query_embedding) as rank
+        FROM coarse
+        JOIN kb_chunks c ON c.id = coarse.candidate_id
+        WHERE 1 - (c.embedding <=> query_embedding) > match_threshold
+        LIMIT match_count * 2
+    ),
+    keyword_results AS (
+        SELECT
+            c.id,
+            ROW_NUMBER() OVER (ORDER BY similarity(c.content, query_text) DESC) as rank
+        FROM kb_chunks c
+        JOIN kb_documents d ON c.document_id = d.id
+        WHERE d.status = 'completed'
+          AND c.quality_score >= 0.5
+          AND c.content % query_text
+        LIMIT match_count * 2
+    ),
+    rrf_scores AS (
+        SELECT
+            COALESCE(s.id, k.id) as chunk_id,
+            (1.0 / (k_constant + COALESCE(s.rank, 999999)))::FLOAT +
+            (1.0 / (k_constant + COALESCE(k.rank, 999999)))::FLOAT as rrf_score
+        FROM semantic_results s
+        FULL OUTER JOIN keyword_results k ON s.id = k.id
+    )
+    SELECT
+        c.id,
+        c.document_id,
+        d.title,
+        c.section_title,
+        c.content,
+        d.source_path,
+        c.image_type,
+        (1 - (c.embedding <=> query_embedding))::FLOAT as semantic_score,
+        similarity(c.content, query_text)::FLOAT as bm25_score,
+        r.rrf_score as hybrid_score,
+        d.created_at
+    FROM rrf_scores r
+    JOIN kb_chunks c ON r.chunk_id = c.id
+    JOIN kb_documents d ON c.document_id = d.id
+    ORDER BY r.rrf_score DESC
+    LIMIT match_count;
+END;
+$$;
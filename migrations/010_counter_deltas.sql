@@ -0,0 +1,29 @@
+-- 010_counter_deltas.sql
+-- Apply coalesced document view increments in one round trip
+
+CREATE OR REPLACE FUNCTION kb_apply_counter_deltas(
+    document_views JSONB DEFAULT '[]'::jsonb
+)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    -- Row locks are taken explicitly in id order (SELECT ... ORDER BY id
+    -- FOR UPDATE) before the UPDATE, so concurrent workers flushing
+    -- overlapping ids cannot deadlock; the UPDATE join order is up to
+    -- the planner and does not fix the lock order by itself
+
+    -- [{"id": uuid, "views": int, "last_accessed": timestamptz}, ...]
+    PERFORM 1
+    FROM kb_documents d
+    WHERE d.id IN (SELECT x.id FROM jsonb_to_recordset(document_views) AS x(id UUID))
+    ORDER BY d.id
+    FOR UPDATE;
+
+    UPDATE kb_documents d
+    SET view_count = COALESCE(d.view_count, 0) + v.views,
+        last_accessed = GREATEST(d.last_accessed, v.last_accessed)
+    FROM jsonb_to_recordset(document_views) AS v(id UUID, views INT, last_accessed TIMESTAMPTZ)
+    WHERE d.id = v.id;
+END;
+$$;
@@ -0,0 +1,19 @@
+-- 011_top_queries.sql
+-- Most frequent recent searches, used to warm caches on startup
+
+CREATE OR REPLACE FUNCTION kb_top_queries(
+    since_days INT DEFAULT 7,
+    query_limit INT DEFAULT 100
+)
+RETURNS TABLE (query TEXT, hits BIGINT)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT q.query, COUNT(*) AS hits
+    FROM kb_query_log q
+    WHERE q.created_at >= NOW() - make_interval(days => since_days)
+      AND q.results_count > 0
+    GROUP BY q.query
+    ORDER BY hits DESC, q.query
+    LIMIT query_limit;
+$$;
@@ -0,0 +1,58 @@
+-- 012_search_generation.sql
+-- Generation stamp for searchable content, bumped whenever a document
+-- enters or leaves the searchable set. API workers poll it and key their
+-- semantic result caches by it, so a completed new version is visible
+-- within one poll interval on every worker.
+
+CREATE TABLE IF NOT EXISTS kb_search_generation (
+    id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+    generation BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+INSERT INTO kb_search_generation (id) VALUES (TRUE) ON CONFLICT (id) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION kb_bump_search_generation()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE kb_search_generation
+    SET generation = generation + 1,
+        updated_at = NOW()
+    WHERE id;
+    RETURN NULL;
+END;
+$$;
+
+-- Only status / is_latest changes that touch a completed document count;
+-- counter updates (view_count, last_accessed) do not invalidate caches
+DROP TRIGGER IF EXISTS kb_documents_search_generation_update ON kb_documents;
+CREATE TRIGGER kb_documents_search_generation_update
+    AFTER UPDATE OF status, is_latest ON kb_documents
+    FOR EACH ROW
+    WHEN ((OLD.status = 'completed' OR NEW.status = 'completed')
+          AND (OLD.status IS DISTINCT FROM NEW.status OR OLD.is_latest IS DISTINCT FROM NEW.is_latest))
+    EXECUTE FUNCTION kb_bump_search_generation();
+
+DROP TRIGGER IF EXISTS kb_documents_search_generation_insert ON kb_documents;
+CREATE TRIGGER kb_documents_search_generation_insert
+    AFTER INSERT ON kb_documents
+    FOR EACH ROW
+    WHEN (NEW.status = 'completed')
+    EXECUTE FUNCTION kb_bump_search_generation();
+
+DROP TRIGGER IF EXISTS kb_documents_search_generation_delete ON kb_documents;
+CREATE TRIGGER kb_documents_search_generation_delete
+    AFTER DELETE ON kb_documents
+    FOR EACH ROW
+    WHEN (OLD.status = 'completed')
+    EXECUTE FUNCTION kb_bump_search_generation();
+
+CREATE OR REPLACE FUNCTION kb_search_generation()
+RETURNS TABLE (generation BIGINT)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT g.generation FROM kb_search_generation g WHERE g.id;
+$$;
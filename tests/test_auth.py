@@ -0,0 +1,116 @@
+"""Tests for authentication and Frappe session validation."""
+
+import asyncio
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.middleware.sessions import SessionValidator
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_validator(valid_sids, clock=None, delay=0.0):
+    """Validator with an offline stub in place of the Frappe HTTP call."""
+    calls = []
+
+    async def fetch(sid):
+        calls.append(sid)
+        await asyncio.sleep(delay)
+        return sid in valid_sids
+
+    validator = SessionValidator(fetch, ttl=60, negative_ttl=5, maxsize=100, clock=clock or FakeClock())
+    return validator, calls
+
+
+async def test_valid_session_is_cached():
+    """A validated sid should not trigger another upstream call until it expires."""
+    clock = FakeClock()
+    validator, calls = make_validator({"good"}, clock)
+
+    assert await validator.validate("good") is True
+    assert await validator.validate("good") is True
+    assert calls == ["good"]
+
+    clock.now = 61
+    assert await validator.validate("good") is True
+    assert calls == ["good", "good"]
+
+
+async def test_invalid_session_is_negatively_cached():
+    """Invalid sids should be remembered for the shorter negative TTL."""
+    clock = FakeClock()
+    validator, calls = make_validator(set(), clock)
+
+    assert await validator.validate("bad") is False
+    assert await validator.validate("bad") is False
+    assert len(calls) == 1
+
+    clock.now = 6
+    assert await validator.validate("bad") is False
+    assert len(calls) == 2
+
+
+async def test_concurrent_checks_are_single_flight():
+    """Concurrent requests with the same sid should share one upstream check."""
+    validator, calls = make_validator({"good"}, delay=0.01)
+
+    results = await asyncio.gather(*[validator.validate("good") for _ in range(10)])
+
+    assert results == [True] * 10
+    assert calls == ["good"]
+
+
+async def test_cancelled_leader_does_not_fail_followers():
+    """A disconnected first request must not cancel the check for others."""
+    validator, calls = make_validator({"good"}, delay=0.05)
+
+    leader = asyncio.ensure_future(validator.validate("good"))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(validator.validate("good"))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower is True
+    assert leader.cancelled()
+    assert calls == ["good"]
+    assert await validator.validate("good") is True  # Cached by the surviving check
+
+
+async def test_upstream_errors_are_not_cached():
+    """A failing upstream should reject the request without caching the failure."""
+    attempts = []
+
+    async def flaky(sid):
+        attempts.append(sid)
+        if len(attempts) == 1:
+            raise RuntimeError("Frappe unavailable")
+        return True
+
+    validator = SessionValidator(flaky, ttl=60, negative_ttl=5, maxsize=10, clock=FakeClock())
+
+    assert await validator.validate("good") is False
+    assert await validator.validate("good") is True
+
+
+def test_search_accepts_only_validated_sessions():
+    """The auth dependency should consult the session validator for sid cookies."""
+    validator, _ = make_validator({"good"})
+    client = TestClient(app)
+
+    with patch("app.middleware.auth.session_validator", validator), \
+         patch("app.api.search.asearch_hybrid", return_value=[]):
+        client.cookies.set("sid", "bad")
+        rejected = client.post("/api/search", json={"query": "payroll"})
+        client.cookies.set("sid", "good")
+        accepted = client.post("/api/search", json={"query": "payroll"})
+
+    assert rejected.status_code == 401
+    assert accepted.status_code == 200
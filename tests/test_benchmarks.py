@@ -0,0 +1,53 @@
+"""Smoke tests for the offline benchmark suite."""
+
+import pytest
+
+
+@pytest.mark.parametrize("file_type", ["pptx", "pdf", "docx"])
+def test_synthetic_corpus_images_reach_the_extractor(tmp_path, file_type):
+    """Every generated picture should be handed to (stubbed) process_image."""
+    from benchmarks.corpus import make_corpus
+    from benchmarks.suite import bench_extraction
+
+    paths = make_corpus(tmp_path, file_type, documents=1, units=4, image_density=0.5)
+    result = bench_extraction(file_type, [str(p) for p in paths])
+
+    assert result["documents"] == 1
+    assert result["images"] == 2
+    assert result["peak_rss_mb"] > 0
+
+
+def test_search_load_test_against_stub_rpc():
+    """The load test should drive the real endpoint without a database."""
+    from benchmarks.suite import bench_search
+
+    result = bench_search(requests=30, concurrency=4, rpc_latency_ms=0)
+
+    assert result["errors"] == 0
+    assert result["requests_per_s"] > 0
+    assert result["p50_ms"] <= result["p99_ms"]
+
+
+def test_compare_flags_regressions_beyond_tolerance():
+    """Slower latency or lower throughput past the tolerance is a regression."""
+    from benchmarks.compare import compare
+
+    base = {"results": {"search_api": {"requests_per_s": 100.0, "p99_ms": 50.0}}}
+    current = {"results": {"search_api": {"requests_per_s": 95.0, "p99_ms": 70.0}}}
+
+    rows = {row["metric"]: row for row in compare(base, current, tolerance=0.10)}
+
+    assert not rows["requests_per_s"]["regressed"]
+    assert rows["p99_ms"]["regressed"]
+    assert rows["p99_ms"]["change"] == 0.4
+
+
+def test_serialization_benchmark_reports_both_paths():
+    """The serialization microbenchmark should time the model and direct paths."""
+    from benchmarks.suite import bench_serialization
+
+    result = bench_serialization(top_k=3, content_chars=100, runs=20)
+
+    assert result["responses_per_s"] > 0
+    assert result["models_p50_ms"] > 0
+    assert result["speedup"] > 0
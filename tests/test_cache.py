@@ -0,0 +1,110 @@
+"""Tests for in-process caches."""
+
+from unittest.mock import Mock, patch
+
+from app.services.cache import SemanticCache, TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_cache_expires_and_evicts_lru():
+    """Entries should expire after the TTL and LRU entries should be evicted."""
+    clock = FakeClock()
+    cache = TTLCache(maxsize=2, ttl=10, clock=clock)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+    clock.now = 11
+    assert cache.get("a") is None
+    assert cache.hits == 2
+    assert cache.misses == 2
+
+
+def test_semantic_cache_matches_near_duplicate_queries():
+    """A similar embedding with the same params should hit the cache."""
+    cache = SemanticCache(maxsize=8, ttl=60, threshold=0.95)
+    params = ("match_chunks_hybrid_rrf", 5, 0.5, 60)
+    cache.store([1.0, 0.5, 0.0, 0.2], params, [{"chunk_id": "c1"}])
+
+    assert cache.lookup([1.0, 0.52, 0.01, 0.2], params) == [{"chunk_id": "c1"}]
+    assert cache.lookup([1.0, 0.52, 0.01, 0.2], ("other", 5, 0.5, 60)) is None
+    assert cache.lookup([-1.0, 0.5, 1.0, 0.0], params) is None
+
+
+def test_semantic_cache_skips_zero_vectors_and_invalidates():
+    """Zero embeddings are never cached; invalidate() drops all entries."""
+    cache = SemanticCache(maxsize=8, ttl=60, threshold=0.9)
+    cache.store([0.0, 0.0], "p", ["x"])
+    assert len(cache) == 0
+
+    cache.store([1.0, 0.0], "p", ["x"])
+    cache.invalidate()
+    assert cache.lookup([1.0, 0.0], "p") is None
+
+
+def test_search_hybrid_returns_cached_results_without_rpc():
+    """A cache hit should skip the search RPC entirely."""
+    from app.services import search
+
+    cache = SemanticCache(maxsize=8, ttl=60, threshold=0.95)
+    backend = Mock()
+    backend.match_chunks.return_value = [
+        {"chunk_id": "c1", "document_title": "Store Ops", "content": "Opening checklist", "hybrid_score": 0.03}
+    ]
+
+    with patch.object(search, "query_cache", cache), \
+         patch.object(search, "embedding_cache", TTLCache(maxsize=8, ttl=60)), \
+         patch.object(search, "generate_embedding", return_value=[0.3] * 768), \
+         patch.object(search, "get_storage_backend", return_value=backend):
+
+        first = search.search_hybrid("store opening checklist")
+        second = search.search_hybrid("checklist for opening a store")
+
+    assert second == first
+    assert backend.match_chunks.call_count == 1
+
+
+async def test_new_search_generation_invalidates_cached_results():
+    """A bumped kb_search_generation stamp should make cached results miss."""
+    from app.services import search, search_generation
+    from app.services.search_generation import SearchGeneration
+
+    stamps = iter([1, 1, 2, 2])
+
+    async def fetch():
+        return next(stamps)
+
+    cache = SemanticCache(maxsize=8, ttl=60, threshold=0.95)
+    generation = SearchGeneration(fetch, flush_interval=60)
+    backend = Mock()
+    backend.match_chunks.return_value = [{"chunk_id": "c1", "hybrid_score": 0.03}]
+
+    with patch.object(search, "query_cache", cache), \
+         patch.object(search_generation, "query_cache", cache), \
+         patch.object(search, "search_generation", generation), \
+         patch.object(search, "embedding_cache", TTLCache(maxsize=8, ttl=60)), \
+         patch.object(search, "generate_embedding", return_value=[0.3] * 768), \
+         patch.object(search, "get_storage_backend", return_value=backend):
+
+        await generation.start()
+        search.search_hybrid("store opening checklist")
+        assert await generation.flush() == 0  # Unchanged stamp keeps the cache
+        search.search_hybrid("store opening checklist")
+        assert await generation.flush() == 1
+        assert len(cache) == 0
+        search.search_hybrid("store opening checklist")
+        await generation.stop()
+
+    assert backend.match_chunks.call_count == 2
@@ -0,0 +1,71 @@
+"""Tests for write-behind view counters."""
+
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.services.counters import CounterAggregator
+
+
+def make_aggregator(**kwargs):
+    flushes = []
+
+    async def writer(document_views):
+        flushes.append(document_views)
+
+    return CounterAggregator(writer, clock=lambda: "2026-01-01T00:00:00+00:00", **kwargs), flushes
+
+
+async def test_increments_are_coalesced_into_one_flush():
+    """Repeated hits on the same ids should become one sorted delta each."""
+    aggregator, flushes = make_aggregator()
+    aggregator.record_views(["d2", "d1", "d1"])
+    aggregator.record_views(["d1", None])
+
+    assert await aggregator.flush() == 2
+    assert flushes == [[
+        {"id": "d1", "views": 2, "last_accessed": "2026-01-01T00:00:00+00:00"},
+        {"id": "d2", "views": 1, "last_accessed": "2026-01-01T00:00:00+00:00"}
+    ]]
+    assert len(aggregator) == 0
+    assert await aggregator.flush() == 0
+    assert len(flushes) == 1
+
+
+async def test_failed_flush_keeps_deltas():
+    """A failing write should merge the deltas back for the next flush."""
+    calls = []
+
+    async def flaky(document_views):
+        calls.append(document_views)
+        if len(calls) == 1:
+            raise RuntimeError("database unavailable")
+
+    aggregator = CounterAggregator(flaky)
+    aggregator.record_views(["d1"])
+    assert await aggregator.flush() == 0
+
+    aggregator.record_views(["d1"])
+    assert await aggregator.flush() == 1
+    assert calls[-1][0]["views"] == 2
+
+
+def test_search_endpoint_records_document_views():
+    """Documents behind served results should get a view each."""
+    from app.config import config
+    from app.main import app
+
+    aggregator, _ = make_aggregator()
+    results = [
+        {"chunk_id": "c1", "document_id": "d1", "title": "Ops", "content": "", "source": "", "semantic_score": 0.9, "score": 0.1},
+        {"chunk_id": "c2", "document_id": "d1", "title": "Ops", "content": "", "source": "", "semantic_score": 0.8, "score": 0.1}
+    ]
+    client = TestClient(app)
+
+    with patch("app.api.search.counter_aggregator", aggregator), \
+         patch("app.api.search.asearch_hybrid", return_value=results):
+        response = client.post("/api/search", json={"query": "opening"}, headers={"X-API-Key": config.api_key})
+
+    assert response.status_code == 200
+    assert response.json()["results"][0]["document_id"] == "d1"
+    assert len(aggregator) == 1  # One view for d1, pending flush
@@ -140,10 +140,11 @@ def test_docx_extractor_extracts_text():
 def test_docx_extractor_processes_images():
     """DOCX extractor should process inline images."""
     from app.extractors.docx import extract_docx
+    from docx.enum.shape import WD_INLINE_SHAPE
 
     mock_inline_shape = Mock()
-    mock_inline_shape.type = 3  # PICTURE type
-    mock_inline_shape.image.blob = b"fake_bytes"
+    mock_inline_shape.type = WD_INLINE_SHAPE.PICTURE
+    mock_inline_shape._inline.graphic.graphicData.pic.blipFill.blip.embed = "rId5"
 
     mock_para = Mock()
     mock_para.text = "Text with image"
@@ -151,6 +152,7 @@ def test_docx_extractor_processes_images():
     mock_doc = Mock()
     mock_doc.paragraphs = [mock_para]
     mock_doc.inline_shapes = [mock_inline_shape]
+    mock_doc.part.related_parts = {"rId5": Mock(blob=b"fake_bytes")}
 
     with patch("app.extractors.docx.Document", return_value=mock_doc), \
          patch("app.services.vision.process_image") as mock_vision:
@@ -166,3 +168,76 @@ def test_docx_extractor_processes_images():
 
         assert len(result["images"]) == 1
         assert result["images"][0]["type"] == "diagram"
+        mock_vision.assert_called_once_with(b"fake_bytes")
+
+
+# Fast (streaming) mode
+def _vision_stub():
+    return {"type": "chart", "quality_score": 1.0, "extracted_text": "Chart", "should_index": True}
+
+
+def _png(tmp_path):
+    from PIL import Image
+
+    path = tmp_path / "pixel.png"
+    Image.new("RGB", (8, 8), (200, 30, 30)).save(path)
+    return str(path)
+
+
+def test_fast_pptx_matches_object_model(tmp_path):
+    """Streaming the slide XML should give the same result as python-pptx."""
+    from pptx import Presentation
+    from pptx.util import Inches
+    from app.extractors.pptx import extract_pptx
+
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    slide.shapes.title.text = "Payroll"
+    slide.placeholders[1].text_frame.text = "Cut-off\vfifteenth"
+    slide.placeholders[1].text_frame.add_paragraph().text = "Release on the 30th"
+    slide.shapes.add_table(2, 2, Inches(1), Inches(1), Inches(2), Inches(1)).table.cell(0, 0).text = "In a table"
+    group = slide.shapes.add_group_shape()
+    group.shapes.add_textbox(Inches(1), Inches(3), Inches(1), Inches(1)).text_frame.text = "Grouped"
+    slide.shapes.add_picture(_png(tmp_path), Inches(4), Inches(4))
+    slide.notes_slide.notes_text_frame.text = "Mention the holiday schedule"
+    prs.slides.add_slide(prs.slide_layouts[6])
+    path = str(tmp_path / "deck.pptx")
+    prs.save(path)
+
+    with patch("app.services.vision.process_image", return_value=_vision_stub()) as mock_vision:
+        expected = extract_pptx(path)
+        result = extract_pptx(path, fast=True)
+
+    assert result == expected
+    assert result["slides"][0]["content"] == "Payroll\nCut-off\vfifteenth\nRelease on the 30th"
+    assert result["speaker_notes"] == [{"slide_number": 1, "notes": "Mention the holiday schedule"}]
+    assert mock_vision.call_args_list[0] == mock_vision.call_args_list[1]
+    assert extract_pptx(path, process_images=False, fast=True)["images"] == []
+
+
+def test_fast_docx_matches_object_model(tmp_path):
+    """Streaming document.xml should give the same result as python-docx."""
+    from docx import Document
+    from docx.enum.text import WD_BREAK
+    from app.extractors.docx import extract_docx
+
+    doc = Document()
+    doc.add_heading("Leave policy", level=1)
+    para = doc.add_paragraph("Vacation\tleave")
+    para.add_run().add_break()
+    para.add_run("accrues monthly")
+    doc.add_paragraph().add_run().add_break(WD_BREAK.PAGE)
+    doc.add_table(rows=1, cols=2).cell(0, 0).text = "Table text is not a body paragraph"
+    doc.add_picture(_png(tmp_path))
+    doc.add_paragraph("Closing note")
+    path = str(tmp_path / "policy.docx")
+    doc.save(path)
+
+    with patch("app.services.vision.process_image", return_value=_vision_stub()) as mock_vision:
+        expected = extract_docx(path)
+        result = extract_docx(path, fast=True)
+
+    assert result == expected
+    assert result["content"] == "Leave policy\n\nVacation\tleave\naccrues monthly\n\nClosing note"
+    assert result["images"][0]["image_index"] == 0
+    assert mock_vision.call_args_list[0] == mock_vision.call_args_list[1]
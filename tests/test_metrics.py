@@ -0,0 +1,88 @@
+"""Tests for Prometheus metrics."""
+
+from unittest.mock import Mock, patch
+
+from fastapi.testclient import TestClient
+
+from app.config import config
+from app.main import app
+from app.services.metrics import REGISTRY
+
+client = TestClient(app)
+
+
+def sample(name, labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_metrics_endpoint_serves_prometheus_text():
+    """/metrics should expose the Prometheus text format."""
+    client.get("/health")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "kb_http_request_duration_seconds" in response.text
+    assert 'route="/health"' in response.text
+
+
+def test_router_routes_are_labelled_with_their_full_template():
+    """Routes from prefixed routers should keep the prefix in the route label."""
+    with patch("app.api.search.asearch_hybrid", return_value=[]):
+        client.post("/api/search", json={"query": "opening"}, headers={"X-API-Key": config.api_key})
+    client.get("/api/debug/profiles/abc", headers={"X-API-Key": config.api_key})
+
+    text = client.get("/metrics").text
+
+    assert 'route="/api/search"' in text
+    assert 'route="/api/debug/profiles/{profile_id}"' in text
+    assert 'route="/search"' not in text
+
+
+def test_search_records_stage_timings():
+    """A search should observe embedding, rpc and format stages."""
+    backend = Mock()
+
+    async def amatch_chunks(*args):
+        return []
+
+    backend.amatch_chunks = amatch_chunks
+    before = {s: sample("kb_search_stage_duration_seconds_count", {"stage": s}) for s in ("embedding", "rpc", "format")}
+
+    with patch("app.services.search.get_storage_backend", return_value=backend):
+        response = client.post("/api/search", json={"query": "payroll"}, headers={"X-API-Key": config.api_key})
+
+    assert response.status_code == 200
+    for stage, count in before.items():
+        assert sample("kb_search_stage_duration_seconds_count", {"stage": stage}) == count + 1
+
+
+def test_vision_counts_images_by_type_and_bytes():
+    """process_image should count images per type and uploaded bytes."""
+    from app.services.vision import process_image
+
+    mock_response = Mock()
+    mock_response.text = "decorative"
+    before_calls = sample("kb_vision_images_total", {"image_type": "decorative"})
+    before_bytes = sample("kb_vision_upload_bytes_total", {})
+
+    with patch("app.services.vision.client") as mock_client:
+        mock_client.models.generate_content.return_value = mock_response
+        process_image(b"12345")
+
+    assert sample("kb_vision_images_total", {"image_type": "decorative"}) == before_calls + 1
+    assert sample("kb_vision_upload_bytes_total", {}) == before_bytes + 5
+
+
+def test_named_caches_report_hits_and_misses():
+    """Named TTL caches should feed the cache hit-rate counters."""
+    from app.services.cache import TTLCache
+
+    cache = TTLCache(maxsize=4, ttl=60, name="test_cache")
+    cache.set("k", 1)
+    cache.get("k")
+    cache.get("missing")
+
+    assert sample("kb_cache_requests_total", {"cache": "test_cache", "result": "hit"}) == 1
+    assert sample("kb_cache_requests_total", {"cache": "test_cache", "result": "miss"}) == 1
@@ -0,0 +1,50 @@
+"""Tests for cursor pagination."""
+
+import pytest
+from unittest.mock import patch
+
+from app.services import pagination
+
+CANDIDATES = [{"chunk_id": f"c{i}", "content": f"chunk {i}"} for i in range(7)]
+
+
+@pytest.fixture(autouse=True)
+def clear_result_sets():
+    pagination.result_sets.clear()
+    yield
+    pagination.result_sets.clear()
+
+
+def test_pages_are_sliced_from_one_materialized_search():
+    """Later pages should not re-run the hybrid search."""
+    with patch.object(pagination, "search_hybrid", return_value=CANDIDATES) as mock_search:
+        first, cursor = pagination.search_page("opening", top_k=3)
+        second, cursor = pagination.search_page("opening", top_k=3, cursor=cursor)
+        third, cursor = pagination.search_page("opening", top_k=3, cursor=cursor)
+
+    assert [r["chunk_id"] for r in first + second + third] == [f"c{i}" for i in range(7)]
+    assert cursor is None
+    mock_search.assert_called_once()
+
+
+def test_expired_result_set_is_recomputed():
+    """A cursor whose list was evicted should still return the right page."""
+    with patch.object(pagination, "search_hybrid", return_value=CANDIDATES) as mock_search:
+        _, cursor = pagination.search_page("opening", top_k=3)
+        pagination.result_sets.clear()
+        page, _ = pagination.search_page("opening", top_k=3, cursor=cursor)
+
+    assert [r["chunk_id"] for r in page] == ["c3", "c4", "c5"]
+    assert mock_search.call_count == 2
+
+
+def test_cursor_is_bound_to_its_query():
+    """Reusing a cursor with another query should be rejected."""
+    with patch.object(pagination, "search_hybrid", return_value=CANDIDATES):
+        _, cursor = pagination.search_page("opening", top_k=3)
+
+        with pytest.raises(ValueError):
+            pagination.search_page("closing", top_k=3, cursor=cursor)
+
+    with pytest.raises(ValueError):
+        pagination.decode_cursor("!!garbage!!")
@@ -0,0 +1,153 @@
+"""Tests for opt-in per-request timing and profiling."""
+
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+from fastapi.testclient import TestClient
+
+from app.config import config
+from app.main import app
+
+client = TestClient(app)
+DEBUG_HEADERS = {"X-API-Key": config.api_key, "X-Debug-Token": "debug-secret"}
+
+
+def _backend():
+    backend = Mock()
+    backend.amatch_chunks = AsyncMock(return_value=[
+        {"chunk_id": "c1", "document_title": "Store Ops", "content": "Opening checklist", "hybrid_score": 0.02}
+    ])
+    return backend
+
+
+def test_stage_timings_only_collected_when_enabled():
+    """stage_timer should feed the breakdown inside collect_timings only."""
+    from app.services.metrics import stage_timer
+    from app.services.profiling import collect_timings, server_timing
+
+    with stage_timer("rpc"):
+        pass
+
+    with collect_timings() as timings:
+        with stage_timer("rpc"):
+            pass
+        with stage_timer("rpc"):
+            pass
+
+    assert list(timings) == ["rpc"]
+    assert server_timing({"rpc": 0.0125, "format": 0.0004}) == "rpc;dur=12.50, format;dur=0.40"
+
+
+def test_debug_mode_requires_debug_token():
+    """Debug flags without a valid token should be refused."""
+    with patch.object(config, "debug_token", "debug-secret"):
+        response = client.post(
+            "/api/search?debug=timing",
+            json={"query": "checklist"},
+            headers={"X-API-Key": config.api_key, "X-Debug-Token": "wrong"}
+        )
+        unknown = client.post("/api/search", json={"query": "checklist"}, headers={**DEBUG_HEADERS, "X-Debug": "trace"})
+
+    assert response.status_code == 403
+    assert unknown.status_code == 400
+
+
+def test_debug_timing_returns_server_timing_and_breakdown():
+    """A debug request should expose each search stage's duration."""
+    with patch.object(config, "debug_token", "debug-secret"), \
+         patch.object(config, "semantic_cache_enabled", False), \
+         patch("app.services.search.get_storage_backend", return_value=_backend()):
+        response = client.post("/api/search", json={"query": "checklist"}, headers={**DEBUG_HEADERS, "X-Debug": "timing"})
+
+    assert response.status_code == 200
+    stages = [part.split(";")[0] for part in response.headers["server-timing"].split(", ")]
+    assert stages == ["embedding", "rpc", "format", "serialize", "total"]
+
+    body = response.json()
+    assert body["results"][0]["chunk_id"] == "c1"
+    assert set(body["debug"]["timings_ms"]) == set(stages)
+    assert "profile_id" not in body["debug"]
+
+
+def test_debug_profile_is_saved_for_download(tmp_path):
+    """Profile mode should save a folded profile downloadable by id."""
+    with patch.object(config, "debug_token", "debug-secret"), \
+         patch.object(config, "profile_dir", str(tmp_path)), \
+         patch("app.services.search.get_storage_backend", return_value=_backend()):
+        response = client.post("/api/search", json={"query": "checklist"}, headers={**DEBUG_HEADERS, "X-Debug": "profile"})
+        profile_url = response.json()["debug"]["profile_url"]
+
+        download = client.get(profile_url, headers=DEBUG_HEADERS)
+        missing = client.get("/api/debug/profiles/../../etc/passwd", headers=DEBUG_HEADERS)
+        unauthorized = client.get(profile_url, headers={"X-API-Key": config.api_key})
+
+    assert response.status_code == 200
+    assert download.status_code == 200
+    assert missing.status_code == 404
+    assert unauthorized.status_code == 403
+
+
+def test_debug_profile_is_written_off_the_event_loop(tmp_path):
+    """Saving a profile should not block the event loop with file I/O."""
+    import asyncio
+    import threading
+
+    from app.services.profiling import save_profile
+
+    writers = []
+
+    def recording_save(*args):
+        try:
+            asyncio.get_running_loop()
+            writers.append("event loop")
+        except RuntimeError:
+            writers.append(threading.current_thread().name)
+        return save_profile(*args)
+
+    with patch.object(config, "debug_token", "debug-secret"), \
+         patch.object(config, "profile_dir", str(tmp_path)), \
+         patch("app.api.search.save_profile", side_effect=recording_save), \
+         patch("app.services.search.get_storage_backend", return_value=_backend()):
+        response = client.post("/api/search", json={"query": "checklist"}, headers={**DEBUG_HEADERS, "X-Debug": "profile"})
+
+    assert response.status_code == 200
+    assert len(writers) == 1 and writers[0] != "event loop"
+
+
+def test_sampling_profiler_captures_busy_frames():
+    """The profiler should aggregate samples of the target thread's stack."""
+    from app.services.profiling import SamplingProfiler
+
+    def busy_loop():
+        deadline = time.perf_counter() + 0.05
+        while time.perf_counter() < deadline:
+            pass
+
+    profiler = SamplingProfiler(interval=0.001)
+    profiler.start()
+    busy_loop()
+    profiler.stop()
+
+    assert "busy_loop" in profiler.folded()
+
+
+def test_sampling_profiler_follows_work_in_other_threads():
+    """With all_threads, work handed to a pool thread should be sampled too."""
+    from concurrent.futures import ThreadPoolExecutor
+    from app.services.profiling import SamplingProfiler
+
+    def blocking_rpc():
+        deadline = time.perf_counter() + 0.05
+        while time.perf_counter() < deadline:
+            pass
+
+    with ThreadPoolExecutor(1, thread_name_prefix="pool-worker") as pool:
+        pool.submit(lambda: None).result()  # Worker now parked, waiting for work
+        profiler = SamplingProfiler(interval=0.001, all_threads=True)
+        profiler.start()
+        pool.submit(blocking_rpc).result()
+        profiler.stop()
+
+    folded = profiler.folded()
+    assert any(line.startswith("pool-worker") and "blocking_rpc" in line for line in folded.splitlines())
+    assert "kb-profiler" not in folded
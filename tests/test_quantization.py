@@ -0,0 +1,53 @@
+"""Tests for compact embedding codes."""
+
+from app.services.quantization import (
+    binary_signature,
+    cosine_similarity,
+    dequantize_int8,
+    hamming_distance,
+    quantize_int8,
+    rescore,
+)
+
+
+def test_int8_roundtrip_is_close():
+    """Dequantized int8 codes should stay within one quantization step."""
+    vector = [0.5, -1.0, 0.25, 0.0, 0.99]
+    codes, scale = quantize_int8(vector)
+
+    assert len(codes) == len(vector)
+    restored = dequantize_int8(codes, scale)
+    for original, approx in zip(vector, restored):
+        assert abs(original - approx) <= scale
+
+
+def test_binary_signature_matches_sign_bits():
+    """Bit i should be set when dimension i is positive."""
+    assert binary_signature([1.0, -1.0, 0.0, 2.0]) == 0b1001
+    assert hamming_distance(0b1001, 0b0011) == 2
+
+
+def test_rescore_orders_by_exact_similarity():
+    """Rescoring should rank candidates by full-precision cosine."""
+    query = [1.0, 0.0]
+    candidates = [("far", [0.0, 1.0]), ("near", [1.0, 0.1]), ("mid", [1.0, 1.0])]
+
+    result = rescore(query, candidates, top_k=2)
+
+    assert [item_id for item_id, _ in result] == ["near", "mid"]
+    assert cosine_similarity([0.0, 0.0], [1.0, 0.0]) == 0.0
+
+
+def test_report_int8_is_recall_only_and_live_refuses_placeholder_embeddings():
+    """int8 has no latency column offline; --live needs real query embeddings."""
+    import pytest
+    from benchmarks.quantization_report import run_live, run_offline
+
+    rows = {row["method"]: row for row in run_offline(corpus_size=60, num_queries=2, top_k=3, multiplier=4, seed=1)}
+
+    assert rows["int8+rescore"]["p50_ms"] is None
+    assert rows["int8+rescore"]["recall_at_k"] > 0.5
+    assert rows["binary+rescore"]["p50_ms"] is not None
+
+    with pytest.raises(ValueError, match="zero vectors"):
+        run_live(["payroll"], top_k=3, multiplier=4)
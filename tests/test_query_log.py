@@ -0,0 +1,89 @@
+"""Tests for write-behind query logging."""
+
+import asyncio
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.services.query_log import QueryLogger
+
+
+def make_logger(**kwargs):
+    batches = []
+
+    async def writer(rows):
+        batches.append(rows)
+
+    return QueryLogger(writer, **kwargs), batches
+
+
+async def test_flush_writes_in_batches():
+    """Buffered rows should be inserted in batch_size chunks."""
+    logger, batches = make_logger(batch_size=2)
+    for i in range(5):
+        logger.record(f"query {i}", results_count=i, response_time_ms=10)
+
+    written = await logger.flush()
+
+    assert written == 5
+    assert [len(b) for b in batches] == [2, 2, 1]
+    assert batches[0][0] == {
+        "query": "query 0",
+        "user_id": None,
+        "results_count": 0,
+        "response_time_ms": 10,
+        "search_type": "hybrid"
+    }
+
+
+async def test_full_buffer_drops_and_counts():
+    """Overflowing the buffer should drop entries instead of blocking."""
+    logger, _ = make_logger(capacity=3)
+    for i in range(5):
+        logger.record(f"query {i}", results_count=0, response_time_ms=1)
+
+    assert len(logger) == 3
+    assert logger.dropped == 2
+
+
+async def test_background_task_flushes_on_size_and_drains_on_stop():
+    """Reaching batch_size should wake the flusher; stop() drains the rest."""
+    logger, batches = make_logger(batch_size=2, flush_interval=60)
+    await logger.start()
+
+    logger.record("a", 1, 5)
+    logger.record("b", 1, 5)
+    await asyncio.sleep(0.01)
+    assert len(batches) == 1
+
+    logger.record("c", 1, 5)
+    await logger.stop()
+    assert [row["query"] for batch in batches for row in batch] == ["a", "b", "c"]
+
+
+async def test_failed_writes_are_counted_as_dropped():
+    """A failing insert should not raise into the request path."""
+    async def broken(rows):
+        raise RuntimeError("database unavailable")
+
+    logger = QueryLogger(broken, batch_size=10)
+    logger.record("a", 1, 5)
+
+    assert await logger.flush() == 0
+    assert logger.dropped == 1
+
+
+def test_search_endpoint_records_query():
+    """Each search should be queued for the query log."""
+    from app.config import config
+    from app.main import app
+
+    logger, _ = make_logger()
+    client = TestClient(app)
+
+    with patch("app.api.search.query_logger", logger), \
+         patch("app.api.search.asearch_hybrid", return_value=[]):
+        response = client.post("/api/search", json={"query": "payroll"}, headers={"X-API-Key": config.api_key})
+
+    assert response.status_code == 200
+    assert len(logger) == 1
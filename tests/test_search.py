@@ -0,0 +1,145 @@
+"""Tests for hybrid search service."""
+
+from unittest.mock import Mock, patch
+
+
+def test_build_rpc_call_defaults_to_full_precision():
+    """Without quantization the 008 RPC should be used unchanged."""
+    from app.services.search import build_rpc_call
+
+    with patch("app.services.search.config") as mock_config:
+        mock_config.embedding_quantization = "none"
+
+        name, params = build_rpc_call([0.1] * 768, "payroll", 5, 0.5, 60)
+
+    assert name == "match_chunks_hybrid_rrf"
+    assert "quantization" not in params
+    assert params["match_count"] == 5
+
+
+def test_build_rpc_call_uses_two_stage_rpc_when_quantized():
+    """Quantized mode should call the rescoring RPC with its settings."""
+    from app.services.search import build_rpc_call
+
+    with patch("app.services.search.config") as mock_config:
+        mock_config.embedding_quantization = "binary"
+        mock_config.rescore_multiplier = 8
+
+        name, params = build_rpc_call([0.1] * 768, "payroll", 5, 0.5, 60)
+
+    assert name == "match_chunks_hybrid_rrf_quantized"
+    assert params["quantization"] == "binary"
+    assert params["rescore_multiplier"] == 8
+
+
+def test_quantized_deep_pages_stay_within_the_coarse_candidate_cap(capsys):
+    """pagination_depth x rescore_multiplier must not ask for more than ef_search allows."""
+    from app.services.search import MAX_COARSE_CANDIDATES, build_rpc_call
+
+    with patch("app.services.search.config") as mock_config, \
+         patch("app.services.search._clamped_top_k", set()):
+        mock_config.embedding_quantization = "halfvec"
+        mock_config.rescore_multiplier = 4
+
+        _, params = build_rpc_call([0.1] * 768, "payroll", 200, 0.5, 60)
+        build_rpc_call([0.1] * 768, "payroll", 200, 0.5, 60)
+
+    assert params["rescore_multiplier"] == 2
+    assert 200 * 2 * params["rescore_multiplier"] <= MAX_COARSE_CANDIDATES
+    assert capsys.readouterr().out.count("Warning") == 1
+
+
+def test_unknown_quantization_is_rejected_at_startup(monkeypatch):
+    """A typo like "int8" must fail config loading, not fall through to halfvec."""
+    import pytest
+    from pydantic import ValidationError
+    from app.config import Settings
+
+    monkeypatch.setenv("EMBEDDING_QUANTIZATION", "int8")
+
+    with pytest.raises(ValidationError):
+        Settings()
+
+
+def test_rpc_columns_for_projection():
+    """Projection should select only the mapped RPC columns."""
+    from app.services.search import rpc_columns
+
+    assert rpc_columns(None) is None
+    assert rpc_columns(["title", "score"]) == ["chunk_id", "document_id", "document_title", "hybrid_score"]
+    assert rpc_columns(["title"], snippet=True) == ["chunk_id", "content", "document_id", "document_title"]
+
+
+def test_search_hybrid_projects_fields_and_adds_snippets():
+    """Projected search should narrow the RPC select and the result keys."""
+    from app.services import search
+
+    backend = Mock()
+    backend.match_chunks.return_value = [
+        {"chunk_id": "c1", "document_id": "d1", "document_title": "Store Ops", "content": "Opening checklist for stores"}
+    ]
+
+    with patch.object(search.config, "semantic_cache_enabled", False), \
+         patch.object(search, "get_storage_backend", return_value=backend):
+
+        results = search.search_hybrid("checklist", fields=["title"], snippet_chars=100)
+
+    rpc_name, _, columns = backend.match_chunks.call_args.args
+    assert columns == ["chunk_id", "content", "document_id", "document_title"]
+    assert results == [{
+        "chunk_id": "c1",
+        "document_id": "d1",
+        "title": "Store Ops",
+        "snippet": {"text": "Opening checklist for stores", "offset": 0, "highlights": [[8, 17]]}
+    }]
+
+
+def test_supabase_backend_selects_projected_columns():
+    """The PostgREST backend should push the projection into the RPC select."""
+    from app.services.storage import SupabaseBackend
+
+    mock_supabase = Mock()
+    rpc = mock_supabase.rpc.return_value
+    rpc.select.return_value.execute.return_value.data = [{"chunk_id": "c1"}]
+
+    with patch("app.services.storage.get_supabase_client", return_value=mock_supabase):
+        rows = SupabaseBackend().match_chunks("match_chunks_hybrid_rrf", {}, ["chunk_id"])
+
+    rpc.select.assert_called_once_with("chunk_id")
+    assert rows == [{"chunk_id": "c1"}]
+
+
+async def test_asearch_hybrid_uses_async_backend_path():
+    """The API path should await the backend instead of blocking."""
+    from unittest.mock import AsyncMock
+    from app.services import search
+
+    backend = Mock()
+    backend.amatch_chunks = AsyncMock(return_value=[{"chunk_id": "c1", "hybrid_score": 0.02}])
+
+    with patch.object(search, "get_storage_backend", return_value=backend):
+        results = await search.asearch_hybrid("payroll")
+
+    assert results[0]["chunk_id"] == "c1"
+    assert results[0]["score"] == 0.02
+    backend.amatch_chunks.assert_awaited_once()
+
+
+def test_format_results_coalesces_null_rpc_columns():
+    """NULL title/content/source/scores must not reach clients as null."""
+    from app.models.schemas import SearchResult
+    from app.services.search import format_results
+    from app.services.serialization import result_payload
+
+    row = {
+        "chunk_id": "c1", "document_id": "d1", "document_title": None, "section_title": None,
+        "content": None, "source_path": None, "image_type": None,
+        "semantic_score": None, "bm25_score": None, "hybrid_score": None, "document_date": None
+    }
+
+    payload = result_payload(format_results([row])[0])
+
+    assert payload["title"] == "Unknown"
+    assert payload["content"] == "" and payload["source"] == ""
+    assert payload["score"] == 0.0
+    SearchResult.model_validate(payload)
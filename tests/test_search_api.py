@@ -0,0 +1,160 @@
+"""Tests for the search API router."""
+
+import json
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.config import config
+from app.main import app
+
+client = TestClient(app)
+HEADERS = {"X-API-Key": config.api_key}
+
+SAMPLE_RESULTS = [
+    {
+        "chunk_id": f"c{i}",
+        "title": "Store Ops Manual",
+        "section": None,
+        "content": f"Opening checklist step {i}",
+        "source": "Store_Ops.pptx",
+        "image_type": None,
+        "semantic_score": 0.9 - i / 10,
+        "bm25_score": 0.5,
+        "hybrid_score": 0.03 - i / 1000,
+        "score": 0.03 - i / 1000,
+        "date": None
+    }
+    for i in range(3)
+]
+
+
+def test_search_stream_ndjson_emits_results_then_summary():
+    """NDJSON stream should emit one line per result and a final summary."""
+    with patch("app.api.search.asearch_hybrid", return_value=SAMPLE_RESULTS):
+        response = client.post("/api/search/stream", json={"query": "opening checklist"}, headers=HEADERS)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    frames = [json.loads(line) for line in response.text.splitlines()]
+    assert [f["type"] for f in frames] == ["result", "result", "result", "summary"]
+    assert frames[0]["data"]["chunk_id"] == "c0"
+    assert frames[-1]["data"] == {"query": "opening checklist", "count": 3}
+
+
+def test_search_stream_sse_format():
+    """SSE stream should use named events."""
+    with patch("app.api.search.asearch_hybrid", return_value=SAMPLE_RESULTS[:1]):
+        response = client.post("/api/search/stream?format=sse", json={"query": "opening"}, headers=HEADERS)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [block for block in response.text.split("\n\n") if block]
+    assert events[0].startswith("event: result\ndata: ")
+    assert events[-1].startswith("event: summary\ndata: ")
+
+
+def test_search_stream_frames_are_not_iterated_in_the_threadpool():
+    """Frames should be produced on the event loop, not one threadpool hop each."""
+    with patch("app.api.search.asearch_hybrid", return_value=SAMPLE_RESULTS), \
+         patch("starlette.responses.iterate_in_threadpool", side_effect=AssertionError) as hop:
+        response = client.post("/api/search/stream", json={"query": "opening"}, headers=HEADERS)
+
+    assert response.status_code == 200
+    assert len(response.text.splitlines()) == 4
+    assert not hop.called
+
+
+def test_search_stream_requires_auth():
+    """Streaming endpoint should share the router's authentication."""
+    response = client.post("/api/search/stream", json={"query": "opening"})
+    assert response.status_code == 401
+
+
+def test_search_projection_returns_only_requested_fields():
+    """Projected responses should contain only the requested result keys."""
+    projected = [{"chunk_id": "c0", "title": "Store Ops Manual"}]
+
+    with patch("app.api.search.asearch_hybrid", return_value=projected) as mock_search:
+        response = client.post(
+            "/api/search",
+            json={"query": "opening", "fields": ["title"], "snippet": True, "snippet_chars": 120},
+            headers=HEADERS
+        )
+
+    assert response.status_code == 200
+    assert response.json() == {"query": "opening", "results": projected, "count": 1, "next_cursor": None}
+    assert mock_search.call_args.kwargs["fields"] == ["title"]
+    assert mock_search.call_args.kwargs["snippet_chars"] == 120
+
+
+def test_search_projection_is_described_in_openapi():
+    """Projected responses should match a documented schema with optional fields."""
+    from app.models.schemas import ProjectedSearchResponse
+
+    schema = app.openapi()["paths"]["/api/search"]["post"]["responses"]["200"]["content"]["application/json"]["schema"]
+    assert {"$ref": "#/components/schemas/ProjectedSearchResponse"} in schema["anyOf"]
+
+    with patch("app.api.search.asearch_hybrid", return_value=[{"chunk_id": "c0", "document_id": "d0", "title": "Ops"}]):
+        response = client.post("/api/search", json={"query": "opening", "fields": ["title"]}, headers=HEADERS)
+
+    ProjectedSearchResponse.model_validate(response.json())
+
+
+def test_search_projection_emits_scores_as_floats():
+    """Integer scores from the RPC should be floats in projected results too."""
+    projected = [{"chunk_id": "c0", "document_id": "d0", "bm25_score": 0}]
+
+    with patch("app.api.search.asearch_hybrid", return_value=projected):
+        response = client.post("/api/search", json={"query": "opening", "fields": ["bm25_score"]}, headers=HEADERS)
+        stream = client.post("/api/search/stream", json={"query": "opening", "fields": ["bm25_score"]}, headers=HEADERS)
+
+    assert '"bm25_score":0.0' in response.text
+    assert list(response.json()["results"][0]) == ["chunk_id", "document_id", "bm25_score"]
+    assert '"bm25_score":0.0' in stream.text.splitlines()[0]
+
+
+def test_search_rejects_unknown_fields():
+    """Unknown projection fields should fail validation."""
+    response = client.post("/api/search", json={"query": "opening", "fields": ["secret"]}, headers=HEADERS)
+    assert response.status_code == 422
+
+
+def test_search_rejects_invalid_cursor():
+    """A malformed cursor should be a client error."""
+    response = client.post("/api/search", json={"query": "opening", "cursor": "not-a-cursor"}, headers=HEADERS)
+    assert response.status_code == 400
+
+
+def test_search_response_matches_schema_models():
+    """The direct orjson path should encode exactly what the models would."""
+    from app.models.schemas import SearchResponse, SearchResult
+
+    results = [dict(r, bm25_score=0, snippet={"text": "Opening", "offset": 0, "highlights": [[0, 7]]}) for r in SAMPLE_RESULTS]
+    expected = SearchResponse(
+        query="opening checklist",
+        results=[SearchResult(**r) for r in results],
+        count=len(results)
+    ).model_dump(mode="json")
+
+    with patch("app.api.search.asearch_hybrid", return_value=results):
+        response = client.post("/api/search", json={"query": "opening checklist"}, headers=HEADERS)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == expected
+    assert list(response.json()["results"][0]) == list(SearchResult.model_fields)
+    assert '"bm25_score":0.0' in response.text
+
+
+def test_paginated_search_errors_are_not_client_errors():
+    """Only cursor problems are 400s; backend failures stay server errors."""
+    failing = patch("app.services.pagination.asearch_hybrid", side_effect=ValueError("Supabase credentials not configured"))
+    with failing:
+        response = TestClient(app, raise_server_exceptions=False).post(
+            "/api/search", json={"query": "opening", "paginate": True}, headers=HEADERS
+        )
+
+    assert response.status_code == 500
+    assert "Supabase" not in response.text
@@ -0,0 +1,173 @@
+"""Tests for the pre-fork launcher and the cross-worker cache."""
+
+import multiprocessing
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.services.shared_cache import SharedCache
+
+
+def _child_roundtrip(path, queue):
+    cache = SharedCache(path, namespace="query_embedding", maxsize=10, ttl=60)
+    queue.put(cache.get("payroll"))
+    cache.set("schedule", [0.5, 0.25])
+
+
+def test_shared_cache_is_visible_across_processes(tmp_path):
+    """A value set by one process should be read by another, both ways."""
+    path = str(tmp_path / "cache.sqlite")
+    cache = SharedCache(path, namespace="query_embedding", maxsize=10, ttl=60)
+    cache.set("payroll", [0.1, 0.2])
+
+    ctx = multiprocessing.get_context("fork")
+    queue = ctx.Queue()
+    child = ctx.Process(target=_child_roundtrip, args=(path, queue))
+    child.start()
+    child.join(10)
+
+    assert queue.get(timeout=5) == [0.1, 0.2]
+    assert cache.get("schedule") == [0.5, 0.25]
+
+
+def test_shared_cache_expires_and_trims(tmp_path):
+    """Entries should expire after the TTL and the namespace stay bounded."""
+    from app.services import shared_cache
+
+    now = [1000.0]
+    cache = SharedCache(str(tmp_path / "cache.sqlite"), namespace="vision_result", maxsize=3, ttl=10, clock=lambda: now[0])
+    other = SharedCache(str(tmp_path / "cache.sqlite"), namespace="query_embedding", maxsize=3, ttl=10, clock=lambda: now[0])
+    other.set("kept", 1)
+
+    with patch.object(shared_cache, "TRIM_EVERY", 1):
+        for i in range(5):
+            cache.set(f"img{i}", {"type": "chart"}, ttl=10 + i)
+
+    assert len(cache) == 3
+    assert cache.get("img0") is None
+    assert cache.pop("img4") == {"type": "chart"}
+
+    now[0] += 60
+    assert cache.get("img3") is None
+    assert other.get("kept") is None
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_shared_cache_does_not_block_on_a_locked_database(tmp_path):
+    """Writes under another worker's lock are dropped quickly, not waited on."""
+    import sqlite3
+
+    path = str(tmp_path / "cache.sqlite")
+    cache = SharedCache(path, namespace="cursor_result_sets", maxsize=10, ttl=60)
+    cache.set("kept", [1])
+
+    other = sqlite3.connect(path, isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")  # Hold the write lock
+    try:
+        start = time.monotonic()
+        cache.set("dropped", [2])
+        assert cache.pop("kept") is None
+        cache.clear()
+        assert time.monotonic() - start < 1
+        assert cache.get("kept") == [1]  # WAL readers are not blocked
+    finally:
+        other.execute("ROLLBACK")
+        other.close()
+
+    assert cache.get("dropped") is None
+
+
+def test_shared_cache_stays_within_its_byte_budget(tmp_path):
+    """Values beyond max_bytes (all namespaces) are trimmed, closest to expiry first."""
+    now = [0.0]
+    path = str(tmp_path / "cache.sqlite")
+    cursors = SharedCache(path, namespace="cursor_result_sets", maxsize=100, ttl=10, clock=lambda: now[0], max_bytes=40000)
+    vision = SharedCache(path, namespace="vision_result", maxsize=100, ttl=10, clock=lambda: now[0], max_bytes=40000)
+
+    for i in range(10):
+        now[0] = i
+        (cursors if i % 2 else vision).set(f"k{i}", b"x" * 10000)
+
+    assert len(cursors) + len(vision) == 3
+    assert cursors.get("k9") is not None and vision.get("k8") is not None
+    assert cursors.get("k1") is None
+
+
+def test_make_cache_uses_shared_store_when_configured(tmp_path):
+    """SHARED_CACHE_PATH should switch exact-key caches to the shared store."""
+    from app.config import config
+    from app.services.cache import TTLCache, make_cache
+
+    assert isinstance(make_cache("query_embedding", 10, 60), TTLCache)
+    with patch.object(config, "shared_cache_path", str(tmp_path / "cache.sqlite")):
+        assert isinstance(make_cache("query_embedding", 10, 60), SharedCache)
+
+
+def test_prepare_shared_state_for_multiple_workers(tmp_path, monkeypatch):
+    """Several workers get a shared cache file and a clean metrics directory."""
+    from app import server
+    from app.config import config
+
+    (tmp_path / "counter_123.db").write_bytes(b"stale")
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+
+    with patch.object(config, "shared_cache_path", None), \
+         patch.object(server, "SHM_DIR", str(tmp_path)):
+        server.prepare_shared_state(1)
+        assert config.shared_cache_path is None
+
+        server.prepare_shared_state(4)
+        assert config.shared_cache_path == str(tmp_path / f"kb-cache-{config.port}.sqlite")
+
+    assert not (tmp_path / "counter_123.db").exists()
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.mark.slow
+def test_launcher_serves_with_forked_workers(tmp_path):
+    """python -m app.server should serve /health from forked workers and stop on SIGTERM."""
+    port = _free_port()
+    env = {
+        **os.environ,
+        "WORKERS": "2",
+        "HOST": "127.0.0.1",
+        "PORT": str(port),
+        "WARMUP_ENABLED": "false",
+        "WARM_STORAGE": "false",
+        "SHARED_CACHE_PATH": str(tmp_path / "cache.sqlite"),
+        "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)
+    }
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "app.server"],
+        cwd=Path(__file__).resolve().parent.parent,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    try:
+        deadline = time.monotonic() + 20
+        while True:
+            try:
+                response = httpx.get(f"http://127.0.0.1:{port}/health", timeout=1)
+                break
+            except httpx.TransportError:
+                assert time.monotonic() < deadline, "launcher did not start serving"
+                time.sleep(0.2)
+
+        assert response.status_code == 200
+        assert httpx.get(f"http://127.0.0.1:{port}/metrics", timeout=2).status_code == 200
+    finally:
+        proc.terminate()
+        assert proc.wait(timeout=20) == 0
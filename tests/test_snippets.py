@@ -0,0 +1,28 @@
+"""Tests for snippet extraction."""
+
+from app.services.snippets import extract_snippet, query_terms
+
+
+def test_query_terms_are_normalized():
+    """Terms should be lowercased, de-duplicated and skip 1-letter words."""
+    assert query_terms("Store opening a STORE checklist") == ["store", "opening", "checklist"]
+
+
+def test_snippet_is_centred_on_query_terms():
+    """Long content should be cut around the matching terms."""
+    content = ("filler " * 100) + "the store opening checklist covers keys and alarms " + ("filler " * 100)
+
+    snippet = extract_snippet(content, "opening checklist", max_chars=80)
+
+    assert len(snippet["text"]) <= 80
+    assert "opening checklist" in snippet["text"]
+    assert content[snippet["offset"]:].startswith(snippet["text"])
+    spans = [snippet["text"][s:e].lower() for s, e in snippet["highlights"]]
+    assert spans == ["opening", "checklist"]
+
+
+def test_snippet_short_content_is_returned_whole():
+    """Content within the limit should be returned as-is."""
+    snippet = extract_snippet("Opening checklist", "checklist", max_chars=200)
+
+    assert snippet == {"text": "Opening checklist", "offset": 0, "highlights": [[8, 17]]}
@@ -0,0 +1,41 @@
+"""Import-time budget for the API process."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+# SDKs only needed on first use (vision, ingestion, storage clients)
+LAZY_MODULES = ("google.genai", "supabase", "httpx", "pptx", "docx", "pypdf", "psycopg", "pgvector", "PIL")
+
+# Generous ceiling for slow CI runners; locally app.main imports in ~0.5s
+IMPORT_BUDGET_SECONDS = 3.0
+
+
+def _import_app() -> dict:
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        "import app.main\n"
+        "print(json.dumps({'seconds': time.perf_counter() - start, 'modules': sorted(sys.modules)}))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_api_import_skips_heavy_sdks():
+    """Importing the app should not pull in SDKs that are used lazily."""
+    loaded = set(_import_app()["modules"])
+
+    assert [m for m in LAZY_MODULES if m in loaded] == []
+
+
+def test_api_import_within_budget():
+    """A cold import of the app should stay within the startup budget."""
+    assert _import_app()["seconds"] < IMPORT_BUDGET_SECONDS
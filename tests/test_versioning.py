@@ -0,0 +1,22 @@
+"""Tests for document versioning."""
+
+from unittest.mock import Mock, patch
+
+
+def test_create_version_goes_through_the_storage_backend():
+    """New versions should be written with the configured backend, not PostgREST directly."""
+    from app.services.versioning import create_version
+
+    backend = Mock()
+    backend.select_rows.return_value = [{
+        "title": "Store Ops", "source_type": "pptx", "source_path": "Store_Ops.pptx", "file_id": "f1", "version": 2
+    }]
+    backend.insert_row.return_value = {"id": "d2"}
+
+    with patch("app.services.versioning.get_storage_backend", return_value=backend):
+        assert create_version("d1", "new content") == "d2"
+
+    backend.update_rows.assert_called_once_with("kb_documents", {"is_latest": False}, {"id": "d1"})
+    table, row = backend.insert_row.call_args.args
+    assert table == "kb_documents"
+    assert row["version"] == 3 and row["previous_version_id"] == "d1" and row["status"] == "processing"
@@ -3,6 +3,15 @@
 import pytest
 from unittest.mock import Mock, patch
 
+from app.services.cache import TTLCache
+
+
+@pytest.fixture(autouse=True)
+def fresh_vision_cache():
+    """Each test sees an empty vision result cache."""
+    with patch("app.services.vision.vision_cache", TTLCache(16, 60)):
+        yield
+
 
 def test_classify_image_returns_type():
     """Should classify image as chart|table|diagram|photo."""
@@ -84,3 +93,33 @@ def test_process_image_skips_low_quality():
         assert result["quality_score"] == 0.1
         assert result["extracted_text"] == ""
         assert result["should_index"] is False
+
+
+def test_gemini_client_created_once_on_first_use():
+    """The Gemini client should be built lazily and then reused."""
+    from app.services import vision
+
+    with patch.object(vision, "client", None), \
+         patch("google.genai.Client") as mock_client_cls:
+        first = vision.get_client()
+        second = vision.get_client()
+
+    assert first is second
+    mock_client_cls.assert_called_once()
+
+
+def test_process_image_reuses_cached_result():
+    """The same image bytes should only be sent to Gemini once."""
+    from app.services.vision import process_image
+
+    mock_response = Mock()
+    mock_response.text = "photo"
+
+    with patch("app.services.vision.client") as mock_client:
+        mock_client.models.generate_content.return_value = mock_response
+
+        first = process_image(b"same_bytes")
+        second = process_image(b"same_bytes")
+
+    assert first == second
+    assert mock_client.models.generate_content.call_count == 1
@@ -0,0 +1,105 @@
+"""Tests for startup cache warm-up."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+from fastapi.testclient import TestClient
+
+from app.services.warmup import CacheWarmer
+
+
+async def test_warms_top_queries_with_bounded_concurrency():
+    """Every fetched query should run, never more than `concurrency` at once."""
+    active, peak, seen = 0, 0, []
+
+    async def fetch(limit, days):
+        assert (limit, days) == (10, 7)
+        return [f"query {i}" for i in range(6)]
+
+    async def run(query):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        seen.append(query)
+        active -= 1
+
+    warmer = CacheWarmer(fetch, run)
+    status = await warmer.warm(limit=10, days=7, concurrency=2, timeout=5)
+
+    assert status == "ready"
+    assert sorted(seen) == [f"query {i}" for i in range(6)]
+    assert peak == 2
+    assert warmer.report()["warmed"] == 6
+
+
+async def test_timeout_and_failures_still_report_ready():
+    """A slow or failing warm-up must not hold readiness back forever."""
+    async def fetch(limit, days):
+        return ["slow"]
+
+    async def run(query):
+        await asyncio.sleep(1)
+
+    async def broken_fetch(limit, days):
+        raise RuntimeError("kb_top_queries missing")
+
+    slow = CacheWarmer(fetch, run)
+    broken = CacheWarmer(broken_fetch, run)
+
+    assert await slow.warm(timeout=0.01) == "timed_out"
+    assert await broken.warm() == "failed"
+    assert slow.ready and broken.ready
+
+
+async def test_fetch_top_queries_reads_rpc_rows():
+    """Top queries come from the kb_top_queries RPC."""
+    from app.services import warmup
+
+    backend = Mock()
+    backend.acall_rpc = AsyncMock(return_value=[{"query": "payroll", "hits": 12}, {"query": None, "hits": 3}])
+
+    with patch.object(warmup, "get_storage_backend", return_value=backend):
+        queries = await warmup.fetch_top_queries(50, 7)
+
+    assert queries == ["payroll"]
+    backend.acall_rpc.assert_awaited_once_with("kb_top_queries", {"since_days": 7, "query_limit": 50})
+
+
+async def test_warm_query_primes_caches_for_default_requests():
+    """After warm-up, a default API search for the query should skip the RPC."""
+    from app.services import search, warmup
+    from app.services.cache import SemanticCache, TTLCache
+
+    backend = Mock()
+    backend.amatch_chunks = AsyncMock(return_value=[{"chunk_id": "c1", "hybrid_score": 0.02}])
+    generate = Mock(return_value=[0.3] * 768)
+
+    with patch.object(search, "query_cache", SemanticCache(maxsize=8, ttl=60, threshold=0.95)), \
+         patch.object(search, "embedding_cache", TTLCache(maxsize=8, ttl=60)), \
+         patch.object(search, "generate_embedding", generate), \
+         patch.object(search, "get_storage_backend", return_value=backend):
+        await warmup.warm_query("payroll schedule")
+        results = await search.asearch_hybrid("payroll schedule", top_k=5, threshold=0.5)
+
+    assert results[0]["chunk_id"] == "c1"
+    backend.amatch_chunks.assert_awaited_once()
+    generate.assert_called_once()
+
+
+def test_health_reports_warming_until_ready():
+    """/health should be 503 while warming and 200 once warm-up is over."""
+    from app.main import app
+    from app.services.warmup import cache_warmer
+
+    client = TestClient(app)
+
+    with patch.object(cache_warmer, "status", "warming"):
+        warming = client.get("/health")
+    with patch.object(cache_warmer, "status", "timed_out"):
+        ready = client.get("/health")
+
+    assert warming.status_code == 503
+    assert warming.json()["status"] == "warming"
+    assert ready.status_code == 200
+    assert ready.json()["warmup"]["status"] == "timed_out"